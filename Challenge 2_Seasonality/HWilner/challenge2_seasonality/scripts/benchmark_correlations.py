@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Benchmark Correlations
+
+Compares the vectorized correlation engines in calculate_correlations
+with one scipy.stats.pearsonr call per pair, on synthetic daily series,
+and checks that both give the same coefficients and p-values:
+- lags: calculate_lag_correlation vs pearsonr per (question, weather, lag)
+- matrix: correlation_table vs dropna + pearsonr per (topic, weather) pair
+
+Usage:
+    python3 benchmark_correlations.py --days 2922 --question-vars 20 --max-lags 28 365
+    python3 benchmark_correlations.py --topic-vars 300 --weather-vars 30
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from calculate_correlations import calculate_lag_correlation, correlation_table
+
+WEATHER_VARS = ['T2M', 'PRECTOTCORR', 'RH2M']
+
+def make_daily_series(n_days, n_question_vars, seed=1):
+    """
+    Generate daily question counts that respond to lagged synthetic weather
+
+    Args:
+        n_days (int): Number of days
+        n_question_vars (int): question_count plus topic count columns
+        seed (int): Random seed
+
+    Returns:
+        tuple: (questions_df, weather_df) with a shared daily index
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2015-01-01', periods=n_days, freq='D')
+    season = np.sin(2 * np.pi * np.arange(n_days) / 365.25)
+    weather_df = pd.DataFrame({
+        'T2M': 20 + 3 * season + rng.normal(0, 1, n_days),
+        'PRECTOTCORR': rng.gamma(0.5, 4, n_days) * (1 + season),
+        'RH2M': 70 + 10 * season + rng.normal(0, 5, n_days)
+    }, index=dates)
+
+    rain = weather_df['PRECTOTCORR'].to_numpy()
+    questions = {}
+    for i in range(n_question_vars):
+        lag = rng.integers(0, 60)
+        lagged_rain = np.roll(rain, lag)
+        name = 'question_count' if i == 0 else f'topic_{i:03d}_count'
+        questions[name] = rng.poisson(5 + 0.5 * lagged_rain + 2 * season + 2)
+    return pd.DataFrame(questions, index=dates), weather_df
+
+def lag_correlation_reference(questions_df, weather_df, max_lag):
+    """
+    Reference lag correlations with one pearsonr call per pair and lag
+
+    Args:
+        questions_df (pandas.DataFrame): Daily question counts
+        weather_df (pandas.DataFrame): Daily weather on the same index
+        max_lag (int): Largest lag in days
+
+    Returns:
+        dict: (question var, weather var) -> (correlations, p-values) arrays
+    """
+    results = {}
+    for q_var in questions_df.columns:
+        q_data = questions_df[q_var].fillna(0).values
+        for w_var in WEATHER_VARS:
+            w_data = weather_df[w_var].ffill().values
+            correlations, p_values = [], []
+            for lag in range(max_lag + 1):
+                corr, p_val = stats.pearsonr(q_data[lag:], w_data[:len(w_data) - lag])
+                correlations.append(corr)
+                p_values.append(p_val)
+            results[q_var, w_var] = np.array(correlations), np.array(p_values)
+    return results
+
+def make_merged_frame(n_days, n_topic_vars, n_weather_vars, seed=1):
+    """
+    Generate a wide merged frame with scattered missing values
+
+    Args:
+        n_days (int): Number of rows
+        n_topic_vars (int): Topic count columns
+        n_weather_vars (int): Weather columns
+        seed (int): Random seed
+
+    Returns:
+        tuple: (frame, topic column names, weather column names)
+    """
+    rng = np.random.default_rng(seed)
+    weather = rng.normal(0, 1, (n_days, n_weather_vars))
+    mixing = rng.normal(0, 0.3, (n_weather_vars, n_topic_vars))
+    topics = rng.poisson(np.exp(1 + np.clip(weather @ mixing, -2, 2))).astype(float)
+    weather[rng.random(weather.shape) < 0.02] = np.nan
+    topics[rng.random(topics.shape) < 0.01] = np.nan
+
+    topic_vars = [f'topic_{i:03d}_count' for i in range(n_topic_vars)]
+    weather_vars = [f'W{i:02d}' for i in range(n_weather_vars)]
+    frame = pd.DataFrame(np.hstack([topics, weather]), columns=topic_vars + weather_vars)
+    return frame, topic_vars, weather_vars
+
+def correlation_table_reference(df, question_vars, weather_vars):
+    """
+    Reference correlation table with dropna and pearsonr per pair
+
+    Args:
+        df (pandas.DataFrame): Merged question and weather data
+        question_vars (list): Question columns
+        weather_vars (list): Weather columns
+
+    Returns:
+        dict: (question var, weather var) -> (correlation, p-value, n)
+    """
+    results = {}
+    for q_var in question_vars:
+        for w_var in weather_vars:
+            valid_data = df[[q_var, w_var]].dropna()
+            corr, p_value = stats.pearsonr(valid_data[q_var], valid_data[w_var])
+            results[q_var, w_var] = corr, p_value, len(valid_data)
+    return results
+
+def timed(func, *args):
+    """Run func(*args) once and return (result, seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=2922,
+                        help='Days in the synthetic series')
+    parser.add_argument('--question-vars', type=int, default=20,
+                        help='Question variables (question_count plus topics)')
+    parser.add_argument('--max-lags', type=int, nargs='+', default=[28, 365],
+                        help='Largest lags to benchmark')
+    parser.add_argument('--topic-vars', type=int, default=300,
+                        help='Topic columns in the correlation matrix benchmark')
+    parser.add_argument('--weather-vars', type=int, default=30,
+                        help='Weather columns in the correlation matrix benchmark')
+    args = parser.parse_args()
+
+    questions_df, weather_df = make_daily_series(args.days, args.question_vars)
+    print("="*60)
+    print(f"Lag correlations on {args.days:,} days, {args.question_vars} question x "
+          f"{len(WEATHER_VARS)} weather variables")
+    print("="*60)
+
+    for max_lag in args.max_lags:
+        fast, fast_secs = timed(calculate_lag_correlation, questions_df, weather_df, max_lag)
+        slow, slow_secs = timed(lag_correlation_reference, questions_df, weather_df, max_lag)
+
+        for (q_var, w_var), (correlations, p_values) in slow.items():
+            result = fast[q_var][w_var]
+            if not (np.allclose(result['correlations'], correlations, rtol=0, atol=1e-9)
+                    and np.allclose(result['p_values'], p_values, rtol=1e-6, atol=1e-12)):
+                raise AssertionError(f"{q_var} vs {w_var}: vectorized lags differ from pearsonr")
+
+        n_calls = len(slow) * (max_lag + 1)
+        print(f"  max lag {max_lag} ({n_calls:,} correlations):")
+        print(f"    vectorized:          {fast_secs:8.3f}s")
+        print(f"    pearsonr per lag:    {slow_secs:8.3f}s")
+        print(f"    speedup: {slow_secs / fast_secs:,.1f}x, correlations and p-values identical")
+
+    merged, topic_vars, weather_vars = make_merged_frame(args.days, args.topic_vars,
+                                                         args.weather_vars)
+    print("="*60)
+    print(f"Correlation matrix on {args.days:,} days, {args.topic_vars} topic x "
+          f"{args.weather_vars} weather variables (with missing values)")
+    print("="*60)
+
+    fast, fast_secs = timed(correlation_table, merged, topic_vars, weather_vars)
+    slow, slow_secs = timed(correlation_table_reference, merged, topic_vars, weather_vars)
+    for (q_var, w_var), (corr, p_value, n) in slow.items():
+        result = fast[q_var][w_var]
+        if not (result['n'] == n and np.isclose(result['correlation'], corr, rtol=0, atol=1e-9)
+                and np.isclose(result['p_value'], p_value, rtol=1e-6, atol=1e-12)):
+            raise AssertionError(f"{q_var} vs {w_var}: matrix result differs from pearsonr")
+
+    print(f"  matrix:                {fast_secs * 1000:8.1f}ms")
+    print(f"  dropna + pearsonr:     {slow_secs * 1000:8.1f}ms  ({len(slow):,} pairs)")
+    print(f"  speedup: {slow_secs / fast_secs:,.1f}x, correlations, p-values and counts identical")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark Topic Matching
+
+Compares the single-pass topic matchers used by categorize_questions with
+one case-insensitive str.contains regex per topic, on synthetic questions,
+and checks that both flag the same topics:
+- tokens: whole-word/phrase matching vs word-boundary (\\b) regexes
+- substring: the keyword automaton vs the original substring regexes
+
+The regex paths are timed on the first --reference-rows questions and
+extrapolated linearly, since they take minutes on millions of questions.
+
+Usage:
+    python3 benchmark_topic_matching.py --questions 1000000
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from preprocess_questions import MATCH_METHODS, TOPIC_KEYWORDS, match_topics
+
+def make_questions(n_questions, seed=1):
+    """
+    Generate synthetic questions mixing topic keywords with filler words
+
+    Args:
+        n_questions (int): Number of questions
+        seed (int): Random seed
+
+    Returns:
+        pandas.Series: Object-dtype questions (about 1% missing)
+    """
+    rng = np.random.default_rng(seed)
+    filler = ['how', 'can', 'i', 'my', 'the', 'maize', 'beans', 'shamba', 'nini',
+              'gani', 'kwa', 'ni', 'omusiri', 'help', 'please', 'farm', 'cow',
+              'goat', 'chicken', 'tomato', 'ng’ombe', 'café', 'plants', 'want',
+              'phone', 'elephant', 'pests', 'sellers', 'antelope', 'price€',
+              'maize🌽', '«soko»', 'mvua—leo', 'Ωmega', 'kilo²', "plant's",
+              'pest’s', "farmer's", "y'obudde", 'embeera y’obudde', 'embeera y obudde',
+              "pests'", "o'clock"]
+    keywords = [keyword for words in TOPIC_KEYWORDS.values() for keyword in words]
+    vocab = np.array(filler * 6 + keywords + [keyword.upper() for keyword in keywords[:20]])
+
+    lengths = rng.integers(3, 20, size=n_questions)
+    words = vocab[rng.integers(0, len(vocab), size=lengths.sum())]
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    questions = pd.Series([' '.join(words[lo:hi]).capitalize() + '?'
+                           for lo, hi in zip(bounds[:-1], bounds[1:])], dtype=object)
+    questions[rng.random(n_questions) < 0.01] = None
+    return questions
+
+def match_topics_regex(texts, topic_keywords=TOPIC_KEYWORDS, method='substring'):
+    """
+    Reference matching with one regex scan per topic
+    
+    Args:
+        texts (pandas.Series): Question texts
+        topic_keywords (dict): Topic name -> list of keywords
+        method (str): 'substring' is the original categorize_questions
+            pattern; 'tokens' anchors keywords at word boundaries (single
+            words also match their -s/-es plural, and ' also matches ’)
+    
+    Returns:
+        pandas.DataFrame: Boolean topic_<name> column per topic
+    """
+    patterns = {}
+    for topic, keywords in topic_keywords.items():
+        if method == 'substring':
+            patterns[topic] = '|'.join(keywords)
+        else:
+            patterns[topic] = r'\b(?:' + '|'.join(
+                re.escape(keyword).replace("'", "['’]")
+                + ('' if ' ' in keyword else '(?:e?s)?')
+                for keyword in keywords) + r')\b'
+    return pd.DataFrame({f'topic_{topic}': texts.str.contains(pattern, case=False,
+                                                              na=False, regex=True)
+                         for topic, pattern in patterns.items()})
+
+def timed(func, *args):
+    """Run func(*args) once and return (result, seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--questions', type=int, default=1_000_000,
+                        help='Number of synthetic questions')
+    parser.add_argument('--reference-rows', type=int, default=200_000,
+                        help='Questions used for the regex reference run')
+    args = parser.parse_args()
+
+    print("="*60)
+    print(f"Topic matching on {args.questions:,} questions, "
+          f"{len(TOPIC_KEYWORDS)} topics")
+    print("="*60)
+
+    questions = make_questions(args.questions)
+    reference_rows = min(args.reference_rows, args.questions)
+    sample = questions.iloc[:reference_rows]
+    
+    flags = {}
+    for method in MATCH_METHODS:
+        fast, fast_secs = timed(match_topics, questions, TOPIC_KEYWORDS, method)
+        slow, slow_secs = timed(match_topics_regex, sample, TOPIC_KEYWORDS, method)
+        if not fast.iloc[:reference_rows].equals(slow.astype(bool)):
+            raise AssertionError(f"{method}: single-pass topics differ from the regexes")
+        flags[method] = fast
+        
+        slow_secs_full = slow_secs * args.questions / reference_rows
+        print(f"  {method}:")
+        print(f"    single pass:        {fast_secs:8.2f}s  "
+              f"({args.questions / fast_secs:,.0f} questions/s)")
+        print(f"    regex (1 per topic): {slow_secs_full:7.2f}s  (extrapolated from "
+              f"{reference_rows:,}, {reference_rows / slow_secs:,.0f} questions/s)")
+        print(f"    speedup: {slow_secs_full / fast_secs:,.1f}x, topics identical")
+    
+    changed = (flags['tokens'] != flags['substring']).any(axis=1).mean() * 100
+    print(f"  questions whose topics differ between tokens and substring: {changed:.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,21 @@ from scipy import stats
 from scipy.signal import correlate
 import json
 
+from weather_store import open_store
+
+# Weather events: days where `variable` (optionally a trailing rolling
+# sum/mean over `window` days) compares to `threshold`, for at least
+# `min_run` consecutive days
+EVENT_DEFINITIONS = {
+    'heavy_rain': {'variable': 'PRECTOTCORR', 'comparator': '>', 'threshold': 50},
+    'drought': {'variable': 'PRECTOTCORR', 'comparator': '<', 'threshold': 10,
+                'window': 30, 'rolling': 'sum'},
+    'heat_wave': {'variable': 'T2M_MAX', 'comparator': '>', 'threshold': 35, 'min_run': 3},
+    'cold_spell': {'variable': 'T2M_MIN', 'comparator': '<', 'threshold': 10, 'min_run': 3}
+}
+
+COMPARATORS = {'>': np.greater, '>=': np.greater_equal, '<': np.less, '<=': np.less_equal}
+
 def load_data(processed_dir):
     """Load processed question and weather data"""
     print("Loading processed data...")
@@ -33,28 +48,57 @@ def load_data(processed_dir):
     questions_df = pd.read_csv(questions_file, index_col=0, parse_dates=True)
     print(f"Loaded {len(questions_df)} days of question data")
     
-    # Load weather data (combine all countries)
+    # Load weather data (combine all countries) from the memory-mapped store
     raw_dir = processed_dir.parent / "raw"
-    weather_files = list(raw_dir.glob("weather_*.csv"))
+    store = open_store(raw_dir)
     
-    if not weather_files:
-        print(f"Error: No weather files found in {raw_dir}")
+    if store is None or not store.locations_of_kind('country'):
+        print(f"Error: No weather data found in {raw_dir}")
         print("Please run download_weather_data.py first")
         return None, None
     
     weather_dfs = []
-    for file in weather_files:
-        if 'metadata' not in file.name:
-            country = file.stem.replace('weather_', '')
-            df = pd.read_csv(file, index_col=0, parse_dates=True)
-            df['country'] = country
-            weather_dfs.append(df)
-            print(f"Loaded weather data for {country}: {len(df)} days")
+    for country in store.locations_of_kind('country'):
+        df = store.frame(country)
+        df['country'] = country
+        weather_dfs.append(df)
+        print(f"Loaded weather data for {country}: {len(df)} days")
     
     weather_df = pd.concat(weather_dfs)
     
     return questions_df, weather_df
 
+def correlation_table(df, question_vars, weather_vars, min_n=1):
+    """
+    Pearson correlation of every question variable with every weather variable
+    
+    Args:
+        df (pandas.DataFrame): Merged question and weather data
+        question_vars (list): Question columns (missing ones are skipped)
+        weather_vars (list): Weather columns (missing ones are skipped)
+        min_n (int): Fewest complete rows a pair needs to be reported
+    
+    Returns:
+        dict: q_var -> w_var -> correlation, p_value, significant and n
+    """
+    question_vars = [var for var in dict.fromkeys(question_vars) if var in df.columns]
+    weather_vars = [var for var in weather_vars if var in df.columns]
+    result = pearson_matrix(df[question_vars].to_numpy(dtype=float),
+                            df[weather_vars].to_numpy(dtype=float))
+    
+    correlations = {}
+    for i, q_var in enumerate(question_vars):
+        correlations[q_var] = {}
+        for j, w_var in enumerate(weather_vars):
+            if result['n'][i, j] >= min_n:
+                correlations[q_var][w_var] = {
+                    'correlation': float(result['r'][i, j]),
+                    'p_value': float(result['p_value'][i, j]),
+                    'significant': bool(result['p_value'][i, j] < 0.05),
+                    'n': int(result['n'][i, j])
+                }
+    return correlations
+
 def calculate_pearson_correlation(questions_df, weather_df):
     """Calculate Pearson correlation between weather and questions"""
     print("\nCalculating Pearson correlations...")
@@ -69,28 +113,142 @@ def calculate_pearson_correlation(questions_df, weather_df):
     question_vars = ['question_count'] + [col for col in questions_df.columns 
                                           if col.endswith('_count')]
     
-    # Calculate correlations
-    correlations = {}
-    for q_var in question_vars:
-        correlations[q_var] = {}
-        for w_var in weather_vars:
-            if q_var in merged.columns and w_var in merged.columns:
-                # Remove NaN values
-                valid_data = merged[[q_var, w_var]].dropna()
-                
-                if len(valid_data) > 0:
-                    corr, p_value = stats.pearsonr(valid_data[q_var], valid_data[w_var])
-                    correlations[q_var][w_var] = {
-                        'correlation': corr,
-                        'p_value': p_value,
-                        'significant': p_value < 0.05,
-                        'n': len(valid_data)
-                    }
-    
-    return correlations
+    # All pairs at once; each pair uses the rows where both values are present
+    return correlation_table(merged, question_vars, weather_vars)
+
+def pearson_p_value(r, n):
+    """
+    Two-sided p-values of Pearson correlations (t-test with n - 2 dof)
+    
+    Args:
+        r (numpy.ndarray): Correlation coefficients
+        n (numpy.ndarray): Number of observations behind each coefficient
+    
+    Returns:
+        numpy.ndarray: p-values, same as scipy.stats.pearsonr (1 where
+            n == 2, since two points always fit a line; NaN where r is NaN
+            or n < 2)
+    """
+    r, n = np.broadcast_arrays(np.asarray(r, dtype=float), np.asarray(n, dtype=float))
+    dof = np.where(n > 2, n - 2, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = np.abs(r) * np.sqrt(dof / ((1 - r) * (1 + r)))
+    return np.where((n == 2) & np.isfinite(r), 1.0, 2 * stats.t.sf(t_stat, dof))
+
+def _centred(values):
+    """
+    Column-centred values with NaNs set to 0, and the validity mask
+    
+    Centring on the column means keeps the sums of products small, so the
+    correlation formulas in _pearson_from_sums do not lose precision.
+    """
+    values = np.asarray(values, dtype=float).reshape(len(values), -1)
+    mask = ~np.isnan(values)
+    filled = np.where(mask, values, 0)
+    means = filled.sum(axis=0) / np.maximum(mask.sum(axis=0), 1)
+    return np.where(mask, filled - means, 0), mask.astype(float)
+
+def _pearson_from_sums(count, sum_x, sum_y, sum_xx, sum_yy, sum_xy):
+    """
+    Pearson r, p-values and counts from per-pair sums over complete rows
+    
+    Args:
+        count (numpy.ndarray): Rows where both values are present
+        sum_x, sum_y (numpy.ndarray): Sums of each variable over those rows
+        sum_xx, sum_yy (numpy.ndarray): Sums of squares over those rows
+        sum_xy (numpy.ndarray): Sums of products over those rows
+    
+    Returns:
+        dict: 'r', 'p_value' and 'n' arrays (r is NaN for constant inputs
+            or fewer than 2 rows)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_x = sum_xx - sum_x ** 2 / count
+        var_y = sum_yy - sum_y ** 2 / count
+        r = (sum_xy - sum_x * sum_y / count) / np.sqrt(var_x * var_y)
+    # Constant inputs (zero variance up to rounding) have no correlation
+    constant = (var_x <= 1e-10 * sum_xx) | (var_y <= 1e-10 * sum_yy) | (count < 2)
+    r = np.where(constant, np.nan, np.clip(r, -1, 1))
+    # Two points are exactly collinear; pearsonr returns r = +-1
+    r = np.where(count == 2, np.sign(r), r)
+    return {'r': r, 'p_value': pearson_p_value(r, count), 'n': count.astype(int)}
+
+def pearson_matrix(x, y):
+    """
+    Pearson correlation of every column of x with every column of y
+    
+    Uses pairwise-complete rows: each pair's r is computed over the rows
+    where both values are present, as pearsonr after a per-pair dropna.
+    All pairs come from six matrix products.
+    
+    Args:
+        x (numpy.ndarray): (n,) or (n, X) array, may contain NaNs
+        y (numpy.ndarray): (n,) or (n, Y) array, may contain NaNs
+    
+    Returns:
+        dict: 'r', 'p_value' and 'n' arrays of shape (X, Y)
+    """
+    x, x_mask = _centred(x)
+    y, y_mask = _centred(y)
+    count = x_mask.T @ y_mask
+    return _pearson_from_sums(count, x.T @ y_mask, x_mask.T @ y, (x * x).T @ y_mask,
+                              x_mask.T @ (y * y), x.T @ y)
+
+def _cross_sums(a, b, max_lag, n_fft):
+    """
+    sum_t a[t + lag, i] * b[t, j] for every column pair and lag 0..max_lag
+    
+    Args:
+        a (numpy.ndarray): (n, A) array without NaNs
+        b (numpy.ndarray): (n, B) array without NaNs
+        max_lag (int): Largest lag
+        n_fft (int): FFT length, at least n + max_lag so lags do not wrap
+    
+    Returns:
+        numpy.ndarray: (A, B, max_lag + 1) sums
+    """
+    spectrum = np.fft.rfft(a, n_fft, axis=0)[:, :, None] * \
+               np.fft.rfft(b, n_fft, axis=0).conj()[:, None, :]
+    return np.moveaxis(np.fft.irfft(spectrum, n_fft, axis=0)[:max_lag + 1], 0, -1)
+
+def lagged_pearson(x, y, max_lag):
+    """
+    Pearson correlation of x[t + lag] with y[t] for all column pairs and lags
+    
+    Every lag of every pair is computed at once from FFT cross-correlations
+    of the (centred) series, their squares and their validity masks, so the
+    cost barely depends on max_lag. Each coefficient uses the days where
+    both values are present; without NaNs, lag k equals
+    scipy.stats.pearsonr(x[k:, i], y[:n - k, j]).
+    
+    Args:
+        x (numpy.ndarray): (n,) or (n, X) series that follow (e.g. questions)
+        y (numpy.ndarray): (n,) or (n, Y) series that lead (e.g. weather)
+        max_lag (int): Largest lag in days
+    
+    Returns:
+        dict: 'r', 'p_value' and 'n' arrays of shape (X, Y, max_lag + 1)
+    """
+    x, x_mask = _centred(x)
+    y, y_mask = _centred(y)
+    max_lag = min(max_lag, len(x) - 1)
+    n_fft = 1 << int(np.ceil(np.log2(len(x) + max_lag)))
+    
+    return _pearson_from_sums(np.rint(_cross_sums(x_mask, y_mask, max_lag, n_fft)),
+                              _cross_sums(x, y_mask, max_lag, n_fft),
+                              _cross_sums(x_mask, y, max_lag, n_fft),
+                              _cross_sums(x * x, y_mask, max_lag, n_fft),
+                              _cross_sums(x_mask, y * y, max_lag, n_fft),
+                              _cross_sums(x, y, max_lag, n_fft))
 
 def calculate_lag_correlation(questions_df, weather_df, max_lag=28):
-    """Calculate lag correlations"""
+    """
+    Calculate lag correlations
+    
+    Weather on day t is correlated with questions on day t + lag for lags
+    0..max_lag. With several countries in weather_df, their daily mean is
+    used.
+    """
     print(f"\nCalculating lag correlations (max lag: {max_lag} days)...")
     
     # Ensure data is sorted by date
@@ -105,176 +263,305 @@ def calculate_lag_correlation(questions_df, weather_df, max_lag=28):
     questions_df = questions_df[start_date:end_date]
     weather_df = weather_df[start_date:end_date]
     
-    weather_vars = ['T2M', 'PRECTOTCORR', 'RH2M']
-    question_vars = ['question_count'] + [col for col in questions_df.columns 
-                                          if col.endswith('_count')]
+    weather_vars = [var for var in ['T2M', 'PRECTOTCORR', 'RH2M'] if var in weather_df.columns]
+    question_vars = list(dict.fromkeys(
+        col for col in ['question_count'] + list(questions_df.columns)
+        if col.endswith('_count') and col in questions_df.columns))
     
-    lag_correlations = {}
+    # One weather row per question day
+    weather_daily = weather_df[weather_vars].groupby(level=0).mean()
+    q_data = questions_df[question_vars].fillna(0).to_numpy(dtype=float)
+    w_data = weather_daily.reindex(questions_df.index).ffill().to_numpy(dtype=float)
+    
+    lags = list(range(0, max_lag + 1))
+    result = lagged_pearson(q_data, w_data, max_lag)
+    # Lags beyond the series length have no overlap
+    pad = [(0, 0), (0, 0), (0, len(lags) - result['r'].shape[2])]
+    r = np.pad(result['r'], pad, constant_values=np.nan)
+    p = np.pad(result['p_value'], pad, constant_values=np.nan)
     
-    for q_var in question_vars:
+    lag_correlations = {}
+    for i, q_var in enumerate(question_vars):
         lag_correlations[q_var] = {}
-        
-        for w_var in weather_vars:
-            if q_var in questions_df.columns and w_var in weather_df.columns:
-                # Get aligned data
-                q_data = questions_df[q_var].fillna(0).values
-                w_data = weather_df[w_var].fillna(method='ffill').values
-                
-                # Calculate correlation for each lag
-                lags = range(0, max_lag + 1)
-                correlations = []
-                p_values = []
-                
-                for lag in lags:
-                    if lag == 0:
-                        q_subset = q_data
-                        w_subset = w_data
-                    else:
-                        q_subset = q_data[lag:]
-                        w_subset = w_data[:-lag]
-                    
-                    if len(q_subset) > 0 and len(w_subset) > 0:
-                        corr, p_val = stats.pearsonr(q_subset, w_subset)
-                        correlations.append(corr)
-                        p_values.append(p_val)
-                    else:
-                        correlations.append(np.nan)
-                        p_values.append(np.nan)
-                
-                # Find optimal lag (highest absolute correlation)
-                abs_corrs = [abs(c) if not np.isnan(c) else 0 for c in correlations]
-                optimal_lag = lags[np.argmax(abs_corrs)]
-                
-                lag_correlations[q_var][w_var] = {
-                    'lags': list(lags),
-                    'correlations': correlations,
-                    'p_values': p_values,
-                    'optimal_lag': optimal_lag,
-                    'optimal_correlation': correlations[optimal_lag],
-                    'optimal_p_value': p_values[optimal_lag]
-                }
+        for j, w_var in enumerate(weather_vars):
+            # Find optimal lag (highest absolute correlation)
+            optimal_lag = lags[np.argmax(np.nan_to_num(np.abs(r[i, j])))]
+            lag_correlations[q_var][w_var] = {
+                'lags': lags,
+                'correlations': r[i, j].tolist(),
+                'p_values': p[i, j].tolist(),
+                'optimal_lag': optimal_lag,
+                'optimal_correlation': r[i, j, optimal_lag],
+                'optimal_p_value': p[i, j, optimal_lag]
+            }
     
     return lag_correlations
 
-def identify_weather_events(weather_df):
-    """Identify extreme weather events"""
+def rolling_values(values, window, how='mean'):
+    """
+    Trailing rolling sum or mean along the first (date) axis
+    
+    Like pandas rolling(window) with the default min_periods: the first
+    window - 1 days, and any window containing a NaN, are NaN.
+    
+    Args:
+        values (numpy.ndarray): (date, ...) array
+        window (int): Window length in days
+        how (str): 'sum' or 'mean'
+    
+    Returns:
+        numpy.ndarray: Same shape as values
+    """
+    values = np.asarray(values, dtype=float)
+    if window == 1:
+        return values
+    rolled = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        rolled[window - 1:] = windows.sum(axis=-1) if how == 'sum' else windows.mean(axis=-1)
+    return rolled
+
+def detect_events(values, parameters, definitions=EVENT_DEFINITIONS):
+    """
+    Find weather events in many series at once
+    
+    For each definition, days whose (rolled) variable passes the comparison
+    are found with run-length encoding, and runs of at least min_run days
+    become events. Works on any (date, series, parameter) array, e.g.
+    WeatherStore.values (locations) or fetch_grid values (grid points).
+    
+    Args:
+        values (numpy.ndarray): (date, series, parameter) array
+        parameters (list): Parameter names of the last axis
+        definitions (dict): Event name -> definition (see EVENT_DEFINITIONS)
+    
+    Returns:
+        dict: Event name -> 'dates' (date x series bool array, True from
+            the min_run-th day of an event to its end), and one entry per
+            event for 'series', 'start' and 'end' (inclusive date positions)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values.reshape(len(values), -1, values.shape[-1])
+    n_days, n_series = values.shape[:2]
+    
+    events = {}
+    for name, definition in definitions.items():
+        if definition['variable'] not in parameters:
+            continue
+        variable = values[:, :, list(parameters).index(definition['variable'])]
+        rolled = rolling_values(variable, definition.get('window', 1),
+                                definition.get('rolling', 'mean'))
+        with np.errstate(invalid='ignore'):
+            hit = COMPARATORS[definition['comparator']](rolled, definition['threshold'])
+        
+        # Run boundaries per series: +1 where a run starts, -1 after it ends
+        edges = np.diff(np.pad(hit.T.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+        series, start = np.nonzero(edges == 1)
+        end = np.nonzero(edges == -1)[1] - 1
+        min_run = definition.get('min_run', 1)
+        keep = end - start + 1 >= min_run
+        series, start, end = series[keep], start[keep], end[keep]
+        
+        # Mark days from the min_run-th day of each event to its end
+        marks = np.zeros((n_series, n_days + 1), dtype=np.int32)
+        np.add.at(marks, (series, start + min_run - 1), 1)
+        np.add.at(marks, (series, end + 1), -1)
+        dates = np.cumsum(marks[:, :-1], axis=1).T > 0
+        
+        events[name] = {'dates': dates, 'series': series, 'start': start, 'end': end}
+    return events
+
+def identify_weather_events(weather_df, definitions=EVENT_DEFINITIONS):
+    """
+    Identify extreme weather events
+    
+    Each country in weather_df (see load_data) is scanned separately, so
+    runs and rolling windows never span two countries.
+    
+    Args:
+        weather_df (pandas.DataFrame): Daily weather, optionally with a
+            'country' column
+        definitions (dict): Event name -> definition (see EVENT_DEFINITIONS)
+    
+    Returns:
+        tuple: (events, intervals) where events maps event name -> list of
+            event dates and intervals is a DataFrame with one row per event
+            (event, country, start, end, days)
+    """
     print("\nIdentifying weather events...")
     
-    events = {
-        'heavy_rain': [],
-        'drought': [],
-        'heat_wave': [],
-        'cold_spell': []
+    if 'country' in weather_df.columns:
+        countries = list(dict.fromkeys(weather_df['country']))
+        frames = [weather_df[weather_df['country'] == country] for country in countries]
+    else:
+        countries, frames = [None], [weather_df]
+    parameters = [col for col in weather_df.columns if col != 'country']
+    dates = frames[0].index
+    for df in frames[1:]:
+        dates = dates.union(df.index)
+    values = np.stack([df[parameters].reindex(dates).to_numpy(dtype=float) for df in frames],
+                      axis=1)
+    
+    events, intervals = {}, []
+    for name, found in detect_events(values, parameters, definitions).items():
+        series, days = np.nonzero(found['dates'].T)
+        events[name] = dates[days].tolist()
+        intervals.append(pd.DataFrame({
+            'event': name,
+            'country': np.array(countries, dtype=object)[found['series']],
+            'start': dates[found['start']],
+            'end': dates[found['end']],
+            'days': found['end'] - found['start'] + 1
+        }))
+        print(f"{name}: {len(found['start'])} events, {len(events[name])} event days")
+    
+    for name in definitions:
+        events.setdefault(name, [])
+    
+    columns = ['event', 'country', 'start', 'end', 'days']
+    intervals = pd.concat(intervals, ignore_index=True) if intervals else pd.DataFrame(
+        columns=columns)
+    return events, intervals
+
+def _window_summary(windows):
+    """
+    Pooled mean, std, count, sum and sum of squares over axes 0 and 1
+    
+    Args:
+        windows (numpy.ndarray): (event, day, column) values, NaN = missing
+    
+    Returns:
+        dict: Arrays with one entry per column (std uses ddof=0, like np.std)
+    """
+    present = ~np.isnan(windows)
+    filled = np.where(present, windows, 0)
+    count = present.sum(axis=(0, 1))
+    total = filled.sum(axis=(0, 1))
+    squares = (filled ** 2).sum(axis=(0, 1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / count
+        std = np.sqrt(np.maximum(squares / count - mean ** 2, 0))
+    return {'mean': mean, 'std': std, 'count': count}
+
+def _ttest_ind(a, b):
+    """
+    Student's t-test (equal variances) from _window_summary results
+    
+    Same as scipy.stats.ttest_ind on the pooled values, for every column.
+    
+    Returns:
+        tuple: (t statistics, two-sided p-values) arrays
+    """
+    dof = a['count'] + b['count'] - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pooled = (a['count'] * a['std'] ** 2 + b['count'] * b['std'] ** 2) / dof
+        t_stat = (a['mean'] - b['mean']) / np.sqrt(pooled * (1 / a['count'] + 1 / b['count']))
+    return t_stat, 2 * stats.t.sf(np.abs(t_stat), np.where(dof > 0, dof, np.nan))
+
+def event_windows(values, positions, window_days):
+    """
+    Gather the days around many events at once
+    
+    Args:
+        values (numpy.ndarray): (day,) or (day, column) series on a complete
+            daily index, NaN = no data
+        positions (numpy.ndarray): Day position of each event
+        window_days (int): Days before and after each event
+    
+    Returns:
+        numpy.ndarray: (event, 2 * window_days + 1, column) values for
+            offsets -window_days..window_days (NaN outside the series)
+    """
+    values = np.asarray(values, dtype=float).reshape(len(values), -1)
+    index = np.asarray(positions)[:, None] + np.arange(-window_days, window_days + 1)
+    inside = (index >= 0) & (index < len(values))
+    windows = values[np.clip(index, 0, len(values) - 1)]
+    windows[~inside] = np.nan
+    return windows
+
+def event_study(values, positions, window_days):
+    """
+    Compare values before, during and after events
+    
+    Before is the window_days days ahead of each event day, after the
+    window_days days following it; all events' windows are pooled.
+    
+    Args:
+        values (numpy.ndarray): (day,) or (day, column) series on a complete
+            daily index, NaN = no data
+        positions (numpy.ndarray): Day position of each event
+        window_days (int): Days before and after each event
+    
+    Returns:
+        dict: 'before', 'during', 'after' summaries (mean, std, count per
+            column), 'ttest_before' and 'ttest_after' (t, p per column, during
+            vs that window) and 'profile' (offset x column mean over events)
+    """
+    windows = event_windows(values, positions, window_days)
+    summaries = {
+        'before': _window_summary(windows[:, :window_days]),
+        'during': _window_summary(windows[:, window_days:window_days + 1]),
+        'after': _window_summary(windows[:, window_days + 1:])
     }
-    
-    # Heavy rainfall: >50mm in a day
-    if 'PRECTOTCORR' in weather_df.columns:
-        heavy_rain = weather_df[weather_df['PRECTOTCORR'] > 50]
-        events['heavy_rain'] = heavy_rain.index.tolist()
-        print(f"Heavy rainfall events: {len(events['heavy_rain'])}")
-    
-    # Drought: <10mm over 30 days
-    if 'PRECTOTCORR' in weather_df.columns:
-        rainfall_30d = weather_df['PRECTOTCORR'].rolling(window=30).sum()
-        drought = weather_df[rainfall_30d < 10]
-        events['drought'] = drought.index.tolist()
-        print(f"Drought periods: {len(events['drought'])}")
-    
-    # Heat wave: T_max > 35°C for 3+ consecutive days
-    if 'T2M_MAX' in weather_df.columns:
-        hot_days = weather_df['T2M_MAX'] > 35
-        # Find consecutive sequences
-        heat_wave_dates = []
-        consecutive = 0
-        for date, is_hot in hot_days.items():
-            if is_hot:
-                consecutive += 1
-                if consecutive >= 3:
-                    heat_wave_dates.append(date)
-            else:
-                consecutive = 0
-        events['heat_wave'] = heat_wave_dates
-        print(f"Heat wave days: {len(events['heat_wave'])}")
-    
-    # Cold spell: T_min < 10°C for 3+ consecutive days
-    if 'T2M_MIN' in weather_df.columns:
-        cold_days = weather_df['T2M_MIN'] < 10
-        cold_spell_dates = []
-        consecutive = 0
-        for date, is_cold in cold_days.items():
-            if is_cold:
-                consecutive += 1
-                if consecutive >= 3:
-                    cold_spell_dates.append(date)
-            else:
-                consecutive = 0
-        events['cold_spell'] = cold_spell_dates
-        print(f"Cold spell days: {len(events['cold_spell'])}")
-    
-    return events
+    for side in ['before', 'after']:
+        summaries[f'ttest_{side}'] = _ttest_ind(summaries['during'], summaries[side])
+    present = ~np.isnan(windows)
+    with np.errstate(invalid='ignore'):
+        summaries['profile'] = np.where(present, windows, 0).sum(axis=0) / present.sum(axis=0)
+    return summaries
 
 def analyze_event_impact(questions_df, events, window_days=7):
-    """Analyze question patterns during weather events"""
+    """
+    Analyze question patterns during weather events
+    
+    Question counts on each event day are compared with the whole
+    window_days-day windows before and after it. The daily series is
+    reindexed once and all events' windows are gathered together.
+    
+    Args:
+        questions_df (pandas.DataFrame): Daily questions with question_count
+        events (dict): Event name -> list of event dates
+        window_days (int): Days before and after each event
+    
+    Returns:
+        dict: Event name -> before/during/after statistics and t-tests
+    """
     print(f"\nAnalyzing event impact (±{window_days} days window)...")
     
+    counts = questions_df['question_count'].sort_index()
+    days = pd.date_range(counts.index.min(), counts.index.max(), freq='D')
+    values = counts.reindex(days).to_numpy(dtype=float)
+    
     impact_analysis = {}
     
     for event_type, event_dates in events.items():
         if not event_dates:
             continue
         
-        impact_analysis[event_type] = {}
-        
-        # Get question counts during events
-        event_questions = []
-        before_questions = []
-        after_questions = []
-        
-        for event_date in event_dates:
-            # During event
-            if event_date in questions_df.index:
-                event_questions.append(questions_df.loc[event_date, 'question_count'])
-            
-            # Before event
-            before_date = event_date - pd.Timedelta(days=window_days)
-            if before_date in questions_df.index:
-                before_questions.append(questions_df.loc[before_date, 'question_count'])
-            
-            # After event
-            after_date = event_date + pd.Timedelta(days=window_days)
-            if after_date in questions_df.index:
-                after_questions.append(questions_df.loc[after_date, 'question_count'])
-        
-        # Calculate statistics
-        if event_questions:
-            impact_analysis[event_type]['during'] = {
-                'mean': np.mean(event_questions),
-                'std': np.std(event_questions),
-                'count': len(event_questions)
-            }
+        positions = (pd.DatetimeIndex(event_dates) - days[0]).days.to_numpy()
+        study = event_study(values, positions, window_days)
         
-        if before_questions:
-            impact_analysis[event_type]['before'] = {
-                'mean': np.mean(before_questions),
-                'std': np.std(before_questions),
-                'count': len(before_questions)
-            }
+        impact_analysis[event_type] = {}
+        for period in ['during', 'before', 'after']:
+            if study[period]['count'][0]:
+                impact_analysis[event_type][period] = {
+                    key: study[period][key][0].item() for key in ['mean', 'std', 'count']
+                }
         
-        if after_questions:
-            impact_analysis[event_type]['after'] = {
-                'mean': np.mean(after_questions),
-                'std': np.std(after_questions),
-                'count': len(after_questions)
-            }
+        # Statistical tests (t-test) against each surrounding window
+        for side in ['before', 'after']:
+            t_stat, p_value = study[f'ttest_{side}']
+            if study['during']['count'][0] and study[side]['count'][0]:
+                impact_analysis[event_type][f'ttest_{side}'] = {
+                    't_statistic': t_stat[0].item(),
+                    'p_value': p_value[0].item(),
+                    'significant': bool(p_value[0] < 0.05)
+                }
         
-        # Statistical test (t-test)
-        if event_questions and before_questions:
-            t_stat, p_value = stats.ttest_ind(event_questions, before_questions)
-            impact_analysis[event_type]['ttest_before'] = {
-                't_statistic': t_stat,
-                'p_value': p_value,
-                'significant': p_value < 0.05
-            }
+        impact_analysis[event_type]['profile'] = {
+            'offsets': list(range(-window_days, window_days + 1)),
+            'mean': study['profile'][:, 0].tolist()
+        }
         
         print(f"{event_type}: {len(event_dates)} events analyzed")
     
@@ -305,7 +592,10 @@ def main():
     lag_corr = calculate_lag_correlation(questions_df, weather_df)
     
     # Identify weather events
-    events = identify_weather_events(weather_df)
+    events, event_intervals = identify_weather_events(weather_df)
+    events_file = processed_dir / "weather_events.csv"
+    event_intervals.to_csv(events_file, index=False)
+    print(f"Event intervals saved to: {events_file}")
     
     # Analyze event impact
     event_impact = analyze_event_impact(questions_df, events)
@@ -323,6 +613,8 @@ def main():
     def convert_to_serializable(obj):
         if isinstance(obj, np.integer):
             return int(obj)
+        elif isinstance(obj, np.bool_):
+            return bool(obj)
         elif isinstance(obj, np.floating):
             return float(obj)
         elif isinstance(obj, np.ndarray):
@@ -13,22 +13,69 @@ Parameters downloaded:
 - RH2M: Relative Humidity at 2 Meters (%)
 - WS2M: Wind Speed at 2 Meters (m/s)
 
+Country and regional points are fetched concurrently, under a token-bucket
+rate limit with exponential backoff on failures. Responses are cached on
+disk (data/cache/nasa_power), so reruns only request date ranges that are
+not cached yet. All locations are saved to one memory-mapped weather
+store (data/raw/weather_store.bin, see weather_store.py); --csv also
+writes the per-location CSV and metadata JSON files.
+
+Grid mode (--grid) tiles each country's bounding box, fetches every grid
+point and reduces them to a weighted country series, stored as location
+grid_<country>; the grids themselves go to data/raw/grid.
+
 Usage:
     python3 download_weather_data.py
+    python3 download_weather_data.py --grid --grid-resolution 0.5
+    python3 download_weather_data.py --no-cache
+    python3 download_weather_data.py --stand-in   # local fake API, no network
 """
 
+import argparse
+import hashlib
+import os
+import random
+import threading
 import requests
+import numpy as np
 import pandas as pd
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
 import time
 
+from weather_store import STORE_FILE, update_store
+
 # Configuration
 BASE_URL = "https://power.larc.nasa.gov/api/temporal/daily/point"
 START_DATE = "20150101"
 END_DATE = "20221231"
 PARAMETERS = ['T2M', 'T2M_MAX', 'T2M_MIN', 'PRECTOTCORR', 'RH2M', 'WS2M']
+COMMUNITY = 'AG'  # Agroclimatology community
+
+# Country bounding boxes (lat_min, lat_max, lon_min, lon_max) tiled in grid mode
+COUNTRY_BOUNDS = {
+    'kenya': (-4.7, 5.0, 33.9, 41.9),
+    'uganda': (-1.5, 4.2, 29.6, 35.0),
+    'tanzania': (-11.7, -1.0, 29.3, 40.4)
+}
+GRID_RESOLUTION = 1.0  # degrees; POWER's native grid is 0.5 x 0.625
+
+# Request pacing for the API (cache hits are free): token bucket refilled at
+# REQUESTS_PER_SECOND up to REQUEST_BURST, MAX_WORKERS requests in flight
+REQUESTS_PER_SECOND = 0.5
+REQUEST_BURST = 3
+MAX_WORKERS = 8
+
+# Retries: connection errors, timeouts and these HTTP statuses, with
+# exponential backoff (RETRY_BACKOFF * 2**attempt seconds, jittered, capped)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+RETRY_BACKOFF = 2.0
+RETRY_BACKOFF_MAX = 60.0
 
 # Country coordinates (capital cities as reference points)
 LOCATIONS = {
@@ -58,9 +105,116 @@ REGIONAL_LOCATIONS = {
     'tanzania_arusha': {'latitude': -3.3869, 'longitude': 36.6830}
 }
 
-def get_weather_data(latitude, longitude, start_date, end_date, parameters):
+class TokenBucket:
     """
-    Fetch weather data from NASA POWER API
+    Thread-safe token bucket rate limiter
+    
+    Args:
+        rate (float): Tokens added per second
+        capacity (int): Maximum tokens (largest burst)
+    """
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_default_limiter = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+_sessions = threading.local()
+
+def _session():
+    """Per-thread requests.Session, so connections are reused"""
+    if not hasattr(_sessions, 'session'):
+        _sessions.session = requests.Session()
+    return _sessions.session
+
+def _retry_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number attempt + 1"""
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), RETRY_BACKOFF_MAX)
+        except ValueError:
+            pass
+    return min(RETRY_BACKOFF * 2 ** attempt, RETRY_BACKOFF_MAX) * random.uniform(0.5, 1)
+
+def _cache_prefix(latitude, longitude, parameters):
+    """Cache file prefix identifying a (location, parameters) series"""
+    key = json.dumps({'latitude': round(float(latitude), 4),
+                      'longitude': round(float(longitude), 4),
+                      'parameters': sorted(parameters),
+                      'community': COMMUNITY}, sort_keys=True)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+def cached_segments(cache_dir, latitude, longitude, parameters):
+    """
+    List the cached responses for a location and parameter set
+    
+    Args:
+        cache_dir (Path): Cache directory
+        latitude (float): Latitude coordinate
+        longitude (float): Longitude coordinate
+        parameters (list): List of parameter names
+    
+    Returns:
+        list: (start, end, path) per cached response, sorted by start
+    """
+    prefix = _cache_prefix(latitude, longitude, parameters)
+    segments = []
+    for path in Path(cache_dir).glob(f"{prefix}_*_*.json"):
+        _, start, end = path.stem.split('_')
+        segments.append((pd.Timestamp(start), pd.Timestamp(end), path))
+    return sorted(segments)
+
+def missing_ranges(start_date, end_date, segments):
+    """
+    Date ranges in [start_date, end_date] not covered by cached segments
+    
+    Args:
+        start_date (str): Start date in YYYYMMDD format
+        end_date (str): End date in YYYYMMDD format
+        segments (list): Output of cached_segments
+    
+    Returns:
+        list: (start, end) pairs in YYYYMMDD format
+    """
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    day = pd.Timedelta(days=1)
+    gaps = []
+    cursor = start
+    for seg_start, seg_end, _ in segments:
+        if cursor > end or seg_start > end:
+            break
+        if seg_end < cursor:
+            continue
+        if seg_start > cursor:
+            gaps.append((cursor, seg_start - day))
+        cursor = seg_end + day
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return [(a.strftime('%Y%m%d'), b.strftime('%Y%m%d')) for a, b in gaps]
+
+def fetch_power_json(latitude, longitude, start_date, end_date, parameters,
+                     base_url=BASE_URL, limiter=None):
+    """
+    Request one date range from the NASA POWER API
+    
+    Every attempt takes a token from the rate limiter; failed attempts are
+    retried up to MAX_RETRIES times with exponential backoff.
     
     Args:
         latitude (float): Latitude coordinate
@@ -68,13 +222,20 @@ def get_weather_data(latitude, longitude, start_date, end_date, parameters):
         start_date (str): Start date in YYYYMMDD format
         end_date (str): End date in YYYYMMDD format
         parameters (list): List of parameter names
+        base_url (str): API endpoint
+        limiter (TokenBucket): Rate limiter (None = module default)
     
     Returns:
-        pandas.DataFrame: Weather data with datetime index
+        dict: Decoded JSON response
+    
+    Raises:
+        requests.exceptions.RequestException: If the last attempt fails
+        ValueError: If the response has no parameter data
     """
+    limiter = limiter or _default_limiter
     params = {
         'parameters': ','.join(parameters),
-        'community': 'AG',  # Agroclimatology community
+        'community': COMMUNITY,
         'longitude': longitude,
         'latitude': latitude,
         'start': start_date,
@@ -82,27 +243,94 @@ def get_weather_data(latitude, longitude, start_date, end_date, parameters):
         'format': 'JSON'
     }
     
-    print(f"Requesting data for ({latitude}, {longitude})...")
-    print(f"URL: {BASE_URL}")
-    print(f"Parameters: {params}")
+    print(f"Requesting {start_date}-{end_date} for ({latitude}, {longitude})...")
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        try:
+            response = _session().get(base_url, params=params, timeout=60)
+            if response.status_code not in RETRY_STATUSES:
+                response.raise_for_status()
+                break
+            error, retry_after = f"HTTP {response.status_code}", response.headers.get('Retry-After')
+            if attempt == MAX_RETRIES:
+                response.raise_for_status()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt == MAX_RETRIES:
+                raise
+            error, retry_after = type(e).__name__, None
+        
+        delay = _retry_delay(attempt, retry_after)
+        print(f"{error} for ({latitude}, {longitude}), retry {attempt + 1}/{MAX_RETRIES} "
+              f"in {delay:.1f}s")
+        time.sleep(delay)
+    
+    data = response.json()
+    
+    # Check if request was successful
+    if 'properties' not in data or 'parameter' not in data['properties']:
+        raise ValueError(f"Unexpected response structure: {json.dumps(data, indent=2)[:500]}")
+    return data
+
+def get_weather_data(latitude, longitude, start_date, end_date, parameters,
+                     cache_dir=None, base_url=BASE_URL, limiter=None, verbose=True):
+    """
+    Fetch weather data from NASA POWER API
+    
+    With a cache directory, each response is stored as
+    <series prefix>_<start>_<end>.json and only the date ranges that no
+    cached response covers are requested.
+    
+    Args:
+        latitude (float): Latitude coordinate
+        longitude (float): Longitude coordinate
+        start_date (str): Start date in YYYYMMDD format
+        end_date (str): End date in YYYYMMDD format
+        parameters (list): List of parameter names
+        cache_dir (Path): Response cache directory (None = no caching)
+        base_url (str): API endpoint
+        limiter (TokenBucket): Rate limiter (None = module default)
+        verbose (bool): Print cache and data summaries
     
+    Returns:
+        pandas.DataFrame: Weather data with datetime index
+    """
     try:
-        response = requests.get(BASE_URL, params=params, timeout=60)
-        response.raise_for_status()
-        
-        data = response.json()
+        if cache_dir is None:
+            responses = [fetch_power_json(latitude, longitude, start_date, end_date,
+                                          parameters, base_url, limiter)]
+        else:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            segments = cached_segments(cache_dir, latitude, longitude, parameters)
+            gaps = missing_ranges(start_date, end_date, segments)
+            if verbose:
+                print(f"Cache: {len(segments)} cached response(s), "
+                      f"{len(gaps)} date range(s) to request")
+            
+            prefix = _cache_prefix(latitude, longitude, parameters)
+            for gap_start, gap_end in gaps:
+                data = fetch_power_json(latitude, longitude, gap_start, gap_end,
+                                        parameters, base_url, limiter)
+                path = cache_dir / f"{prefix}_{gap_start}_{gap_end}.json"
+                tmp_path = path.with_suffix('.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            
+            responses = []
+            for seg_start, seg_end, path in cached_segments(cache_dir, latitude, longitude,
+                                                            parameters):
+                if seg_end >= pd.Timestamp(start_date) and seg_start <= pd.Timestamp(end_date):
+                    with open(path) as f:
+                        responses.append(json.load(f))
         
-        # Check if request was successful
-        if 'properties' not in data or 'parameter' not in data['properties']:
-            print(f"Error: Unexpected response structure")
-            print(f"Response: {json.dumps(data, indent=2)[:500]}")
-            return None
-        
-        # Extract parameter data
+        # Extract parameter data (later responses fill in their own dates)
         df_list = []
         for param in parameters:
-            if param in data['properties']['parameter']:
-                param_data = data['properties']['parameter'][param]
+            param_data = {}
+            for data in responses:
+                param_data.update(data['properties']['parameter'].get(param, {}))
+            if param_data:
                 df_param = pd.DataFrame(list(param_data.items()), 
                                        columns=['date', param])
                 df_list.append(df_param.set_index('date'))
@@ -116,8 +344,9 @@ def get_weather_data(latitude, longitude, start_date, end_date, parameters):
         # Combine all parameters
         df = pd.concat(df_list, axis=1)
         
-        # Convert index to datetime
+        # Convert index to datetime, keeping the requested range
         df.index = pd.to_datetime(df.index, format='%Y%m%d')
+        df = df.sort_index().loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
         
         # Replace missing value indicator (-999) with NaN
         df = df.replace(-999, pd.NA)
@@ -126,9 +355,10 @@ def get_weather_data(latitude, longitude, start_date, end_date, parameters):
         df['latitude'] = latitude
         df['longitude'] = longitude
         
-        print(f"Successfully downloaded {len(df)} days of data")
-        print(f"Date range: {df.index.min()} to {df.index.max()}")
-        print(f"Missing values: {df.isna().sum().to_dict()}")
+        if verbose:
+            print(f"Successfully downloaded {len(df)} days of data")
+            print(f"Date range: {df.index.min()} to {df.index.max()}")
+            print(f"Missing values: {df.isna().sum().to_dict()}")
         
         return df
         
@@ -139,20 +369,26 @@ def get_weather_data(latitude, longitude, start_date, end_date, parameters):
         print(f"Error processing data: {e}")
         return None
 
-def download_country_data(country, location_info, output_dir):
+def download_country_data(country, location_info, output_dir, cache_dir=None,
+                          base_url=BASE_URL, limiter=None, write_csv=False):
     """
     Download weather data for a country
     
     Args:
-        country (str): Country name
+        country (str): Country (or region) name
         location_info (dict): Location information with latitude and longitude
-        output_dir (Path): Output directory path
+        output_dir (Path): Output directory path (for write_csv)
+        cache_dir (Path): Response cache directory (None = no caching)
+        base_url (str): API endpoint
+        limiter (TokenBucket): Rate limiter (None = module default)
+        write_csv (bool): Also save weather_<country>.csv and its metadata JSON
     
     Returns:
-        bool: True if successful, False otherwise
+        tuple: (DataFrame, metadata dict), or None if the download failed
     """
+    location_name = location_info.get('name', country)
     print(f"\n{'='*60}")
-    print(f"Downloading data for {country.upper()} ({location_info['name']})")
+    print(f"Downloading data for {country.upper()} ({location_name})")
     print(f"{'='*60}")
     
     df = get_weather_data(
@@ -160,19 +396,16 @@ def download_country_data(country, location_info, output_dir):
         longitude=location_info['longitude'],
         start_date=START_DATE,
         end_date=END_DATE,
-        parameters=PARAMETERS
+        parameters=PARAMETERS,
+        cache_dir=cache_dir,
+        base_url=base_url,
+        limiter=limiter
     )
     
     if df is not None:
-        # Save to CSV
-        output_file = output_dir / f"weather_{country}.csv"
-        df.to_csv(output_file)
-        print(f"Saved to: {output_file}")
-        
-        # Save metadata
         metadata = {
             'country': country,
-            'location': location_info['name'],
+            'location': location_name,
             'latitude': location_info['latitude'],
             'longitude': location_info['longitude'],
             'start_date': START_DATE,
@@ -183,44 +416,423 @@ def download_country_data(country, location_info, output_dir):
             'missing_values': df.isna().sum().to_dict()
         }
         
+        if write_csv:
+            output_file = output_dir / f"weather_{country}.csv"
+            df.to_csv(output_file)
+            print(f"Saved to: {output_file}")
+            
+            metadata_file = output_dir / f"weather_{country}_metadata.json"
+            with open(metadata_file, 'w') as f:
+                json.dump(metadata, f, indent=2)
+            print(f"Metadata saved to: {metadata_file}")
+        
+        return df, metadata
+    else:
+        print(f"Failed to download data for {country}")
+        return None
+
+def download_all(locations, output_dir, cache_dir=None, base_url=BASE_URL,
+                 limiter=None, max_workers=MAX_WORKERS, write_csv=False):
+    """
+    Download weather data for many locations concurrently
+    
+    Wall time is bounded by the rate limit (and cache hits need no request),
+    not by the number of locations times the request latency.
+    
+    Args:
+        locations (dict): Name -> location information
+        output_dir (Path): Output directory path (for write_csv)
+        cache_dir (Path): Response cache directory (None = no caching)
+        base_url (str): API endpoint
+        limiter (TokenBucket): Rate limiter (None = module default)
+        max_workers (int): Concurrent downloads
+        write_csv (bool): Also save per-location CSV and metadata JSON files
+    
+    Returns:
+        dict: Name -> (DataFrame, metadata) or None if the download failed
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(download_country_data, name, info, output_dir,
+                               cache_dir, base_url, limiter, write_csv): name
+                   for name, info in locations.items()}
+        results = {futures[future]: future.result() for future in as_completed(futures)}
+    return {name: results[name] for name in locations}
+
+def grid_points(bounds, resolution=GRID_RESOLUTION):
+    """
+    Cell centres tiling a bounding box
+    
+    Args:
+        bounds (tuple): (lat_min, lat_max, lon_min, lon_max)
+        resolution (float): Cell size in degrees
+    
+    Returns:
+        tuple: (latitudes, longitudes) arrays, one entry per cell
+    """
+    lat_min, lat_max, lon_min, lon_max = bounds
+    latitudes = np.arange(lat_min + resolution / 2, lat_max, resolution)
+    longitudes = np.arange(lon_min + resolution / 2, lon_max, resolution)
+    lat_grid, lon_grid = np.meshgrid(latitudes, longitudes, indexing='ij')
+    return np.round(lat_grid.ravel(), 4), np.round(lon_grid.ravel(), 4)
+
+def grid_weights(latitudes, longitudes, resolution=GRID_RESOLUTION, points=None):
+    """
+    Weight of each grid cell in the regional series
+    
+    Args:
+        latitudes (numpy.ndarray): Cell centre latitudes
+        longitudes (numpy.ndarray): Cell centre longitudes
+        resolution (float): Cell size in degrees
+        points (pandas.DataFrame): Optional latitude/longitude/weight rows
+            (e.g. population or users); each cell gets the total weight of
+            the points inside it. Default: cell area (cos latitude)
+    
+    Returns:
+        numpy.ndarray: Non-negative weight per cell
+    """
+    if points is None:
+        return np.cos(np.radians(latitudes))
+    
+    # Points and cells share one row/column numbering from the grid's
+    # south-west corner, so each point is binned in O(1) without distances
+    lat0 = latitudes.min() - resolution / 2
+    lon0 = longitudes.min() - resolution / 2
+    cell_rows = np.rint((latitudes - lat0) / resolution - 0.5).astype(np.int64)
+    cell_cols = np.rint((longitudes - lon0) / resolution - 0.5).astype(np.int64)
+    cell_index = np.full((cell_rows.max() + 1, cell_cols.max() + 1), -1, dtype=np.int64)
+    cell_index[cell_rows, cell_cols] = np.arange(len(latitudes))
+    
+    rows = np.floor((points['latitude'].to_numpy() - lat0) / resolution).astype(np.int64)
+    cols = np.floor((points['longitude'].to_numpy() - lon0) / resolution).astype(np.int64)
+    inside = (rows >= 0) & (rows < cell_index.shape[0]) & (cols >= 0) & (cols < cell_index.shape[1])
+    cells = np.full(len(points), -1, dtype=np.int64)
+    cells[inside] = cell_index[rows[inside], cols[inside]]
+    inside = cells >= 0
+    return np.bincount(cells[inside], weights=points['weight'].to_numpy()[inside],
+                       minlength=len(latitudes))
+
+def fetch_grid(bounds, start_date, end_date, parameters, resolution=GRID_RESOLUTION,
+               cache_dir=None, base_url=BASE_URL, limiter=None, max_workers=MAX_WORKERS):
+    """
+    Fetch every grid point of a bounding box concurrently
+    
+    Args:
+        bounds (tuple): (lat_min, lat_max, lon_min, lon_max)
+        start_date (str): Start date in YYYYMMDD format
+        end_date (str): End date in YYYYMMDD format
+        parameters (list): List of parameter names
+        resolution (float): Cell size in degrees
+        cache_dir (Path): Response cache directory (None = no caching)
+        base_url (str): API endpoint
+        limiter (TokenBucket): Rate limiter (None = module default)
+        max_workers (int): Concurrent downloads
+    
+    Returns:
+        dict: 'dates' (DatetimeIndex), 'latitudes', 'longitudes',
+            'parameters' and 'values' (float32, date x grid x parameter,
+            NaN where missing or a point failed)
+    """
+    latitudes, longitudes = grid_points(bounds, resolution)
+    dates = pd.date_range(pd.Timestamp(start_date), pd.Timestamp(end_date))
+    values = np.full((len(dates), len(latitudes), len(parameters)), np.nan, dtype=np.float32)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(get_weather_data, lat, lon, start_date, end_date, parameters,
+                               cache_dir, base_url, limiter, False): i
+                   for i, (lat, lon) in enumerate(zip(latitudes, longitudes))}
+        for future in as_completed(futures):
+            df = future.result()
+            if df is not None:
+                # Parameters missing from a response stay NaN for that point
+                values[:, futures[future], :] = df.reindex(index=dates, columns=parameters) \
+                    .to_numpy(dtype=np.float32, na_value=np.nan)
+    
+    failed = np.isnan(values).all(axis=(0, 2)).sum()
+    print(f"Fetched {len(latitudes) - failed}/{len(latitudes)} grid points")
+    return {'dates': dates, 'latitudes': latitudes, 'longitudes': longitudes,
+            'parameters': list(parameters), 'values': values}
+
+def regional_series(grid, weights):
+    """
+    Reduce a grid to one weighted daily series per parameter
+    
+    Missing cells are left out of each day's weighted mean.
+    
+    Args:
+        grid (dict): Output of fetch_grid
+        weights (numpy.ndarray): Weight per grid cell
+    
+    Returns:
+        pandas.DataFrame: Date index, one column per parameter
+    """
+    values = grid['values']
+    present = ~np.isnan(values)
+    totals = np.einsum('dgp,g->dp', np.where(present, values, 0), weights)
+    norms = np.einsum('dgp,g->dp', present.astype(np.float32), weights)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        series = np.where(norms > 0, totals / norms, np.nan)
+    return pd.DataFrame(series, index=grid['dates'], columns=grid['parameters'])
+
+def save_grid(path, grid, weights):
+    """
+    Save a grid as one compressed array file
+    
+    Args:
+        path (Path): Output .npz file
+        grid (dict): Output of fetch_grid
+        weights (numpy.ndarray): Weight per grid cell
+    """
+    np.savez_compressed(path, values=grid['values'],
+                        dates=grid['dates'].values.astype('datetime64[D]'),
+                        latitudes=grid['latitudes'], longitudes=grid['longitudes'],
+                        parameters=np.array(grid['parameters']), weights=weights)
+
+def download_country_grid(country, output_dir, resolution=GRID_RESOLUTION, points=None,
+                          cache_dir=None, base_url=BASE_URL, limiter=None,
+                          max_workers=MAX_WORKERS, write_csv=False):
+    """
+    Grid-mode download for a country
+    
+    Writes weather_grid_<country>.npz (date x grid x parameter) to
+    output_dir and returns the weighted country series for the store.
+    
+    Args:
+        country (str): Key of COUNTRY_BOUNDS
+        output_dir (Path): Output directory path
+        resolution (float): Cell size in degrees
+        points (pandas.DataFrame): Optional weighting points, see grid_weights
+        cache_dir (Path): Response cache directory (None = no caching)
+        base_url (str): API endpoint
+        limiter (TokenBucket): Rate limiter (None = module default)
+        max_workers (int): Concurrent downloads
+        write_csv (bool): Also save the series as weather_<country>.csv
+            and its metadata JSON
+    
+    Returns:
+        tuple: (weighted series DataFrame, metadata dict), or None if no
+            grid point was downloaded
+    """
+    print(f"\n{'='*60}")
+    print(f"Grid download for {country.upper()} at {resolution}°")
+    print(f"{'='*60}")
+    
+    grid = fetch_grid(COUNTRY_BOUNDS[country], START_DATE, END_DATE, PARAMETERS, resolution,
+                      cache_dir, base_url, limiter, max_workers)
+    weights = grid_weights(grid['latitudes'], grid['longitudes'], resolution, points)
+    if np.isnan(grid['values']).all() or weights.sum() == 0:
+        print(f"Failed to download grid data for {country}")
+        return None
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    grid_file = output_dir / f"weather_grid_{country}.npz"
+    save_grid(grid_file, grid, weights)
+    print(f"Saved grid {grid['values'].shape} to: {grid_file}")
+    
+    series = regional_series(grid, weights)
+    metadata = {
+        'country': country,
+        'kind': 'grid',
+        'bounds': list(COUNTRY_BOUNDS[country]),
+        'resolution': resolution,
+        'grid_points': len(grid['latitudes']),
+        'weighting': 'area' if points is None else 'points',
+        'start_date': START_DATE,
+        'end_date': END_DATE,
+        'parameters': PARAMETERS,
+        'download_timestamp': datetime.now().isoformat(),
+        'total_days': len(series),
+        'missing_values': series.isna().sum().to_dict()
+    }
+    
+    if write_csv:
+        series_file = output_dir / f"weather_{country}.csv"
+        series.to_csv(series_file)
+        print(f"Saved weighted series to: {series_file}")
         metadata_file = output_dir / f"weather_{country}_metadata.json"
         with open(metadata_file, 'w') as f:
             json.dump(metadata, f, indent=2)
-        print(f"Metadata saved to: {metadata_file}")
+    return series, metadata
+
+def _stand_in_values(parameter, latitude, longitude, dates):
+    """Deterministic fake daily values: seasonal cycle plus per-day noise"""
+    days = (dates - pd.Timestamp('2000-01-01')).days.to_numpy()
+    noise = np.sin(days * 12.9898 + latitude * 78.233 + longitude * 37.719) * 43758.5453
+    noise = noise - np.floor(noise)
+    season = np.sin(2 * np.pi * dates.dayofyear.to_numpy() / 365.25)
+    values = {
+        'T2M': 22 + 3 * season + 2 * (noise - 0.5),
+        'T2M_MAX': 28 + 3 * season + 3 * noise,
+        'T2M_MIN': 15 + 2 * season - 3 * noise,
+        'PRECTOTCORR': np.maximum(0, 8 * season + 25 * noise - 15),
+        'RH2M': 65 + 15 * season + 10 * noise,
+        'WS2M': 1 + 3 * noise,
+    }.get(parameter, noise)
+    return np.round(values, 2)
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Answers POWER daily point requests with deterministic fake data"""
+    
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        try:
+            latitude = float(query['latitude'][0])
+            longitude = float(query['longitude'][0])
+            dates = pd.date_range(pd.Timestamp(query['start'][0]), pd.Timestamp(query['end'][0]))
+            parameters = query['parameters'][0].split(',')
+        except (KeyError, ValueError) as e:
+            self.send_error(400, f"Bad request: {e}")
+            return
         
-        return True
-    else:
-        print(f"Failed to download data for {country}")
-        return False
+        keys = dates.strftime('%Y%m%d')
+        body = json.dumps({
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [longitude, latitude]},
+            'properties': {'parameter': {
+                param: dict(zip(keys, _stand_in_values(param, latitude, longitude, dates).tolist()))
+                for param in parameters}},
+        }).encode('utf-8')
+        
+        with self.server.lock:
+            self.server.request_count += 1
+            fail = self.server.fail_every and self.server.request_count % self.server.fail_every == 0
+        if fail:
+            self.send_error(503, "Stand-in failure")
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_stand_in_server(port=0, fail_every=0):
+    """
+    Serve a local stand-in for the POWER daily point API in a background thread
+    
+    Args:
+        port (int): Port on 127.0.0.1 (0 = any free port)
+        fail_every (int): Answer every n-th request with HTTP 503 (0 = never)
+    
+    Returns:
+        tuple: (server, base_url); server.request_count counts the requests
+            served, server.shutdown() stops it
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), _StandInHandler)
+    server.request_count = 0
+    server.fail_every = fail_every
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/temporal/daily/point"
 
 def main():
     """Main function to download all weather data"""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cache-dir', type=Path, default=None,
+                        help='Response cache directory (default: data/cache/nasa_power)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Request every date range from the API')
+    parser.add_argument('--base-url', default=BASE_URL, help='API endpoint')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help='Concurrent downloads')
+    parser.add_argument('--rate', type=float, default=REQUESTS_PER_SECOND,
+                        help='Sustained API requests per second')
+    parser.add_argument('--no-regional', action='store_true',
+                        help='Skip REGIONAL_LOCATIONS')
+    parser.add_argument('--csv', action='store_true',
+                        help='Also write per-location weather_*.csv and metadata JSON files')
+    parser.add_argument('--grid', action='store_true',
+                        help='Grid mode: tile each country and store weighted series as '
+                             'grid_<country> (grids and --csv files go to raw/grid)')
+    parser.add_argument('--grid-resolution', type=float, default=GRID_RESOLUTION,
+                        help='Grid cell size in degrees')
+    parser.add_argument('--grid-weights', type=Path,
+                        help='CSV of latitude,longitude,weight points (default: cell area)')
+    parser.add_argument('--stand-in', action='store_true',
+                        help='Download from a local fake API into data/stand_in (no network)')
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help='Only run the local fake API on PORT until interrupted')
+    args = parser.parse_args()
+    
+    if args.serve is not None:
+        server, base_url = start_stand_in_server(args.serve)
+        print(f"Stand-in POWER API at {base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
+        return
+    
     print("="*60)
     print("NASA POWER Weather Data Download")
     print("="*60)
     print(f"Date range: {START_DATE} to {END_DATE}")
     print(f"Parameters: {', '.join(PARAMETERS)}")
     print(f"Countries: {', '.join(LOCATIONS.keys())}")
+    if not args.no_regional:
+        print(f"Regions: {', '.join(REGIONAL_LOCATIONS.keys())}")
     print("="*60)
     
     # Create output directory
     script_dir = Path(__file__).parent
     project_dir = script_dir.parent
-    output_dir = project_dir / "data" / "raw"
+    data_dir = project_dir / "data"
+    base_url = args.base_url
+    limiter = TokenBucket(args.rate, REQUEST_BURST)
+    server = None
+    if args.stand_in:
+        server, base_url = start_stand_in_server()
+        limiter = TokenBucket(1000, 1000)
+        data_dir = data_dir / "stand_in"
+        print(f"Using stand-in API at {base_url}")
+    output_dir = data_dir / "raw"
     output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = None if args.no_cache else (args.cache_dir or data_dir / "cache" / "nasa_power")
     
     print(f"\nOutput directory: {output_dir}")
+    print(f"Cache directory: {cache_dir}")
     
-    # Download data for each country
-    results = {}
-    for country, location_info in LOCATIONS.items():
-        success = download_country_data(country, location_info, output_dir)
-        results[country] = success
-        
-        # Be nice to the API - wait between requests
-        if country != list(LOCATIONS.keys())[-1]:  # Don't wait after last request
-            print("\nWaiting 2 seconds before next request...")
-            time.sleep(2)
+    # Download all points concurrently; regional and grid series go to
+    # subfolders so the per-country weather_*.csv files stay one per country
+    start = time.perf_counter()
+    if args.grid:
+        points = pd.read_csv(args.grid_weights) if args.grid_weights else None
+        downloads = {f"grid_{country}": download_country_grid(
+                         country, output_dir / "grid", args.grid_resolution, points, cache_dir,
+                         base_url, limiter, args.workers, args.csv)
+                     for country in COUNTRY_BOUNDS}
+    else:
+        downloads = download_all(LOCATIONS, output_dir, cache_dir, base_url, limiter,
+                                 args.workers, args.csv)
+        for download in downloads.values():
+            if download is not None:
+                download[1]['kind'] = 'country'
+        if not args.no_regional:
+            regional = download_all(REGIONAL_LOCATIONS, output_dir / "regional", cache_dir,
+                                    base_url, limiter, args.workers, args.csv)
+            for download in regional.values():
+                if download is not None:
+                    download[1]['kind'] = 'region'
+            downloads.update(regional)
+    
+    # All locations go to one memory-mapped store read by the analysis
+    # scripts; locations not downloaded in this run are kept
+    saved = {name: download for name, download in downloads.items() if download is not None}
+    if saved:
+        store_file = update_store(output_dir / STORE_FILE,
+                                  {name: df for name, (df, _) in saved.items()},
+                                  {name: metadata for name, (_, metadata) in saved.items()})
+        print(f"\nSaved {len(saved)} location(s) to weather store: {store_file}")
+    results = {name: download is not None for name, download in downloads.items()}
+    print(f"\nDownloaded {len(results)} location(s) in {time.perf_counter() - start:.1f}s")
+    
+    if server is not None:
+        print(f"\nStand-in API served {server.request_count} request(s)")
+        server.shutdown()
     
     # Summary
     print("\n" + "="*60)
@@ -231,7 +843,7 @@ def main():
         print(f"{country.upper()}: {status}")
     
     total_success = sum(results.values())
-    print(f"\nTotal: {total_success}/{len(results)} countries downloaded successfully")
+    print(f"\nTotal: {total_success}/{len(results)} locations downloaded successfully")
     
     if total_success == len(results):
         print("\n✓ All data downloaded successfully!")
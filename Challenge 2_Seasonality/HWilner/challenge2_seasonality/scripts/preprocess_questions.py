@@ -17,6 +17,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from collections import deque
 import re
 import json
 
@@ -65,6 +66,343 @@ TOPIC_KEYWORDS = {
     ]
 }
 
+# Topic matching: 'tokens' matches whole words/phrases, 'substring' matches anywhere
+MATCH_METHODS = ('tokens', 'substring')
+
+# Questions per block, and bytes per lane (lanes are scanned in lockstep)
+MATCH_CHUNK_ROWS = 250_000
+MATCH_LANE_BYTES = 1024
+
+# Multiplier of the 64-bit polynomial hash that interns tokens
+TOKEN_HASH_BASE = np.uint64(0x100000001B3)
+
+# Word characters of the Basic Multilingual Plane, as in a regex \w:
+# str.isalnum() or '_', indexed by code point
+WORD_CODE_POINTS = np.array([chr(c).isalnum() for c in range(0x10000)])
+WORD_CODE_POINTS[ord('_')] = True
+
+def _topic_mask_dtype(n_topics):
+    """Smallest unsigned dtype holding one bit per topic"""
+    for dtype in (np.uint16, np.uint32, np.uint64):
+        if n_topics <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"At most 64 topics are supported, got {n_topics}")
+
+def _utf8_blob(values):
+    """
+    Concatenate texts as UTF-8, each followed by a NUL byte
+    
+    Args:
+        values (numpy.ndarray): Object array of texts (non-strings become empty)
+    
+    Returns:
+        tuple: (uint8 array of bytes, int64 array of each text's first byte)
+    """
+    parts = [value.encode('utf-8') if isinstance(value, str) else b'' for value in values]
+    lengths = np.fromiter(map(len, parts), dtype=np.int64, count=len(parts))
+    starts = np.cumsum(lengths + 1) - lengths - 1
+    data = np.frombuffer(b'\x00'.join(parts) + b'\x00', dtype=np.uint8)
+    return data, starts
+
+def build_topic_automaton(topic_keywords):
+    """
+    Compile topic keywords into one Aho-Corasick automaton over UTF-8 bytes
+    
+    Matching is case-insensitive for ASCII letters and finds keywords
+    anywhere in the text, like the per-topic substring regexes it replaces.
+    Bytes that behave identically in every state share a byte class, which
+    keeps the transition table small enough to stay in cache.
+    
+    Args:
+        topic_keywords (dict): Topic name -> list of keywords
+    
+    Returns:
+        dict: 'topics' (list of names), 'byte_classes' (uint8[256]),
+            'transitions' (next state offset, indexed by state offset + byte
+            class), 'outputs' (topic bitmask of the next state, same
+            indexing) and 'depth' (longest keyword in bytes)
+    """
+    topics = list(topic_keywords)
+    mask_dtype = _topic_mask_dtype(len(topics))
+    
+    # Trie of lower-cased keywords; out[state] = topics of keywords ending there
+    goto = [{}]
+    out = [0]
+    for bit, topic in enumerate(topics):
+        for keyword in topic_keywords[topic]:
+            state = 0
+            for byte in keyword.lower().encode('utf-8'):
+                if byte not in goto[state]:
+                    goto[state][byte] = len(goto)
+                    goto.append({})
+                    out.append(0)
+                state = goto[state][byte]
+            out[state] |= 1 << bit
+    
+    # Breadth-first, each state inherits the transitions and outputs of its
+    # failure state (longest proper suffix that is also in the trie)
+    table = np.zeros((len(goto), 256), dtype=np.int64)
+    fail = [0] * len(goto)
+    queue = deque([0])
+    while queue:
+        state = queue.popleft()
+        if state:
+            table[state] = table[fail[state]]
+            out[state] |= out[fail[state]]
+        for byte, child in goto[state].items():
+            fail[child] = table[fail[state], byte] if state else 0
+            table[state, byte] = child
+            queue.append(child)
+    
+    upper = np.arange(ord('A'), ord('Z') + 1)
+    table[:, upper] = table[:, upper + 32]
+    
+    columns, byte_classes = np.unique(table, axis=1, return_inverse=True)
+    n_classes = columns.shape[1]
+    offset_dtype = np.int16 if len(goto) * n_classes < 2**15 else np.int32
+    
+    return {
+        'topics': topics,
+        'byte_classes': byte_classes.reshape(-1).astype(np.uint8),
+        'transitions': (columns * n_classes).astype(offset_dtype).ravel(),
+        'outputs': np.array(out, dtype=mask_dtype)[columns].ravel(),
+        'depth': max(len(keyword.encode('utf-8'))
+                     for keywords in topic_keywords.values() for keyword in keywords),
+    }
+
+def _scan_topic_hits(values, automaton):
+    """
+    Run the automaton once over a block of texts
+    
+    Args:
+        values (numpy.ndarray): Object array of texts (non-strings match nothing)
+        automaton (dict): Output of build_topic_automaton
+    
+    Returns:
+        numpy.ndarray: Topic bitmask per text
+    """
+    transitions, outputs = automaton['transitions'], automaton['outputs']
+    if len(values) == 0:
+        return np.zeros(0, dtype=outputs.dtype)
+    
+    # NUL separators send the automaton back to its root between texts
+    data, starts = _utf8_blob(values)
+    data = automaton['byte_classes'][data]
+    
+    # Cut the buffer into lanes advanced in lockstep. The automaton state only
+    # depends on the last `depth` bytes, so each lane first replays that many
+    # bytes from the end of the previous lane.
+    lane, depth = MATCH_LANE_BYTES, automaton['depth']
+    n_lanes = -(-len(data) // lane)
+    padded = np.zeros(depth + n_lanes * lane, dtype=transitions.dtype)
+    padded[depth:depth + len(data)] = data
+    windows = np.ascontiguousarray(np.lib.stride_tricks.as_strided(
+        padded, shape=(depth + lane, n_lanes),
+        strides=(padded.itemsize, lane * padded.itemsize)))
+    
+    state = np.zeros(n_lanes, dtype=transitions.dtype)
+    index = np.empty_like(state)
+    found = np.empty((lane, n_lanes), dtype=outputs.dtype)
+    for step in range(depth):
+        np.add(state, windows[step], out=index)
+        np.take(transitions, index, out=state)
+    for step in range(lane):
+        np.add(state, windows[depth + step], out=index)
+        np.take(transitions, index, out=state)
+        np.take(outputs, index, out=found[step])
+    
+    return np.bitwise_or.reduceat(found.T.ravel()[:len(data)], starts)
+
+def _hash_tokens(values):
+    """
+    Split a block of texts into word tokens and hash each token
+    
+    Tokens are runs of word characters (WORD_CODE_POINTS, the same as a
+    regex \w), lower-cased for ASCII; everything else separates tokens,
+    so "price€" and "maize🌽" contain the tokens price and maize.
+    Characters outside the Basic Multilingual Plane (emoji) are always
+    separators. An apostrophe (' or ’) between two word characters is a
+    token of its own ("'"), so "plant's" is plant ' s: plant still
+    matches, and keywords with an apostrophe ("y'obudde") match as the
+    phrase y ' obudde but not "y obudde".
+    
+    Args:
+        values (numpy.ndarray): Object array of texts (non-strings have no tokens)
+    
+    Returns:
+        tuple: (uint64 hash per token in text order, int64 token count per text)
+    """
+    data, starts = _utf8_blob(values)
+    n_bytes = len(data)
+    
+    lower = np.arange(256, dtype=np.uint8)
+    lower[ord('A'):ord('Z') + 1] += 32
+    data = lower[data]
+    word = WORD_CODE_POINTS[data]
+    
+    # Non-ASCII characters: decode the code point at each 2- and 3-byte
+    # lead byte and mark all its bytes; 4-byte characters stay separators
+    padded = np.concatenate([data, [0, 0]]).astype(np.int64)
+    next1, next2 = padded[1:n_bytes + 1], padded[2:n_bytes + 2]
+    two = np.flatnonzero((data >= 0xC0) & (data < 0xE0))
+    three = np.flatnonzero((data >= 0xE0) & (data < 0xF0))
+    two_word = WORD_CODE_POINTS[((padded[two] & 0x1F) << 6) | (next1[two] & 0x3F)]
+    three_word = WORD_CODE_POINTS[((padded[three] & 0x0F) << 12)
+                                  | ((next1[three] & 0x3F) << 6) | (next2[three] & 0x3F)]
+    word[data >= 0x80] = False
+    for offset in (0, 1):
+        word[two + offset] = two_word
+    for offset in (0, 1, 2):
+        word[three + offset] = three_word
+    curly = three[(data[three] == 0xE2) & (next1[three] == 0x80) & (next2[three] == 0x99)]
+    
+    # Apostrophes between word characters become one-character tokens (’ is
+    # hashed as '); the texts end in NUL, so the byte after one always exists
+    straight = np.flatnonzero(data == ord("'"))
+    straight = straight[(straight > 0) & word[straight - 1] & word[straight + 1]]
+    curly = curly[(curly > 0) & word[curly - 1] & word[curly + 3]]
+    word[straight] = True
+    for offset in (0, 1, 2):
+        word[curly + offset] = True
+    data[curly] = ord("'")
+    hashed = word.copy()
+    hashed[curly + 1] = hashed[curly + 2] = False
+    
+    is_start = word & ~np.concatenate([[False], word[:-1]])
+    for apostrophes, width in ((straight, 1), (curly, 3)):
+        is_start[apostrophes] = is_start[apostrophes + width] = True
+    token_starts = np.flatnonzero(is_start)
+    counts = np.diff(np.searchsorted(token_starts, np.append(starts, n_bytes)))
+    if len(token_starts) == 0:
+        return np.zeros(0, dtype=np.uint64), counts
+    
+    # Polynomial hash over the hashed bytes of each token (wraps mod 2**64);
+    # a token never starts with a skipped byte, so its start is hashed
+    positions = np.flatnonzero(hashed)
+    first = np.flatnonzero(is_start[positions])
+    lengths = np.diff(np.append(first, len(positions)))
+    powers = np.ones(lengths.max(), dtype=np.uint64)
+    powers[1:] = np.cumprod(np.full(len(powers) - 1, TOKEN_HASH_BASE))
+    exponents = np.repeat(first + lengths, lengths) - 1 - np.arange(len(positions))
+    values = (data[positions].astype(np.uint64) + np.uint64(1)) * powers[exponents]
+    
+    return np.add.reduceat(values, first), counts
+
+def tokenize_questions(texts):
+    """
+    Tokenize texts once into an interned token-id array
+    
+    Tokens are interned by a 64-bit hash of their bytes, so the vocabulary
+    is an array of hashes; keywords tokenized the same way are looked up
+    in it (see match_topic_tokens).
+    
+    Args:
+        texts (pandas.Series): Question texts
+    
+    Returns:
+        dict: 'token_ids' (int64, all tokens in text order), 'offsets'
+            (int64, len(texts) + 1; text i has tokens
+            token_ids[offsets[i]:offsets[i + 1]]) and 'vocab' (uint64
+            hash of each distinct token, indexed by id)
+    """
+    values = texts.to_numpy(dtype=object)
+    
+    hashes, counts = [np.zeros(0, dtype=np.uint64)], [np.zeros(0, dtype=np.int64)]
+    for start in range(0, len(values), MATCH_CHUNK_ROWS):
+        block_hashes, block_counts = _hash_tokens(values[start:start + MATCH_CHUNK_ROWS])
+        hashes.append(block_hashes)
+        counts.append(block_counts)
+    
+    token_ids, vocab = pd.factorize(np.concatenate(hashes))
+    offsets = np.concatenate([[0], np.cumsum(np.concatenate(counts))])
+    return {'token_ids': token_ids.astype(np.int64), 'offsets': offsets, 'vocab': vocab}
+
+def match_topic_tokens(tokens, topic_keywords=TOPIC_KEYWORDS):
+    """
+    Flag the topics whose keywords occur as whole words in each text
+    
+    Keywords without a space also match their plural in -s/-es; keywords
+    of several tokens ('poor growth', "embeera y'obudde") match
+    consecutive tokens.
+    
+    Args:
+        tokens (dict): Output of tokenize_questions
+        topic_keywords (dict): Topic name -> list of keywords
+    
+    Returns:
+        numpy.ndarray: Topic bitmask per text (bit i = i-th topic)
+    """
+    topics = list(topic_keywords)
+    mask_dtype = _topic_mask_dtype(len(topics))
+    token_ids, offsets = tokens['token_ids'], tokens['offsets']
+    vocab = pd.Index(tokens['vocab'])
+    
+    keywords = [(1 << bit, keyword) for bit, topic in enumerate(topics)
+                for keyword in topic_keywords[topic]]
+    variants = [(bit, form) for bit, keyword in keywords
+                for form in ([keyword] if ' ' in keyword
+                             else [keyword, f'{keyword}s', f'{keyword}es'])]
+    variant_tokens = tokenize_questions(pd.Series([form for _, form in variants], dtype=object))
+    
+    # Precomputed keyword-id sets: topic bitmask per vocabulary id
+    vocab_masks = np.zeros(len(vocab) + 1, dtype=mask_dtype)
+    phrases = []
+    for i, (bit, _) in enumerate(variants):
+        lo, hi = variant_tokens['offsets'][i:i + 2]
+        ids = vocab.get_indexer(variant_tokens['vocab'][variant_tokens['token_ids'][lo:hi]])
+        if hi - lo == 1 and ids[0] >= 0:
+            vocab_masks[ids[0]] |= mask_dtype(bit)
+        elif hi - lo > 1 and (ids >= 0).all():
+            phrases.append((bit, ids))
+    
+    # Id -1 (the sentinel) pads the end so empty texts reduce to 0
+    token_masks = vocab_masks[np.append(token_ids, -1)]
+    hits = np.bitwise_or.reduceat(token_masks, offsets[:-1]) if len(offsets) > 1 \
+        else np.zeros(0, dtype=mask_dtype)
+    hits[np.diff(offsets) == 0] = 0
+    
+    # Phrases: runs of consecutive ids within one text
+    for bit, ids in phrases:
+        candidates = np.flatnonzero(token_ids[:len(token_ids) - len(ids) + 1] == ids[0])
+        for step, token_id in enumerate(ids[1:], 1):
+            candidates = candidates[token_ids[candidates + step] == token_id]
+        rows = np.searchsorted(offsets, candidates, side='right') - 1
+        rows = rows[candidates + len(ids) <= offsets[rows + 1]]
+        hits[rows] |= mask_dtype(bit)
+    
+    return hits
+
+def match_topics(texts, topic_keywords=TOPIC_KEYWORDS, method='tokens'):
+    """
+    Flag the topics whose keywords occur in each text, in a single pass
+    
+    Args:
+        texts (pandas.Series): Question texts
+        topic_keywords (dict): Topic name -> list of keywords
+        method (str): 'tokens' matches whole words and phrases (so 'ant' does
+            not match 'plant'); 'substring' matches keywords anywhere, like
+            the original per-topic regexes
+    
+    Returns:
+        pandas.DataFrame: Boolean topic_<name> column per topic, on texts.index
+    """
+    if method not in MATCH_METHODS:
+        raise ValueError(f"method must be one of {MATCH_METHODS}, got {method!r}")
+    
+    if method == 'tokens':
+        hits = match_topic_tokens(tokenize_questions(texts), topic_keywords)
+    else:
+        automaton = build_topic_automaton(topic_keywords)
+        values = texts.to_numpy(dtype=object)
+        hits = np.zeros(len(values), dtype=automaton['outputs'].dtype)
+        for start in range(0, len(values), MATCH_CHUNK_ROWS):
+            block = values[start:start + MATCH_CHUNK_ROWS]
+            hits[start:start + len(block)] = _scan_topic_hits(block, automaton)
+    
+    return pd.DataFrame({f'topic_{topic}': (hits >> np.uint8(bit)) & 1 == 1
+                         for bit, topic in enumerate(topic_keywords)},
+                        index=texts.index)
+
 def load_question_data(file_path):
     """
     Load WeFarm question data
@@ -167,13 +505,14 @@ def parse_timestamps(df, timestamp_column='timestamp'):
         print(f"Error parsing timestamps: {e}")
         return df
 
-def categorize_questions(df, text_column='question_text'):
+def categorize_questions(df, text_column='question_text', method='tokens'):
     """
     Categorize questions by topic using keyword matching
     
     Args:
         df (pandas.DataFrame): Question data
         text_column (str): Name of question text column
+        method (str): Keyword matching, see match_topics
     
     Returns:
         pandas.DataFrame: Data with topic categories
@@ -186,16 +525,10 @@ def categorize_questions(df, text_column='question_text'):
         print("Please update the script with the correct column name")
         return df
     
-    # Initialize topic columns
-    for topic in TOPIC_KEYWORDS.keys():
-        df[f'topic_{topic}'] = False
-    
-    # Categorize based on keywords
-    for topic, keywords in TOPIC_KEYWORDS.items():
-        pattern = '|'.join(keywords)
-        df[f'topic_{topic}'] = df[text_column].str.contains(
-            pattern, case=False, na=False, regex=True
-        )
+    # Categorize based on keywords: one pass over the text for all topics
+    topic_hits = match_topics(df[text_column], TOPIC_KEYWORDS, method=method)
+    for col in topic_hits.columns:
+        df[col] = topic_hits[col]
     
     # Count questions per topic
     print("\nQuestions per topic:")
@@ -230,47 +563,28 @@ def aggregate_by_time(df):
     
     aggregated = {}
     
-    # Daily aggregation
-    daily = df.groupby(df['datetime'].dt.date).agg({
-        'datetime': 'count'  # Count questions per day
-    }).rename(columns={'datetime': 'question_count'})
-    
-    # Add topic counts
+    # Daily aggregation: one groupby over all topic columns at once
     topic_cols = [col for col in df.columns if col.startswith('topic_')]
-    for col in topic_cols:
-        topic_name = col.replace('topic_', '')
-        daily[f'{topic_name}_count'] = df.groupby(df['datetime'].dt.date)[col].sum()
+    days = df['datetime'].dt.normalize()
+    grouped = df[topic_cols].groupby(days)
+    
+    daily = grouped.sum().rename(
+        columns={col: f"{col.replace('topic_', '')}_count" for col in topic_cols})
+    daily.insert(0, 'question_count', grouped.size())
     
     aggregated['daily'] = daily
     print(f"Daily: {len(daily)} days")
     
-    # Weekly aggregation
-    weekly = df.groupby(df['datetime'].dt.to_period('W')).agg({
-        'datetime': 'count'
-    }).rename(columns={'datetime': 'question_count'})
-    
-    for col in topic_cols:
-        topic_name = col.replace('topic_', '')
-        weekly[f'{topic_name}_count'] = df.groupby(
-            df['datetime'].dt.to_period('W')
-        )[col].sum()
-    
-    aggregated['weekly'] = weekly
-    print(f"Weekly: {len(weekly)} weeks")
-    
-    # Monthly aggregation
-    monthly = df.groupby(df['datetime'].dt.to_period('M')).agg({
-        'datetime': 'count'
-    }).rename(columns={'datetime': 'question_count'})
-    
-    for col in topic_cols:
-        topic_name = col.replace('topic_', '')
-        monthly[f'{topic_name}_count'] = df.groupby(
-            df['datetime'].dt.to_period('M')
-        )[col].sum()
-    
-    aggregated['monthly'] = monthly
-    print(f"Monthly: {len(monthly)} months")
+    # Weekly and monthly rollups are resampled from the daily table,
+    # keeping only periods with questions (as a groupby would)
+    for period, freq, label in [('weekly', 'W', 'W'), ('monthly', 'MS', 'M')]:
+        rollup = daily.resample(freq).sum()
+        rollup = rollup[rollup['question_count'] > 0]
+        rollup.index = rollup.index.to_period(label)
+        aggregated[period] = rollup
+    
+    print(f"Weekly: {len(aggregated['weekly'])} weeks")
+    print(f"Monthly: {len(aggregated['monthly'])} months")
     
     return aggregated
 
@@ -10,6 +10,8 @@ import seaborn as sns
 from pathlib import Path
 from scipy import stats
 
+from weather_store import open_store
+
 print("="*70)
 print("CHALLENGE 1: QUICK ANALYSIS (Sample Data)")
 print("="*70)
@@ -45,7 +47,12 @@ daily.to_csv(data_dir / "processed" / "questions_daily_sample.csv", index=False)
 
 # Load weather data
 print("\n[4/5] Loading weather data...")
-weather_kenya = pd.read_csv(data_dir / "raw" / "weather_kenya.csv", index_col=0, parse_dates=True)
+weather_store = open_store(data_dir / "raw")
+if weather_store is None or 'kenya' not in weather_store.locations:
+    print("Error: No Kenya weather data found")
+    print("Please run download_weather_data.py first")
+    raise SystemExit(1)
+weather_kenya = weather_store.frame('kenya')
 print(f"Kenya weather: {len(weather_kenya)} days")
 
 # Merge Kenya data
@@ -119,9 +126,8 @@ weather_files = [
 ]
 
 for idx, (country_name, country_code) in enumerate(weather_files):
-    weather_file = data_dir / "raw" / f"weather_{country_name}.csv"
-    if weather_file.exists():
-        df_weather = pd.read_csv(weather_file, index_col=0, parse_dates=True)
+    if country_name in weather_store.locations:
+        df_weather = weather_store.frame(country_name)
         axes[idx].plot(df_weather.index, df_weather['PRECTOTCORR'], 
                       color='blue', alpha=0.6, linewidth=0.8)
         axes[idx].set_title(f'{country_name.upper()}: Daily Precipitation (2015-2022)')
@@ -12,10 +12,12 @@ matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
-from scipy import stats
 from datetime import datetime
 import json
 
+from calculate_correlations import correlation_table
+from weather_store import open_store
+
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
@@ -96,13 +98,12 @@ print("\n[3/6] Loading weather data...")
 
 weather_data = {}
 country_map = {'kenya': 'ke', 'uganda': 'ug', 'tanzania': 'tz'}
+weather_store = open_store(data_dir / "raw")
 
 for country_name, country_code in country_map.items():
-    weather_file = data_dir / "raw" / f"weather_{country_name}.csv"
-    if weather_file.exists():
-        df_weather = pd.read_csv(weather_file, index_col=0, parse_dates=True)
+    if weather_store is not None and country_name in weather_store.locations:
+        df_weather = weather_store.frame(country_name)
         df_weather['country_code'] = country_code
-        df_weather['date'] = df_weather.index.date
         weather_data[country_code] = df_weather
         print(f"  {country_name.upper()}: {len(df_weather)} days")
 
@@ -153,20 +154,8 @@ question_vars = ['question_count']
 topic_cols = [col for col in merged_df.columns if col.startswith('topic_')]
 question_vars.extend(topic_cols)
 
-correlations = {}
-for q_var in question_vars:
-    correlations[q_var] = {}
-    for w_var in weather_vars:
-        if q_var in merged_df.columns and w_var in merged_df.columns:
-            valid_data = merged_df[[q_var, w_var]].dropna()
-            if len(valid_data) > 10:
-                corr, p_val = stats.pearsonr(valid_data[q_var], valid_data[w_var])
-                correlations[q_var][w_var] = {
-                    'correlation': float(corr),
-                    'p_value': float(p_val),
-                    'significant': p_val < 0.05,
-                    'n': len(valid_data)
-                }
+# All pairs in one pass, each over its complete rows (more than 10 required)
+correlations = correlation_table(merged_df, question_vars, weather_vars, min_n=11)
 
 # Save correlations
 corr_output = data_dir / "processed" / "correlations.json"
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Weather Store
+
+One binary file holding the daily weather of every downloaded location:
+a JSON header (dates, locations, parameters and the per-location download
+metadata) followed by a float32 array of shape (date x location x
+parameter). The array is memory-mapped, so slicing a location and date
+range reads only those bytes and returns views, not copies.
+
+File layout:
+    8 bytes   STORE_MAGIC
+    8 bytes   header length (little-endian uint64)
+    header    UTF-8 JSON, space-padded so the array starts on a
+              STORE_ALIGNMENT boundary
+    array     little-endian float32, C order (date, location, parameter)
+
+open_store() rebuilds the file whenever a weather CSV is newer than it
+or missing from it, so CSVs written or edited after the last download
+(--csv, --grid or by hand) are picked up without running this script.
+
+Usage:
+    python3 weather_store.py                 # build from data/raw CSVs
+    python3 weather_store.py --info
+    python3 weather_store.py --check         # check updates keep other locations
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+STORE_FILE = "weather_store.bin"
+STORE_MAGIC = b'WXSTORE1'
+STORE_ALIGNMENT = 64
+STORE_DTYPE = np.dtype('<f4')
+# Constant per location, so kept in the metadata rather than the array
+LOCATION_COLUMNS = ['latitude', 'longitude']
+# (kind, subfolder of raw_dir, location name prefix) searched for weather_*.csv
+SOURCE_FOLDERS = [('country', '.', ''), ('region', 'regional', ''), ('grid', 'grid', 'grid_')]
+
+def write_store(path, frames, metadata=None):
+    """
+    Write daily weather frames to a store file
+
+    All frames are aligned on one daily date range (the union of their
+    indexes); days a location lacks are stored as NaN. LOCATION_COLUMNS
+    are not stored as parameters.
+
+    Args:
+        path (Path): Output file
+        frames (dict): Location name -> DataFrame with a date index and
+            one column per parameter
+        metadata (dict): Location name -> JSON-serialisable metadata
+
+    Returns:
+        Path: The written file
+    """
+    locations = list(frames)
+    parameters = list(dict.fromkeys(col for df in frames.values() for col in df.columns
+                                    if col not in LOCATION_COLUMNS))
+    start = min(df.index.min() for df in frames.values()).normalize()
+    end = max(df.index.max() for df in frames.values()).normalize()
+    dates = pd.date_range(start, end, freq='D')
+
+    values = np.full((len(dates), len(locations), len(parameters)), np.nan, dtype=STORE_DTYPE)
+    for i, name in enumerate(locations):
+        df = frames[name].reindex(index=dates, columns=parameters)
+        values[:, i, :] = df.to_numpy(dtype=STORE_DTYPE, na_value=np.nan)
+
+    header = {
+        'version': 1,
+        'dtype': STORE_DTYPE.str,
+        'shape': list(values.shape),
+        'start_date': dates[0].strftime('%Y-%m-%d'),
+        'locations': locations,
+        'parameters': parameters,
+        'metadata': {name: (metadata or {}).get(name, {}) for name in locations}
+    }
+    header_bytes = json.dumps(header, default=str).encode('utf-8')
+    data_offset = -(-(16 + len(header_bytes)) // STORE_ALIGNMENT) * STORE_ALIGNMENT
+    header_bytes = header_bytes.ljust(data_offset - 16)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(STORE_MAGIC)
+        f.write(np.uint64(len(header_bytes)).tobytes())
+        f.write(header_bytes)
+        f.write(values.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+def update_store(path, frames, metadata=None):
+    """
+    Write locations into a store file, keeping the locations it already has
+
+    Locations in frames replace stored ones of the same name; the others
+    (e.g. grid_<country> series when only points were downloaded) are
+    carried over unchanged.
+
+    Args:
+        path (Path): Store file (created if missing)
+        frames (dict): Location name -> DataFrame, as for write_store
+        metadata (dict): Location name -> JSON-serialisable metadata
+
+    Returns:
+        Path: The written file
+    """
+    path = Path(path)
+    merged, merged_metadata = {}, {}
+    if path.exists():
+        existing = WeatherStore(path)
+        for name in existing.locations:
+            merged[name] = existing.frame(name).copy()
+            merged_metadata[name] = existing.metadata[name]
+        del existing
+    merged.update(frames)
+    merged_metadata.update({name: (metadata or {}).get(name, {}) for name in frames})
+    return write_store(path, merged, merged_metadata)
+
+def source_files(raw_dir):
+    """
+    Weather CSV files that build_store reads
+
+    Country series are raw_dir/weather_<name>.csv, regional series are in
+    regional/, and grid-mode weighted series are in grid/ (stored as
+    grid_<country>, so they don't replace the point series).
+
+    Args:
+        raw_dir (Path): Directory with the downloaded weather files
+
+    Returns:
+        list: (kind, location name, CSV path) tuples
+    """
+    raw_dir = Path(raw_dir)
+    return [(kind, prefix + file.stem.replace('weather_', '', 1), file)
+            for kind, folder, prefix in SOURCE_FOLDERS
+            for file in sorted((raw_dir / folder).glob("weather_*.csv"))]
+
+def build_store(raw_dir, path=None):
+    """
+    Build a store from per-location weather CSV and metadata JSON files
+
+    Reads every file from source_files(raw_dir), with
+    weather_<name>_metadata.json if present. Locations already in an
+    existing store at path but without a CSV (downloads saved without
+    --csv) are kept.
+
+    Args:
+        raw_dir (Path): Directory with the downloaded weather files
+        path (Path): Output file (default: raw_dir / STORE_FILE)
+
+    Returns:
+        Path: The written file, or None if there are no weather files
+    """
+    raw_dir = Path(raw_dir)
+    path = Path(path or raw_dir / STORE_FILE)
+    frames, metadata = {}, {}
+    for kind, name, file in source_files(raw_dir):
+        frames[name] = pd.read_csv(file, index_col=0, parse_dates=True)
+        metadata[name] = {}
+        metadata_file = file.with_name(f"{file.stem}_metadata.json")
+        if metadata_file.exists():
+            with open(metadata_file) as f:
+                metadata[name] = json.load(f)
+        metadata[name]['kind'] = kind
+
+    if not frames and not path.exists():
+        return None
+    return update_store(path, frames, metadata)
+
+class WeatherStore:
+    """
+    Read-only, memory-mapped view of a store file
+
+    Args:
+        path (Path): Store file written by write_store
+
+    Attributes:
+        values (numpy.memmap): (date x location x parameter) float32 array
+        dates (pandas.DatetimeIndex): Daily dates of the first axis
+        locations (list): Location names of the second axis
+        parameters (list): Parameter names of the third axis
+        metadata (dict): Location name -> download metadata
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            if f.read(8) != STORE_MAGIC:
+                raise ValueError(f"{self.path} is not a weather store")
+            header_length = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+            header = json.loads(f.read(header_length))
+
+        self.locations = header['locations']
+        self.parameters = header['parameters']
+        self.metadata = header['metadata']
+        self.dates = pd.date_range(header['start_date'], periods=header['shape'][0], freq='D')
+        self.values = np.memmap(self.path, dtype=np.dtype(header['dtype']), mode='r',
+                                offset=16 + header_length, shape=tuple(header['shape']))
+        self._location_index = {name: i for i, name in enumerate(self.locations)}
+
+    def __repr__(self):
+        return (f"WeatherStore({str(self.path)!r}, {len(self.dates)} days x "
+                f"{len(self.locations)} locations x {len(self.parameters)} parameters)")
+
+    def locations_of_kind(self, kind):
+        """Location names whose metadata 'kind' is kind ('country', 'region' or 'grid')"""
+        return [name for name in self.locations if self.metadata[name].get('kind') == kind]
+
+    def _date_slice(self, start=None, end=None):
+        """Positional slice of the date axis covering start..end (inclusive)"""
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), 'left')
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end),
+                                                                         'right')
+        return slice(lo, hi)
+
+    def _parameter_index(self, parameters):
+        """Slice (a view) for contiguous parameters, else an index array (a copy)"""
+        if parameters is None:
+            return slice(None), self.parameters
+        positions = [self.parameters.index(p) for p in parameters]
+        if positions == list(range(positions[0], positions[0] + len(positions))):
+            return slice(positions[0], positions[0] + len(positions)), list(parameters)
+        return np.array(positions), list(parameters)
+
+    def array(self, location, start=None, end=None, parameters=None):
+        """
+        Date x parameter array for one location
+
+        Args:
+            location (str): Location name
+            start (str or Timestamp): First date (default: first stored)
+            end (str or Timestamp): Last date, inclusive (default: last stored)
+            parameters (list): Parameter names (default: all)
+
+        Returns:
+            numpy.ndarray: View into the mapped file unless parameters are
+                non-contiguous
+        """
+        param_index, _ = self._parameter_index(parameters)
+        return self.values[self._date_slice(start, end), self._location_index[location],
+                           param_index]
+
+    def frame(self, location, start=None, end=None, parameters=None):
+        """
+        Weather DataFrame for one location (weather_<name>.csv without the
+        latitude/longitude columns)
+
+        Args:
+            location (str): Location name
+            start (str or Timestamp): First date (default: first stored)
+            end (str or Timestamp): Last date, inclusive (default: last stored)
+            parameters (list): Parameter names (default: all)
+
+        Returns:
+            pandas.DataFrame: Date index, one column per parameter, backed
+                by the mapped file
+        """
+        dates = self.dates[self._date_slice(start, end)]
+        _, columns = self._parameter_index(parameters)
+        df = pd.DataFrame(self.array(location, start, end, parameters), index=dates,
+                          columns=columns, copy=False)
+        df.index.name = 'date'
+        return df
+
+def open_store(raw_dir):
+    """
+    Open raw_dir's weather store, (re)building it from CSV files first if
+    it is missing, or a source CSV is newer than it or not in it
+
+    Args:
+        raw_dir (Path): Directory with the downloaded weather files
+
+    Returns:
+        WeatherStore: The store, or None if there is no weather data
+    """
+    path = Path(raw_dir) / STORE_FILE
+    sources = source_files(raw_dir)
+    if path.exists():
+        built = path.stat().st_mtime
+        store = WeatherStore(path)
+        if all(file.stat().st_mtime <= built and name in store.locations
+               for _, name, file in sources):
+            return store
+        del store
+    if build_store(raw_dir, path) is None:
+        return None
+    return WeatherStore(path)
+
+def check_store_updates():
+    """
+    Check that writing some locations keeps the others in the store
+
+    Builds a store from a grid-mode CSV, then writes point locations as
+    download_weather_data.py does, and checks the grid series survives
+    that, and that open_store picks up CSVs that are newer than the store
+    or older but missing from it.
+    """
+    dates = pd.date_range('2020-01-01', periods=30, freq='D')
+    series = lambda value: pd.DataFrame({'T2M': np.full(len(dates), value)}, index=dates)
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_dir = Path(tmp)
+        (raw_dir / "grid").mkdir()
+        series(1.0).to_csv(raw_dir / "grid" / "weather_kenya.csv")
+        build_store(raw_dir)
+
+        update_store(raw_dir / STORE_FILE, {'kenya': series(2.0)}, {'kenya': {'kind': 'country'}})
+        store = open_store(raw_dir)
+        if store.locations_of_kind('grid') != ['grid_kenya'] or \
+                store.locations_of_kind('country') != ['kenya']:
+            raise AssertionError(f"a point update dropped locations: {store.locations}")
+        if not (store.frame('grid_kenya')['T2M'] == 1.0).all():
+            raise AssertionError("a point update changed the grid series")
+
+        series(3.0).to_csv(raw_dir / "weather_uganda.csv")
+        os.utime(raw_dir / "weather_uganda.csv", (2e9, 2e9))
+        series(4.0).to_csv(raw_dir / "grid" / "weather_uganda.csv")
+        os.utime(raw_dir / "grid" / "weather_uganda.csv", (1e9, 1e9))
+        store = open_store(raw_dir)
+        if sorted(store.locations) != ['grid_kenya', 'grid_uganda', 'kenya', 'uganda']:
+            raise AssertionError(f"a rebuild dropped locations: {store.locations}")
+    print("✓ Grid and point locations survive updates and rebuilds")
+
+def main():
+    """Build or describe data/raw/weather_store.bin"""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--raw-dir', type=Path,
+                        default=Path(__file__).parent.parent / "data" / "raw",
+                        help='Directory with the downloaded weather files')
+    parser.add_argument('--info', action='store_true',
+                        help='Describe the existing store instead of rebuilding it')
+    parser.add_argument('--check', action='store_true',
+                        help='Check on a temporary store that updates keep other locations')
+    args = parser.parse_args()
+
+    if args.check:
+        check_store_updates()
+        return
+
+    if not args.info:
+        path = build_store(args.raw_dir)
+        if path is None:
+            print(f"Error: No weather files found in {args.raw_dir}")
+            print("Please run download_weather_data.py first")
+            return
+        print(f"Built {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+    store = WeatherStore(args.raw_dir / STORE_FILE)
+    print(store)
+    print(f"Date range: {store.dates[0].date()} to {store.dates[-1].date()}")
+    print(f"Parameters: {', '.join(store.parameters)}")
+    for name in store.locations:
+        kind = store.metadata[name].get('kind', '?')
+        missing = int(np.isnan(store.array(name)).sum())
+        print(f"  {name} ({kind}): {missing} missing values")
+
+if __name__ == "__main__":
+    main()
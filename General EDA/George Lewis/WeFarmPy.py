@@ -1,11 +1,164 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import copy
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
 import warnings
 from matplotlib import pyplot as plt
 warnings.filterwarnings('ignore')
 
+def _write_arrow(df: pd.DataFrame, path: Union[str, Path]) -> Dict[str, pd.Series]:
+    """
+    Write a frame's Arrow-compatible columns to an Arrow IPC file
+    
+    Python-object columns are returned instead of written, since Arrow
+    would turn their NaN values into None and break exact round-trips.
+    
+    Args:
+        df: Frame to write (index is not stored)
+        path: Destination .arrow file
+        
+    Returns:
+        Object-dtype columns by name, for the caller to pass on directly
+    """
+    import pyarrow as pa
+    
+    object_cols = {col: df[col] for col in df.columns if df[col].dtype == object}
+    table = pa.Table.from_pandas(df.drop(columns=list(object_cols)), preserve_index=False)
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return object_cols
+
+
+def _read_arrow(path: Union[str, Path], object_cols: Dict[str, pd.Series],
+                columns: List[str]) -> pd.DataFrame:
+    """
+    Read a frame written by `_write_arrow` (memory-mapped, no deserialisation copy)
+    
+    Args:
+        path: Arrow IPC file
+        object_cols: Object-dtype columns returned by `_write_arrow`
+        columns: Column order of the original frame
+        
+    Returns:
+        Frame with a fresh RangeIndex
+    """
+    import pyarrow as pa
+    
+    with pa.memory_map(str(path), 'r') as source:
+        df = pa.ipc.open_file(source).read_all().to_pandas()
+    for col, series in object_cols.items():
+        df[col] = series.to_numpy()
+    return df[columns]
+
+
+def _enrich_partition(processor: 'DataCleaning', in_path: str,
+                      object_cols: Dict[str, pd.Series], columns: List[str],
+                      out_path: str) -> Tuple[Dict[str, pd.Series], List[str], List[str]]:
+    """
+    Process-pool worker: run the enrichment steps on one row partition
+    
+    Args:
+        processor: Quiet, serial copy of the calling DataCleaning instance
+        in_path: Arrow IPC file holding the partition's step input columns
+        object_cols: Object-dtype input columns
+        columns: Input column order
+        out_path: Arrow IPC file for the new and overwritten columns
+        
+    Returns:
+        Tuple of (object-dtype output columns, output column order, worker log)
+    """
+    df = _read_arrow(in_path, object_cols, columns)
+    overwritten = processor._overwritten_columns(df)
+    df = processor._run_steps(df)
+    
+    out_columns = [col for col in df.columns if col not in columns or col in overwritten]
+    out_object_cols = _write_arrow(df[out_columns], out_path)
+    return out_object_cols, out_columns, processor.processing_log
+
+
+def _render_figure(name: str, cube: 'AggregateCube', out_dir: str,
+                   formats: Tuple[str, ...], dpi: int,
+                   headless: bool = True) -> Tuple[str, float, List[str], Optional[str]]:
+    """
+    Render one EDA overview figure to files (process-pool worker)
+    
+    Args:
+        name: EDA plot method, e.g. 'plot_temporal_overview'
+        cube: Materialized AggregateCube of the processed data
+        out_dir: Output directory
+        formats: File formats, e.g. ('png', 'svg')
+        dpi: Raster resolution
+        headless: Switch this process to the Agg backend first
+        
+    Returns:
+        Tuple of (name, render seconds, written file names, error message or None)
+    """
+    if headless:
+        plt.switch_backend('Agg')
+    
+    start = time.perf_counter()
+    try:
+        fig = getattr(EDA, name)(cube)
+    except Exception as e:  # e.g. a missing optional plotting dependency
+        return name, time.perf_counter() - start, [], f"{type(e).__name__}: {e}"
+    
+    files = []
+    for fmt in formats:
+        file_name = f"{name.replace('plot_', '')}.{fmt}"
+        fig.savefig(os.path.join(out_dir, file_name), format=fmt, dpi=dpi, bbox_inches='tight')
+        files.append(file_name)
+    plt.close(fig)
+    return name, time.perf_counter() - start, files, None
+
+
+class _StackSampler:
+    """
+    Wall-clock sampler of one thread's Python call stacks
+    
+    A background thread records the target thread's stack every `interval`
+    seconds; `counts` maps collapsed stacks ('outer;...;inner') to sample
+    counts, the input format of flamegraph.pl and speedscope.
+    """
+    
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.counts = {}
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+    
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                key = ';'.join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+
 class DataCleaning:
     """
     This class provides a clean, reproducible pipeline for:
@@ -50,15 +203,267 @@ class DataCleaning:
         }
     }
     
-    def __init__(self, verbose: bool = True):
+    # Raw column dtypes for the columnar (Parquet) ingest path
+    RAW_ID_COLUMNS = [
+        'question_id', 'response_id', 'question_user_id', 'response_user_id'
+    ]
+    RAW_CATEGORICAL_COLUMNS = [
+        'question_language', 'response_language',
+        'question_user_country_code', 'response_user_country_code',
+        'question_user_type', 'response_user_type',
+        'question_user_status', 'response_user_status',
+        'question_user_gender', 'response_user_gender',
+    ]
+    RAW_TEXT_COLUMNS = [
+        'question_content', 'response_content', 'question_topic', 'response_topic'
+    ]
+    
+    # Raw columns read by each enrichment step (used to prune Parquet reads)
+    STEP_INPUT_COLUMNS = {
+        '_parse_datetime_columns': [
+            'question_sent', 'response_sent',
+            'question_user_created_at', 'response_user_created_at',
+            'question_user_dob', 'response_user_dob',
+        ],
+        '_standardize_country_codes': [
+            'question_user_country_code', 'response_user_country_code'
+        ],
+        '_standardize_language_codes': ['question_language', 'response_language'],
+        '_add_temporal_features': ['question_sent', 'response_sent'],
+        '_add_farming_season_context': ['question_sent', 'question_user_country_code'],
+        '_add_standardized_season': ['question_sent', 'question_user_country_code'],
+        '_add_text_features': ['question_content', 'response_content'],
+        '_compute_data_completeness': [
+            'question_content', 'question_language', 'question_user_country_code',
+            'response_content', 'response_language',
+            'question_user_gender', 'question_user_dob',
+            'response_user_gender', 'response_user_dob',
+            'question_topic', 'response_topic',
+        ],
+    }
+    
+    # Enrichment steps in execution order
+    PIPELINE_STEPS = [
+        '_parse_datetime_columns',
+        '_standardize_country_codes',
+        '_standardize_language_codes',
+        '_add_temporal_features',
+        '_add_farming_season_context',
+        '_add_standardized_season',
+        '_add_text_features',
+        '_compute_data_completeness',
+    ]
+    
+    # Output column names (raw/derived name -> short name)
+    RENAME_MAP = {
+        # Core IDs - keep as is, they're fine
+        'question_id': 'q_id',
+        'response_id': 'r_id',
+        'question_user_id': 'q_user_id',
+        'response_user_id': 'r_user_id',
+
+        # Content
+        'question_content': 'q_text',
+        'response_content': 'r_text',
+        'question_topic': 'q_topic',
+        'response_topic': 'r_topic',
+
+        # Languages
+        'question_language': 'q_lang_code',
+        'response_language': 'r_lang_code',
+        'question_language_name': 'q_language',
+        'response_language_name': 'r_language',
+
+        # Timestamps
+        'question_sent': 'q_datetime',
+        'response_sent': 'r_datetime',
+        'question_user_created_at': 'q_user_joined',
+        'response_user_created_at': 'r_user_joined',
+        'question_user_dob': 'q_user_dob',
+        'response_user_dob': 'r_user_dob',
+
+        # User attributes
+        'question_user_type': 'q_user_type',
+        'question_user_status': 'q_user_status',
+        'question_user_country_code': 'q_country',
+        'question_user_gender': 'q_gender',
+        'response_user_type': 'r_user_type',
+        'response_user_status': 'r_user_status',
+        'response_user_country_code': 'r_country',
+        'response_user_gender': 'r_gender',
+
+        # Temporal features
+        'question_year': 'q_year',
+        'question_month': 'q_month',
+        'question_day': 'q_day',
+        'question_hour': 'q_hour',
+        'question_dayofweek': 'q_weekday',
+        'question_quarter': 'q_quarter',
+        'question_year_month': 'q_year_month',
+        'response_year': 'r_year',
+        'response_month': 'r_month',
+        'response_day': 'r_day',
+        'response_hour': 'r_hour',
+        'response_dayofweek': 'r_weekday',
+        'response_time_hours': 'response_time_hrs',
+
+        # Context
+        'farming_season': 'season',
+        'season_standardized':'season_std',
+
+        # Text features
+        'question_length_chars': 'q_chars',
+        'question_word_count': 'q_words',
+        'question_digit_ratio': 'q_digit_ratio',
+        'question_non_ascii_ratio': 'q_non_ascii_ratio',
+        'question_has_question_mark': 'q_has_qmark',
+        'response_length_chars': 'r_chars',
+        'response_word_count': 'r_words',
+        'response_digit_ratio': 'r_digit_ratio',
+        'response_non_ascii_ratio': 'r_non_ascii_ratio',
+        'response_has_question_mark': 'r_has_qmark',
+
+        # Quality metrics
+        'core_fields_complete_pct': 'completeness_pct',
+        'user_metadata_complete_pct': 'metadata_pct',
+        'has_question_topic': 'has_q_topic',
+        'has_response_topic': 'has_r_topic',
+    }
+    
+    # Compact dtype plan for the enriched (renamed) frame
+    OUTPUT_DTYPES = {
+        # Temporal features
+        'q_year': 'int16', 'q_month': 'int8', 'q_day': 'int8', 'q_hour': 'int8',
+        'q_hour_local': 'int8', 'q_weekday': 'int8', 'q_quarter': 'int8',
+        'r_year': 'int16', 'r_month': 'int8', 'r_day': 'int8', 'r_hour': 'int8',
+        'r_hour_local': 'int8', 'r_weekday': 'int8',
+        'response_time_hrs': 'float32',
+        
+        # Codes and labels
+        'q_country': 'category', 'r_country': 'category',
+        'q_lang_code': 'category', 'r_lang_code': 'category',
+        'q_language': 'category', 'r_language': 'category',
+        'q_user_type': 'category', 'r_user_type': 'category',
+        'q_user_status': 'category', 'r_user_status': 'category',
+        'q_gender': 'category', 'r_gender': 'category',
+        'q_topic': 'category', 'r_topic': 'category',
+        'season': 'category', 'season_std': 'category',
+        
+        # Text features
+        'q_chars': 'int32', 'q_words': 'int32', 'r_chars': 'int32', 'r_words': 'int32',
+        'q_digit_ratio': 'float32', 'q_non_ascii_ratio': 'float32', 'q_has_qmark': 'bool',
+        'r_digit_ratio': 'float32', 'r_non_ascii_ratio': 'float32', 'r_has_qmark': 'bool',
+        
+        # Quality metrics
+        'completeness_pct': 'float32', 'metadata_pct': 'float32',
+        'has_q_topic': 'bool', 'has_r_topic': 'bool',
+    }
+    
+    # Fixed timestamp formats tried by format detection, in priority order
+    # ('ISO8601' covers every ISO 8601 variant in one vectorized parse)
+    DATETIME_FORMATS = [
+        'ISO8601',
+        '%m/%d/%Y %H:%M:%S',
+        '%m/%d/%Y %H:%M',
+        '%m/%d/%Y',
+    ]
+    
+    # Non-null values sampled per column for format detection
+    DATETIME_SAMPLE_SIZE = 1000
+    
+    # Runs of non-whitespace, with whitespace as str.split() defines it, so
+    # word counts match split-based ones (pandas fallback of `_text_stats`;
+    # `_utf8_slice_counts` classifies the same whitespace bytes)
+    WORD_PATTERN = (r'[^\t\n\x0b\x0c\r\x1c-\x20\x85\xa0'
+                    '\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+')
+    
+    # Rows per slice of a text column classified at once (bounds the byte-flag temporaries)
+    TEXT_CHUNK_ROWS = 1_000_000
+    
+    # Upstream steps whose outputs each step reads
+    STEP_DEPENDENCIES = {
+        '_parse_datetime_columns': [],
+        '_standardize_country_codes': [],
+        '_standardize_language_codes': [],
+        '_add_temporal_features': ['_parse_datetime_columns'],
+        '_add_farming_season_context': ['_add_temporal_features', '_standardize_country_codes'],
+        '_add_standardized_season': ['_add_temporal_features', '_standardize_country_codes'],
+        '_add_text_features': [],
+        '_compute_data_completeness': ['_parse_datetime_columns'],
+    }
+    
+    # Methods and settings that determine each step's output (hashed into cache keys)
+    STEP_CONFIG = {
+        '_parse_datetime_columns': [
+            '_parse_datetime_columns', '_datetime_columns', '_to_datetime',
+            '_infer_datetime_formats', 'DATETIME_FORMATS',
+        ],
+        '_standardize_country_codes': [
+            '_standardize_country_codes', '_map_codes', 'COUNTRY_CODE_MAP',
+        ],
+        '_standardize_language_codes': [
+            '_standardize_language_codes', '_map_codes', 'LANGUAGE_CODE_MAP',
+        ],
+        '_add_temporal_features': ['_add_temporal_features'],
+        '_add_farming_season_context': [
+            '_add_farming_season_context', '_assign_seasons', '_season_lookup_table',
+            '_farming_season_label', 'FARMING_SEASONS', 'season_engine',
+        ],
+        '_add_standardized_season': [
+            '_add_standardized_season', '_assign_seasons', '_season_lookup_table',
+            '_standardized_season_label', 'FARMING_SEASONS', 'season_engine',
+        ],
+        '_add_text_features': [
+            '_add_text_features', '_text_stats', '_utf8_counts', '_utf8_slice_counts',
+            'WORD_PATTERN',
+        ],
+        '_compute_data_completeness': ['_compute_data_completeness'],
+    }
+    
+    # Smallest row partition worth sending to a worker process
+    PARALLEL_MIN_PARTITION_ROWS = 100_000
+    
+    # Season assignment engines: precomputed (country, month) table or row-wise
+    SEASON_ENGINES = ('lookup', 'apply')
+    
+    # Lookup-table row for countries without a season calendar
+    _OTHER_COUNTRY = '__other__'
+    
+    def __init__(self, verbose: bool = True, season_engine: str = 'lookup',
+                 compact_dtypes: bool = True, n_jobs: int = 1,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 profile_path: Optional[Union[str, Path]] = None,
+                 summary_sample: Optional[int] = None):
         """
         Initialize data processor
         
         Args:
             verbose: Whether to print processing steps
+            season_engine: 'lookup' (vectorized table lookup) or 'apply' (row-wise reference)
+            compact_dtypes: Whether to downcast the output to OUTPUT_DTYPES
+            n_jobs: Worker processes for the enrichment steps (-1 = all cores)
+            cache_dir: Directory for per-step output caches (default: no caching)
+            profile_path: File for a collapsed-stack (flame graph) profile of the
+                slowest step, written after each run (default: no sampling)
+            summary_sample: Rows sampled for the verbose summaries of longer
+                columns, which are then estimates (default: exact)
         """
+        if season_engine not in self.SEASON_ENGINES:
+            raise ValueError(f"season_engine must be one of {self.SEASON_ENGINES}, got {season_engine!r}")
+        
         self.verbose = verbose
+        self.season_engine = season_engine
+        self.compact_dtypes = compact_dtypes
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else max(1, n_jobs)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.profile_path = Path(profile_path) if profile_path is not None else None
+        self.summary_sample = summary_sample
         self.processing_log = []
+        self.processing_profile = None
+        self.stream_stats = None
+        self.memory_report = None
+        self._step_timings = []
+        self._step_stacks = {}
         
     def _log(self, message: str):
         """Log processing step"""
@@ -66,6 +471,254 @@ class DataCleaning:
         if self.verbose:
             print(message)
     
+    def _summary_rows(self, series: pd.Series) -> Tuple[pd.Series, float]:
+        """
+        Rows to summarise for verbose output
+        
+        Args:
+            series: Full column
+            
+        Returns:
+            Tuple of (column or a `summary_sample`-row sample drawn with
+            replacement, factor scaling sample counts up to the column)
+        """
+        n = self.summary_sample
+        if n is None or len(series) <= n:
+            return series, 1.0
+        positions = np.random.default_rng(0).integers(0, len(series), n)
+        return series.iloc[positions], len(series) / n
+    
+    def _value_counts(self, series: pd.Series) -> Tuple[pd.Series, str]:
+        """
+        Non-zero value counts for verbose output
+        
+        Args:
+            series: Full column
+            
+        Returns:
+            Tuple of (counts, most common first; '~' if estimated from a sample else '')
+        """
+        rows, scale = self._summary_rows(series)
+        counts = rows.value_counts()
+        counts = counts[counts > 0]
+        if scale == 1:
+            return counts, ''
+        return (counts * scale).round().astype(int), '~'
+    
+    def _datetime_summary(self, series: pd.Series) -> Tuple[int, int, str, str]:
+        """
+        Valid count, null count and range of a datetime column in one pass
+        
+        Works on the int64 view, where NaT is the smallest value, so the
+        maximum needs no mask and the minimum one masked reduction.
+        
+        Args:
+            series: Parsed datetime column
+            
+        Returns:
+            Tuple of (valid count, null count, 'min to max' or 'No valid dates',
+            '~' if estimated from a sample else '')
+        """
+        rows, scale = self._summary_rows(series)
+        ints = rows.array.asi8
+        nat = np.iinfo(np.int64).min
+        valid = ints != nat
+        n_valid = int(valid.sum())
+        
+        if n_valid > 0:
+            lo = rows.iloc[np.where(valid, ints, np.iinfo(np.int64).max).argmin()]
+            hi = rows.iloc[ints.argmax()]
+            date_range = f"{lo} to {hi}"
+        else:
+            date_range = "No valid dates"
+        
+        n_valid = round(n_valid * scale)
+        return n_valid, len(series) - n_valid, date_range, '' if scale == 1 else '~'
+    
+    @staticmethod
+    def _map_codes(series: pd.Series, mapping: Dict[str, str]) -> pd.Series:
+        """
+        Map codes through a lookup table, leaving unmapped values unchanged
+        
+        Categorical input is mapped on its categories only, so the cost does
+        not depend on the number of rows and the result stays categorical.
+        
+        Args:
+            series: Code column (object, string or categorical)
+            mapping: Code -> replacement lookup
+            
+        Returns:
+            Mapped series with the same index
+        """
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.map(mapping).fillna(series)
+        
+        # Several old categories may collapse onto one new value (e.g. 'ke' and 'KEN')
+        mapped = pd.Index([mapping.get(c, c) for c in series.cat.categories])
+        new_categories = mapped.unique()
+        remap = new_categories.get_indexer(mapped)
+        codes = series.cat.codes.to_numpy()
+        # Append -1 so missing values (code -1) stay missing, even with no categories
+        new_codes = np.append(remap, -1)[codes]
+        return pd.Series(pd.Categorical.from_codes(new_codes, new_categories),
+                         index=series.index, name=series.name)
+    
+    @staticmethod
+    def _datetime_columns(df: pd.DataFrame) -> List[str]:
+        """Raw columns holding timestamps (sent / created_at / dob)"""
+        return [col for col in df.columns 
+                if any(x in col for x in ['sent', 'created_at', 'dob'])]
+    
+    def _coerce_raw_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast a raw WeFarm frame to the compact columnar schema
+        
+        Args:
+            df: Raw dataframe (or CSV chunk)
+            
+        Returns:
+            DataFrame with nullable integer IDs, categorical codes,
+            UTC timestamps and string-dtype text
+        """
+        for col in self.RAW_ID_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+        
+        for col in self.RAW_CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        for col in self.RAW_TEXT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype(pd.StringDtype('pyarrow'))
+        
+        for col in self._datetime_columns(df):
+            df[col] = self._to_datetime(df[col])
+        
+        return df
+    
+    def csv_to_parquet(self, csv_path: Union[str, Path], parquet_dir: Union[str, Path],
+                       chunksize: int = 1_000_000,
+                       partition_cols: Tuple[str, ...] = ('question_user_country_code',)) -> Path:
+        """
+        Convert the raw WeFarm CSV export into a partitioned Parquet dataset
+        
+        The CSV is parsed once, chunk by chunk, and written with typed columns
+        so later runs can read only the columns they need without re-parsing
+        text or timestamps. Rows with a null partition key go to the hive
+        default partition and read back as missing. Parquet files already in
+        `parquet_dir` are deleted first, so a rerun replaces the dataset
+        instead of adding to it.
+        
+        Args:
+            csv_path: Path to the raw CSV (e.g. wefarm_dataset.csv)
+            parquet_dir: Output directory for the Parquet dataset
+            chunksize: Number of CSV rows converted per chunk
+            partition_cols: Columns used for hive-style directory partitioning
+            
+        Returns:
+            Path to the Parquet dataset directory
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        parquet_dir = Path(parquet_dir)
+        parquet_dir.mkdir(parents=True, exist_ok=True)
+        self._log(f"Converting {csv_path} to Parquet dataset at {parquet_dir}...")
+        
+        stale = list(parquet_dir.rglob('*.parquet'))
+        for file in stale:
+            file.unlink()
+        if stale:
+            self._log(f"  Replaced {len(stale)} existing Parquet file(s)")
+        
+        # Read everything we cast ourselves as string so chunks share one schema
+        read_dtypes = {col: 'string' for col in 
+                       self.RAW_CATEGORICAL_COLUMNS + self.RAW_TEXT_COLUMNS}
+        reader = pd.read_csv(csv_path, chunksize=chunksize, dtype=read_dtypes)
+        
+        schema = None
+        total_rows = 0
+        for chunk in reader:
+            chunk = chunk.drop(columns=['Unnamed: 0'], errors='ignore')
+            chunk = self._coerce_raw_dtypes(chunk)
+            
+            # Pin the schema from the first chunk so all files are compatible
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            if schema is None:
+                schema = table.schema
+            
+            pq.write_to_dataset(table, root_path=str(parquet_dir),
+                                partition_cols=list(partition_cols) or None)
+            total_rows += len(chunk)
+            
+            if self.verbose:
+                print(f"  Written {total_rows:,} rows")
+        
+        self._log(f"Parquet conversion complete: {total_rows:,} rows")
+        return parquet_dir
+    
+    def _parquet_dataset(self, path: Union[str, Path]):
+        """
+        Open a Parquet file or hive-partitioned dataset
+        
+        Partition values are read as plain strings: pyarrow cannot unify
+        inferred dictionaries when a partition is the null (hive default)
+        one. `_restore_categoricals` casts them back afterwards.
+        """
+        import pyarrow.dataset as ds
+        
+        return ds.dataset(str(path), format='parquet',
+                          partitioning=ds.partitioning(flavor='hive'))
+    
+    def _restore_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast raw categorical columns read as strings (partition keys) to category"""
+        for col in self.RAW_CATEGORICAL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        return df
+    
+    def read_parquet(self, parquet_dir: Union[str, Path],
+                     columns: Optional[List[str]] = None,
+                     filters: Optional[List[Tuple]] = None) -> pd.DataFrame:
+        """
+        Load (a projection of) a Parquet dataset written by `csv_to_parquet`
+        
+        Args:
+            parquet_dir: Parquet dataset directory (or single file)
+            columns: Columns to read; names missing from the dataset are ignored
+            filters: Optional pyarrow row filters, e.g. [('question_user_country_code', '=', 'ke')]
+            
+        Returns:
+            DataFrame with the dtypes stored in the dataset
+        """
+        import pyarrow.parquet as pq
+        
+        dataset = self._parquet_dataset(parquet_dir)
+        if columns is not None:
+            columns = [col for col in dict.fromkeys(columns) if col in dataset.schema.names]
+        
+        table = dataset.to_table(columns=columns,
+                                 filter=pq.filters_to_expression(filters) if filters else None)
+        df = self._restore_categoricals(table.to_pandas())
+        self._log(f"Loaded {len(df):,} rows x {len(df.columns)} columns from {parquet_dir}")
+        return df
+    
+    def pipeline_columns(self, columns: Optional[List[str]] = None) -> List[str]:
+        """
+        Raw columns to read for a pipeline run
+        
+        Args:
+            columns: Extra raw columns to carry through to the output
+            
+        Returns:
+            Union of the requested columns and every step's input columns
+        """
+        needed = list(columns or [])
+        for step_columns in self.STEP_INPUT_COLUMNS.values():
+            needed.extend(step_columns)
+        return list(dict.fromkeys(needed))
+    
     def _standardize_country_codes(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Convert country codes to ISO 3166-1 alpha-3 format
@@ -81,17 +734,96 @@ class DataCleaning:
         country_cols = [col for col in df.columns if 'country_code' in col]
         
         for col in country_cols:
-            original_values = df[col].value_counts()
-            df[col] = df[col].map(self.COUNTRY_CODE_MAP).fillna(df[col])
-            new_values = df[col].value_counts()
+            if self.verbose:
+                # The mapping is per value, so the new counts follow from the old ones
+                original_values, approx = self._value_counts(df[col])
+                new_values = (original_values
+                              .groupby(lambda code: self.COUNTRY_CODE_MAP.get(code, code))
+                              .sum().sort_values(ascending=False))
+            
+            df[col] = self._map_codes(df[col], self.COUNTRY_CODE_MAP)
             
             if self.verbose:
                 print(f"  {col}:")
-                print(f"    Before: {dict(original_values)}")
-                print(f"    After:  {dict(new_values)}")
+                print(f"    Before: {approx}{dict(original_values)}")
+                print(f"    After:  {approx}{dict(new_values)}")
         
         return df
     
+    def _infer_datetime_formats(self, values: pd.Series) -> List[str]:
+        """
+        Find which DATETIME_FORMATS occur in a sample of timestamp strings
+        
+        Args:
+            values: Non-null sample of raw timestamp strings
+            
+        Returns:
+            Formats matching part of the sample, most common first
+        """
+        counts = {}
+        for fmt in self.DATETIME_FORMATS:
+            if values.empty:
+                break
+            matched = pd.to_datetime(values, format=fmt, utc=True, errors='coerce').notna()
+            if matched.any():
+                counts[fmt] = int(matched.sum())
+                values = values[~matched]
+        return sorted(counts, key=counts.get, reverse=True)
+    
+    def _to_datetime(self, series: pd.Series) -> pd.Series:
+        """
+        Parse a timestamp column to UTC using fixed-format fast paths
+        
+        A sample of the column decides which DATETIME_FORMATS are present;
+        each format group is parsed with its fixed format and only values no
+        format matched fall back to the (much slower) mixed-format parser.
+        
+        Args:
+            series: Raw timestamp column (strings or datetimes)
+            
+        Returns:
+            UTC-aware datetime series (unparseable values become NaT)
+        """
+        start = datetime.now()
+        
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return pd.to_datetime(series, utc=True)
+        
+        values = series.reset_index(drop=True)
+        notna = values.notna()
+        remaining = values if notna.all() else values[notna]
+        sample = remaining.sample(min(self.DATETIME_SAMPLE_SIZE, len(remaining)), random_state=0)
+        
+        parts = []
+        group_counts = {}
+        for fmt in self._infer_datetime_formats(sample):
+            if remaining.empty:
+                break
+            parsed = pd.to_datetime(remaining, format=fmt, utc=True, errors='coerce')
+            matched = parsed.notna()
+            parts.append(parsed[matched])
+            group_counts[fmt] = int(matched.sum())
+            remaining = remaining[~matched]
+        
+        if not remaining.empty:
+            parts.append(pd.to_datetime(remaining, utc=True, errors='coerce', format='mixed'))
+            group_counts['mixed'] = len(remaining)
+        
+        if len(parts) == 1 and len(parts[0]) == len(values):
+            result = parts[0]
+        elif parts:
+            result = pd.concat(parts).reindex(values.index)
+        else:
+            result = pd.to_datetime(values, utc=True, errors='coerce')
+        result.index = series.index
+        
+        elapsed = max((datetime.now() - start).total_seconds(), 1e-6)
+        groups = ', '.join(f"{fmt}: {count:,}" for fmt, count in group_counts.items())
+        self._log(f"  {series.name}: {len(series):,} values in {elapsed:.2f}s "
+                  f"({len(series) / elapsed:,.0f}/s) [{groups or 'all null'}]")
+        
+        return result
+    
     def _parse_datetime_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Parse all datetime columns with proper timezone handling
@@ -105,25 +837,17 @@ class DataCleaning:
         self._log("Parsing datetime columns...")
         
         # Identify datetime columns
-        datetime_cols = [col for col in df.columns 
-                        if any(x in col for x in ['sent', 'created_at', 'dob'])]
+        datetime_cols = self._datetime_columns(df)
         
         for col in datetime_cols:
             try:
                 # Parse with UTC timezone awareness
-                df[col] = pd.to_datetime(df[col], utc=True, errors='coerce',format='mixed')
-                
-                non_null_count = df[col].notna().sum()
-                null_count = df[col].isna().sum()
-                
-                if non_null_count > 0:
-                    date_range = f"{df[col].min()} to {df[col].max()}"
-                else:
-                    date_range = "No valid dates"
+                df[col] = self._to_datetime(df[col])
                 
                 if self.verbose:
+                    non_null_count, null_count, date_range, approx = self._datetime_summary(df[col])
                     print(f"  {col}:")
-                    print(f"    Valid: {non_null_count:,} | Null: {null_count:,}")
+                    print(f"    Valid: {approx}{non_null_count:,} | Null: {approx}{null_count:,}")
                     print(f"    Range: {date_range}")
                     
             except Exception as e:
@@ -179,358 +903,1556 @@ class DataCleaning:
             
             if self.verbose:
                 print(f"  Added temporal features for responses")
-                valid_response_times = df['response_time_hours'].dropna()
+                valid_response_times = self._summary_rows(df['response_time_hours'])[0].dropna()
                 if len(valid_response_times) > 0:
                     print(f"    Response time: median={valid_response_times.median():.1f}h, "
                           f"mean={valid_response_times.mean():.1f}h")
         
         return df
     
-    def _add_farming_season_context(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _farming_season_label(self, country, month) -> Optional[str]:
+        """Determine farming season for a country and month"""
+        if pd.isna(country) or pd.isna(month):
+            return None
+        
+        if country not in self.FARMING_SEASONS:
+            return None
+        
+        seasons = self.FARMING_SEASONS[country]
+        active_seasons = []
+        
+        for season_name, (start_month, end_month) in seasons.items():
+            # Handle seasons that span year boundary
+            if start_month <= end_month:
+                if start_month <= month <= end_month:
+                    active_seasons.append(season_name)
+            else:  # Wraps around year (e.g., Dec-Feb)
+                if month >= start_month or month <= end_month:
+                    active_seasons.append(season_name)
+        
+        return ','.join(active_seasons) if active_seasons else 'off_season'
+    
+    def _standardized_season_label(self, country, month) -> Optional[str]:
+        """Map a country and month to standardized rainy/harvest seasons"""
+        if pd.isna(country) or pd.isna(month):
+            return None
+
+        # Standardized season mapping
+        # Rainy = planting seasons
+        # Harvest = harvest seasons
+
+        if country == 'KEN':
+            if 3 <= month <= 5:  # Long rains
+                return 'rainy_main'
+            elif 10 <= month <= 12:  # Short rains
+                return 'rainy_secondary'
+            elif 6 <= month <= 8:  # Harvest 1
+                return 'harvest_main'
+            elif month in [1, 2]:  # Harvest 2
+                return 'harvest_secondary'
+
+        elif country == 'UGA':
+            if 3 <= month <= 5:  # Season A plant
+                return 'rainy_main'
+            elif 9 <= month <= 11:  # Season B plant
+                return 'rainy_secondary'
+            elif 6 <= month <= 8:  # Season A harvest
+                return 'harvest_main'
+            elif month in [12, 1, 2]:  # Season B harvest
+                return 'harvest_secondary'
+
+        elif country == 'TZA':
+            if 3 <= month <= 5:  # Masika rains
+                return 'rainy_main'
+            elif 10 <= month <= 12:  # Vuli rains
+                return 'rainy_secondary'
+            elif 6 <= month <= 8:  # Harvest
+                return 'harvest_main'
+
+        return 'off_season'
+    
+    def _season_lookup_table(self, label_func) -> Tuple[List[str], np.ndarray]:
+        """
+        Precompute season labels for every (country, month) pair
+        
+        Rows follow FARMING_SEASONS order plus a final row for any other
+        country; column 0 is unused so months index directly.
+        
+        Args:
+            label_func: Scalar (country, month) -> label function
+            
+        Returns:
+            Tuple of (label categories, int8 code table of shape (n_countries + 1, 13))
+        """
+        countries = list(self.FARMING_SEASONS) + [self._OTHER_COUNTRY]
+        labels = []
+        table = np.full((len(countries), 13), -1, dtype=np.int8)
+        
+        for i, country in enumerate(countries):
+            for month in range(1, 13):
+                label = label_func(country, month)
+                if label is None:
+                    continue
+                if label not in labels:
+                    labels.append(label)
+                table[i, month] = labels.index(label)
+        
+        return labels, table
+    
+    def _assign_seasons(self, df: pd.DataFrame, label_func) -> pd.Series:
+        """
+        Assign season labels for every row
+        
+        Args:
+            df: Dataframe with question_user_country_code and question_month
+            label_func: Scalar (country, month) -> label function
+            
+        Returns:
+            Season labels (categorical for the lookup engine, object for apply)
+        """
+        country = df['question_user_country_code']
+        month = df['question_month']
+        
+        if self.season_engine == 'apply':
+            return df.apply(lambda row: label_func(row.get('question_user_country_code'),
+                                                   row.get('question_month')), axis=1)
+        
+        labels, table = self._season_lookup_table(label_func)
+        known = pd.Index(list(self.FARMING_SEASONS))
+        other_row = len(known)
+        
+        # Country -> table row (-1 for missing country)
+        if isinstance(country.dtype, pd.CategoricalDtype):
+            category_rows = known.get_indexer(country.cat.categories)
+            category_rows[category_rows < 0] = other_row
+            codes = country.cat.codes.to_numpy()
+            rows = np.append(category_rows, -1)[codes]  # code -1 -> -1
+        else:
+            rows = known.get_indexer(country)
+            rows[rows < 0] = other_row
+            rows[country.isna().to_numpy()] = -1
+        
+        # Month -> table column (0 holds no label, used for missing months)
+        months = pd.to_numeric(month, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        valid_month = ~np.isnan(months)
+        cols = np.where(valid_month, np.nan_to_num(months), 0).astype(np.intp)
+        
+        label_codes = table[rows, cols]
+        label_codes[rows < 0] = -1
+        
+        return pd.Series(pd.Categorical.from_codes(label_codes, labels), index=df.index)
+    
+    def _add_farming_season_context(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add farming season context based on country and month
+        
+        Args:
+            df: Input dataframe
+            
+        Returns:
+            DataFrame with farming season indicators
+        """
+        self._log("Adding farming season context...")
+        
+        if 'question_month' not in df.columns or 'question_user_country_code' not in df.columns:
+            self._log("  Skipping: Required columns not found")
+            return df
+        
+        df['farming_season'] = self._assign_seasons(df, self._farming_season_label)
+        
+        if self.verbose:
+            season_counts, approx = self._value_counts(df['farming_season'])
+            print(f"  Farming season distribution:")
+            for season, count in season_counts.head(5).items():
+                print(f"    {season}: {approx}{count:,}")
+        
+        return df
+    
+    def _add_standardized_season(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add standardized season labels (rainy/harvest) across countries
+        """
+        if 'question_month' not in df.columns or 'question_user_country_code' not in df.columns:
+            return df
+
+        df['season_standardized'] = self._assign_seasons(df, self._standardized_season_label)
+
+        if self.verbose:
+            season_counts, approx = self._value_counts(df['season_standardized'])
+            print(f"  Standardized seasons:")
+            for season, count in season_counts.items():
+                print(f"    {season}: {approx}{count:,}")
+
+        return df
+    
+    def _compute_data_completeness(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add data completeness metrics per row
+        
+        Args:
+            df: Input dataframe
+            
+        Returns:
+            DataFrame with completeness metrics
+        """
+        self._log("Computing data completeness metrics...")
+        
+        # Core fields completeness
+        core_fields = [
+            'question_content', 'question_language', 'question_user_country_code',
+            'response_content', 'response_language'
+        ]
+        
+        available_core = [f for f in core_fields if f in df.columns]
+        df['core_fields_complete_pct'] = (
+            df[available_core].notna().sum(axis=1) / len(available_core) * 100
+        )
+        
+        # User metadata completeness
+        user_metadata_fields = [
+            'question_user_gender', 'question_user_dob',
+            'response_user_gender', 'response_user_dob'
+        ]
+        
+        available_metadata = [f for f in user_metadata_fields if f in df.columns]
+        if available_metadata:
+            df['user_metadata_complete_pct'] = (
+                df[available_metadata].notna().sum(axis=1) / len(available_metadata) * 100
+            )
+        
+        # Has topic labels
+        if 'question_topic' in df.columns:
+            df['has_question_topic'] = df['question_topic'].notna()
+        
+        if 'response_topic' in df.columns:
+            df['has_response_topic'] = df['response_topic'].notna()
+        
+        if self.verbose:
+            core_pct = self._summary_rows(df['core_fields_complete_pct'])[0]
+            print(f"  Core fields completeness: {core_pct.mean():.1f}% avg")
+            if 'user_metadata_complete_pct' in df.columns:
+                metadata_pct = self._summary_rows(df['user_metadata_complete_pct'])[0]
+                print(f"  User metadata completeness: {metadata_pct.mean():.1f}% avg")
+        
+        return df
+    
+    @classmethod
+    def _utf8_counts(cls, arr) -> Dict[str, np.ndarray]:
+        """
+        Per-row character counts of an Arrow string array, read from its UTF-8 bytes
+        
+        Each byte of the data buffer is classified once (continuation,
+        multi-byte lead, digit, '?', whitespace) and the flags are summed per
+        row with `np.add.reduceat` over the offsets, so no per-row objects
+        are created. A word starts at a non-whitespace character preceded by
+        whitespace or the start of the row; whitespace is the set in
+        WORD_PATTERN (ASCII bytes plus a few multi-byte sequences).
+        
+        Args:
+            arr: pyarrow string/large_string Array or ChunkedArray (nulls count as '')
+            
+        Returns:
+            Dict of chars, words, digits, non_ascii and question_marks counts
+        """
+        import pyarrow as pa
+        
+        chunks = arr.chunks if isinstance(arr, pa.ChunkedArray) else [arr]
+        slices = [chunk.slice(lo, cls.TEXT_CHUNK_ROWS)
+                  for chunk in chunks for lo in range(0, len(chunk), cls.TEXT_CHUNK_ROWS)]
+        parts = [cls._utf8_slice_counts(piece) for piece in slices]
+        names = ['chars', 'words', 'digits', 'non_ascii', 'question_marks']
+        if not parts:
+            return {name: np.zeros(0, np.int64) for name in names}
+        return {name: np.concatenate([part[name] for part in parts]) for name in names}
+    
+    @classmethod
+    def _utf8_slice_counts(cls, arr) -> Dict[str, np.ndarray]:
+        """Counts of `_utf8_counts` for one contiguous Arrow string Array"""
+        import pyarrow as pa
+        
+        n = len(arr)
+        _, offsets_buf, data_buf = arr.buffers()
+        offset_dtype = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+        offsets = np.frombuffer(offsets_buf, dtype=offset_dtype)[arr.offset:arr.offset + n + 1]
+        offsets = offsets.astype(np.int64)
+        if data_buf is None or offsets[-1] == offsets[0]:
+            data = np.zeros(0, np.uint8)
+        else:
+            data = np.frombuffer(data_buf, dtype=np.uint8)[offsets[0]:offsets[-1]]
+        offsets -= offsets[0]
+        lengths = np.diff(offsets)
+        nonempty = lengths > 0
+        starts = offsets[:-1][nonempty]
+        
+        def row_sums(flags):
+            # Sparse flags (digits, '?', non-ASCII) are located and binned by row;
+            # dense ones are summed over each row's byte range
+            positions = np.flatnonzero(flags)
+            if len(positions) < len(flags) // 16:
+                rows = np.searchsorted(offsets, positions, side='right') - 1
+                return np.bincount(rows, minlength=n)
+            sums = np.zeros(n, np.int64)
+            if len(starts):
+                # uint32 accumulation is much faster than int64 and cannot overflow per row
+                sums[nonempty] = np.add.reduceat(flags.view(np.uint8), starts, dtype=np.uint32)
+            return sums
+        
+        continuation = (data & 0xC0) == 0x80
+        # ASCII whitespace as str.isspace() defines it: \t\n\v\f\r, \x1c-\x1f and ' '
+        space = ((data - 9) < 5) | ((data - 28) < 5)
+        
+        # Multi-byte whitespace: U+0085, U+00A0 (2 bytes), U+1680, U+2000-U+200A,
+        # U+2028, U+2029, U+202F, U+205F, U+3000 (3 bytes)
+        lead = np.flatnonzero((data == 0xC2) | ((data >= 0xE1) & (data <= 0xE3)))
+        if len(lead):
+            last = len(data) - 1
+            b0 = data[lead]
+            b1 = data[np.minimum(lead + 1, last)]
+            b2 = data[np.minimum(lead + 2, last)]
+            two = (b0 == 0xC2) & ((b1 == 0x85) | (b1 == 0xA0))
+            three = (((b0 == 0xE1) & (b1 == 0x9A) & (b2 == 0x80))
+                     | ((b0 == 0xE2) & (b1 == 0x80) & ((b2 <= 0x8A) | np.isin(b2, [0xA8, 0xA9, 0xAF])))
+                     | ((b0 == 0xE2) & (b1 == 0x81) & (b2 == 0x9F))
+                     | ((b0 == 0xE3) & (b1 == 0x80) & (b2 == 0x80)))
+            for width, found in [(2, lead[two]), (3, lead[three])]:
+                for shift in range(width):
+                    space[found + shift] = True
+        
+        after_space = np.empty_like(space)
+        if len(data):
+            after_space[0] = True
+            after_space[1:] = space[:-1]
+            after_space[starts] = True
+        word_start = after_space & ~space & ~continuation
+        
+        counts = {
+            'chars': lengths - row_sums(continuation),
+            'words': row_sums(word_start),
+            'digits': row_sums((data - 0x30) < 10),
+            'non_ascii': row_sums(data >= 0xC0),
+            'question_marks': row_sums(data == 0x3F),
+        }
+        if arr.null_count:
+            invalid = ~arr.is_valid().to_numpy(zero_copy_only=False)
+            for values in counts.values():
+                values[invalid] = 0
+        return counts
+    
+    def _text_stats(self, series: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        Character and word statistics of a text column without per-row lists
+        
+        Counts come from the UTF-8 buffer of an Arrow string array
+        (`_utf8_counts`) when pyarrow is installed and the column converts to
+        one, otherwise from the equivalent pandas regex counts. Missing text
+        counts as the empty string.
+        
+        Args:
+            series: Text column (object or string dtype)
+            
+        Returns:
+            Dict of length_chars, word_count, digit_ratio, non_ascii_ratio
+            and has_question_mark arrays
+        """
+        try:
+            import pyarrow as pa
+            
+            arr = pa.array(series, from_pandas=True)
+            if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+                raise TypeError(f"not a string column: {arr.type}")
+            
+            counts = self._utf8_counts(arr)
+        except (ImportError, TypeError, ValueError):  # no pyarrow, or mixed/non-string values
+            text = series.fillna('')
+            counts = {
+                'chars': text.str.len().to_numpy(np.int64),
+                'words': text.str.count(self.WORD_PATTERN).to_numpy(np.int64),
+                'digits': text.str.count('[0-9]').to_numpy(np.int64),
+                'non_ascii': text.str.count(r'[^\x00-\x7f]').to_numpy(np.int64),
+                'question_marks': text.str.count(r'\?').to_numpy(np.int64),
+            }
+        
+        chars = counts['chars']
+        safe_chars = np.maximum(chars, 1)
+        return {
+            'length_chars': chars,
+            'word_count': counts['words'],
+            'digit_ratio': counts['digits'] / safe_chars,
+            'non_ascii_ratio': counts['non_ascii'] / safe_chars,
+            'has_question_mark': counts['question_marks'] > 0,
+        }
+    
+    def _add_text_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Extract text-based features (length, word count, character mix)
+        
+        Args:
+            df: Input dataframe
+            
+        Returns:
+            DataFrame with text features
+        """
+        self._log("Extracting text features...")
+        
+        if 'question_content' in df.columns:
+            for stat, values in self._text_stats(df['question_content']).items():
+                df[f'question_{stat}'] = pd.Series(values, index=df.index)
+            
+            if self.verbose:
+                lengths = self._summary_rows(df['question_length_chars'])[0]
+                print(f"  Question length: median={lengths.median():.0f} chars, "
+                      f"mean={lengths.mean():.0f} chars")
+        
+        if 'response_content' in df.columns:
+            for stat, values in self._text_stats(df['response_content']).items():
+                df[f'response_{stat}'] = pd.Series(values, index=df.index)
+            
+            if self.verbose:
+                lengths = self._summary_rows(df['response_length_chars'])[0]
+                print(f"  Response length: median={lengths.median():.0f} chars, "
+                      f"mean={lengths.mean():.0f} chars")
+        
+        return df
+    
+    def _standardize_language_codes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add human-readable language names
+        
+        Args:
+            df: Input dataframe
+            
+        Returns:
+            DataFrame with language name columns
+        """
+        self._log("Adding language names...")
+        
+        lang_cols = [col for col in df.columns if 'language' in col and col.endswith('language')]
+        
+        for col in lang_cols:
+            name_col = col.replace('language', 'language_name')
+            df[name_col] = self._map_codes(df[col], self.LANGUAGE_CODE_MAP)
+            
+            if self.verbose:
+                print(f"  {col} -> {name_col}")
+        
+        return df
+    
+    def process(self, df: Union[pd.DataFrame, str, Path],
+                columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Main processing pipeline
+        
+        Args:
+            df: Raw input dataframe, or path to a Parquet dataset written by `csv_to_parquet`
+            columns: For Parquet input, raw columns to keep besides those the
+                enrichment steps read (default: all columns)
+            
+        Returns:
+            Cleaned and enriched dataframe
+        """
+        if isinstance(df, (str, Path)):
+            read_columns = self.pipeline_columns(columns) if columns is not None else None
+            # Freshly loaded, so there is no caller-owned frame to protect
+            df = self.read_parquet(df, columns=read_columns)
+            df_clean = df
+        else:
+            # Create copy to avoid modifying original
+            df_clean = df.copy()
+        
+        self._reset_profile()
+        self._log(f"Starting data processing pipeline on {len(df):,} rows...")
+        self._log("="*80)
+        n_input_columns = len(df.columns)
+        
+        # Remove unnamed index column if present
+        if 'Unnamed: 0' in df_clean.columns:
+            df_clean = df_clean.drop(columns=['Unnamed: 0'])
+        
+        df_clean = self._enrich(df_clean)
+        self._finish_profile()
+
+        self._log("="*80)
+        self._log(f"Processing complete! Output: {len(df_clean):,} rows, "
+                 f"{len(df_clean.columns)} columns (+{len(df_clean.columns) - n_input_columns} added)")
+        
+        return df_clean
+    
+    def _enrich(self, df_clean: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the enrichment steps, rename columns and drop non-target countries
+        
+        Args:
+            df_clean: Raw dataframe owned by the pipeline (modified in place)
+            
+        Returns:
+            Enriched dataframe with readable column names
+        """
+        # Execute pipeline
+        n_partitions = min(self.n_jobs, len(df_clean) // self.PARALLEL_MIN_PARTITION_ROWS)
+        if n_partitions > 1:
+            df_clean, _ = self._run_step('_run_steps_parallel', df_clean,
+                                         lambda df: self._run_steps_parallel(df, n_partitions))
+        else:
+            df_clean = self._run_steps(df_clean)
+        
+        # Rename columns to more readable format
+        df_clean = df_clean.rename(columns=self.RENAME_MAP)
+        
+        # filter out gb country
+        df_clean = df_clean[df_clean['q_country']!='gb'][df_clean['r_country']!='gb']
+        
+        # Drop categories emptied by the filter so counts/plots don't show them
+        for col in df_clean.columns:
+            if isinstance(df_clean[col].dtype, pd.CategoricalDtype):
+                df_clean[col] = df_clean[col].cat.remove_unused_categories()
+        
+        if self.compact_dtypes:
+            df_clean, _ = self._run_step('_downcast_dtypes', df_clean)
+        
+        return df_clean
+    
+    def _run_steps(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Run every enrichment step in PIPELINE_STEPS order"""
+        if self.cache_dir is not None:
+            return self._run_steps_cached(df)
+        
+        for step in self.PIPELINE_STEPS:
+            df, _ = self._run_step(step, df)
+        return df
+    
+    def _step_overwrites(self, step: str, df: pd.DataFrame) -> List[str]:
+        """Raw columns a single enrichment step replaces in place"""
+        if step == '_parse_datetime_columns':
+            return self._datetime_columns(df)
+        if step == '_standardize_country_codes':
+            return [col for col in df.columns if 'country_code' in col]
+        if step == '_run_steps_parallel':
+            return self._overwritten_columns(df)
+        if step == '_downcast_dtypes':
+            return [col for col in df.columns if col in self.OUTPUT_DTYPES]
+        return []
+    
+    @staticmethod
+    def _peak_rss_mb() -> float:
+        """Peak resident set size of this process in MB (NaN where unavailable)"""
+        try:
+            import resource
+        except ImportError:  # Windows
+            return np.nan
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+    
+    def _run_step(self, step: str, df: pd.DataFrame, func=None) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Run one step and record its timings in the processing profile
+        
+        Args:
+            step: Step name (a DataCleaning method unless `func` is given)
+            df: Input dataframe
+            func: Callable to run instead of the `step` method
+            
+        Returns:
+            Tuple of (output dataframe, new and overwritten columns)
+        """
+        func = func if func is not None else getattr(self, step)
+        columns_before = set(df.columns)
+        overwritten = self._step_overwrites(step, df)
+        n_rows = len(df)
+        rss_before = self._peak_rss_mb()
+        
+        start = time.perf_counter()
+        if self.profile_path is not None:
+            with _StackSampler() as sampler:
+                df = func(df)
+            stacks = self._step_stacks.setdefault(step, {})
+            for stack, count in sampler.counts.items():
+                stacks[stack] = stacks.get(stack, 0) + count
+        else:
+            df = func(df)
+        seconds = time.perf_counter() - start
+        
+        outputs = [col for col in df.columns if col not in columns_before or col in overwritten]
+        self._record_step(step, n_rows, seconds, self._peak_rss_mb() - rss_before, df[outputs])
+        return df, outputs
+    
+    def _record_step(self, step: str, n_rows: int, seconds: float, rss_delta_mb: float,
+                     outputs: pd.DataFrame, cached: bool = False):
+        """Append one step run to the raw timings behind `processing_profile`"""
+        self._step_timings.append({
+            'step': step,
+            'rows': n_rows,
+            'seconds': seconds,
+            'peak_rss_delta_mb': rss_delta_mb,
+            'output_columns': len(outputs.columns),
+            'output_mb': outputs.memory_usage(deep=True, index=False).sum() / 1024**2,
+            'cached': cached,
+        })
+    
+    def _reset_profile(self):
+        """Clear the step timings and stack samples of a previous run"""
+        self._step_timings = []
+        self._step_stacks = {}
+    
+    def _finish_profile(self):
+        """
+        Build `processing_profile` from the recorded step timings
+        
+        Repeated runs of a step (one per chunk in streaming mode) are
+        summed; the peak RSS delta is the largest over the runs. With
+        `profile_path` set, the collapsed stacks of the slowest step are
+        written there.
+        """
+        if not self._step_timings:
+            return
+        
+        timings = pd.DataFrame(self._step_timings)
+        profile = timings.groupby('step', sort=False).agg(
+            calls=('rows', 'size'),
+            rows=('rows', 'sum'),
+            seconds=('seconds', 'sum'),
+            peak_rss_delta_mb=('peak_rss_delta_mb', 'max'),
+            output_columns=('output_columns', 'max'),
+            output_mb=('output_mb', 'sum'),
+            cached_calls=('cached', 'sum'),
+        )
+        profile.insert(3, 'rows_per_sec', profile['rows'] / profile['seconds'].where(profile['seconds'] > 0))
+        profile['pct_time'] = profile['seconds'] / profile['seconds'].sum() * 100
+        self.processing_profile = profile
+        
+        if self.verbose:
+            print("\nStep profile:")
+            for step, row in profile.iterrows():
+                print(f"  {step:<30} {row['seconds']:8.2f}s  {row['rows_per_sec']:>14,.0f} rows/s  "
+                      f"{row['peak_rss_delta_mb']:+8.1f} MB peak RSS  {row['output_mb']:8.1f} MB out")
+        
+        if self.profile_path is not None and self._step_stacks:
+            slowest = profile.loc[list(self._step_stacks), 'seconds'].idxmax()
+            self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.profile_path, 'w') as f:
+                for stack, count in sorted(self._step_stacks[slowest].items()):
+                    f.write(f"{stack} {count}\n")
+            self._log(f"Wrote stack samples of slowest step {slowest} to {self.profile_path}")
+    
+    def save_profile(self, path: Union[str, Path]):
+        """
+        Write `processing_profile` to a JSON file (one record per step)
+        
+        Args:
+            path: Destination .json file
+        """
+        if self.processing_profile is None:
+            raise ValueError("No profile yet: run process() or process_stream() first")
+        self.processing_profile.reset_index().to_json(path, orient='records', indent=2)
+    
+    def _config_hash(self, step: str) -> str:
+        """Hash of the source code and settings listed for a step in STEP_CONFIG"""
+        digest = hashlib.sha1(step.encode())
+        for name in self.STEP_CONFIG.get(step, [step]):
+            value = getattr(self, name)
+            if callable(value):
+                try:
+                    value = inspect.getsource(value)
+                except (OSError, TypeError):
+                    value = getattr(value, '__qualname__', repr(value))
+            else:
+                value = json.dumps(value, sort_keys=True, default=str)
+            digest.update(f"{name}={value}".encode())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _column_fingerprint(series: pd.Series) -> str:
+        """Hash of a column's name, dtype, index and values"""
+        digest = hashlib.sha1(f"{series.name}:{series.dtype}".encode())
+        digest.update(pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    def _run_steps_cached(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the enrichment steps, reusing cached step outputs where possible
+        
+        Each step's key combines the fingerprint of the raw columns it reads,
+        the hash of its code/config (STEP_CONFIG) and the keys of its
+        upstream steps (STEP_DEPENDENCIES), so editing e.g. FARMING_SEASONS
+        only recomputes the two season steps. Outputs (new and overwritten
+        columns) are pickled to cache_dir/<step>/<key>.pkl.
+        
+        Args:
+            df: Raw dataframe owned by the pipeline
+            
+        Returns:
+            DataFrame with the enrichment columns added
+        """
+        fingerprints = {}
+        keys = {}
+        
+        for step in self.PIPELINE_STEPS:
+            digest = hashlib.sha1(self._config_hash(step).encode())
+            for col in self.STEP_INPUT_COLUMNS.get(step, []):
+                if col in df.columns:
+                    if col not in fingerprints:
+                        fingerprints[col] = self._column_fingerprint(df[col])
+                    digest.update(fingerprints[col].encode())
+            for upstream in self.STEP_DEPENDENCIES.get(step, []):
+                digest.update(keys[upstream].encode())
+            keys[step] = digest.hexdigest()
+            
+            path = self.cache_dir / step / f"{keys[step]}.pkl"
+            if path.exists():
+                start = time.perf_counter()
+                cached = pd.read_pickle(path)
+                for col in cached.columns:
+                    df[col] = cached[col]
+                self._record_step(step, len(df), time.perf_counter() - start, 0.0, cached, cached=True)
+                self._log(f"{step}: loaded {len(cached.columns)} columns from cache")
+                continue
+            
+            df, outputs = self._run_step(step, df)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            df[outputs].to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        
+        return df
+    
+    def _step_input_columns(self, df: pd.DataFrame) -> List[str]:
+        """Columns of a raw frame that any enrichment step reads"""
+        needed = set(self.pipeline_columns()) | set(self._datetime_columns(df))
+        needed |= {col for col in df.columns 
+                   if 'country_code' in col or col.endswith('language')}
+        return [col for col in df.columns if col in needed]
+    
+    def _overwritten_columns(self, df: pd.DataFrame) -> List[str]:
+        """Raw columns the enrichment steps replace in place"""
+        return [col for step in self.PIPELINE_STEPS for col in self._step_overwrites(step, df)]
+    
+    def _run_steps_parallel(self, df: pd.DataFrame, n_partitions: int) -> pd.DataFrame:
+        """
+        Run the enrichment steps on contiguous row partitions in a process pool
+        
+        Only the columns the steps read are sent to workers, and only new or
+        overwritten columns come back. Both directions go through memory-mapped
+        Arrow IPC files rather than pickles; the partitions are reassembled in
+        their original order, giving the same frame as a serial run.
+        
+        Args:
+            df: Raw dataframe owned by the pipeline
+            n_partitions: Number of row partitions / worker tasks
+            
+        Returns:
+            DataFrame with the enrichment columns added
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        self._log(f"Running enrichment steps on {n_partitions} partitions "
+                  f"({self.n_jobs} workers)...")
+        
+        # Workers get a quiet, serial copy of this processor (including any overrides)
+        worker = copy.copy(self)
+        worker.verbose = False
+        worker.n_jobs = 1
+        worker.processing_log = []
+        worker.profile_path = None
+        
+        in_columns = self._step_input_columns(df)
+        bounds = np.linspace(0, len(df), n_partitions + 1).astype(int)
+        
+        with tempfile.TemporaryDirectory(prefix='wefarm_') as tmp_dir:
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, n_partitions)) as pool:
+                futures = []
+                for i, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+                    in_path = os.path.join(tmp_dir, f"in-{i:04d}.arrow")
+                    out_path = os.path.join(tmp_dir, f"out-{i:04d}.arrow")
+                    partition = df.iloc[lo:hi][in_columns].reset_index(drop=True)
+                    object_cols = _write_arrow(partition, in_path)
+                    futures.append((out_path, pool.submit(
+                        _enrich_partition, worker, in_path, object_cols, in_columns, out_path)))
+                
+                results = []
+                for i, (out_path, future) in enumerate(futures):
+                    object_cols, out_columns, log = future.result()
+                    results.append(_read_arrow(out_path, object_cols, out_columns))
+                    if i == 0:
+                        self.processing_log.extend(log)
+        
+        enriched = self._concat_partitions(results)
+        enriched.index = df.index
+        for col in enriched.columns:
+            df[col] = enriched[col]
+        
+        return df
+    
+    @staticmethod
+    def _concat_partitions(parts: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate enriched partitions, matching the dtypes of a serial run
+        
+        An all-null partition can come back with a different datetime
+        resolution (or no categories); those columns are cast to the dtype
+        of the partitions that hold data before concatenating.
+        
+        Args:
+            parts: Partition results in row order
+            
+        Returns:
+            Concatenated frame with a RangeIndex
+        """
+        for col in parts[0].columns:
+            dtypes = {str(part[col].dtype) for part in parts if part[col].notna().any()}
+            if len(dtypes) != 1:
+                continue
+            target = next(part[col].dtype for part in parts if part[col].notna().any())
+            for part in parts:
+                if part[col].dtype != target and part[col].isna().all():
+                    part[col] = part[col].astype(target)
+        return pd.concat(parts, ignore_index=True)
+    
+    def _downcast_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Add farming season context based on country and month
+        Downcast enriched columns to the compact OUTPUT_DTYPES plan
+        
+        Integer targets switch to their nullable variant when a column has
+        missing values, and columns whose values do not fit the target are
+        left unchanged. A per-column before/after memory report is stored
+        in `self.memory_report`.
         
         Args:
-            df: Input dataframe
+            df: Enriched dataframe (renamed columns)
             
         Returns:
-            DataFrame with farming season indicators
+            DataFrame with compact dtypes
         """
-        self._log("Adding farming season context...")
+        self._log("Downcasting to compact dtypes...")
         
-        if 'question_month' not in df.columns or 'question_user_country_code' not in df.columns:
-            self._log("  Skipping: Required columns not found")
-            return df
+        before = df.memory_usage(deep=True, index=False)
+        before_dtypes = df.dtypes.astype(str)
         
-        def get_season(row):
-            """Determine farming season for a given row"""
-            country = row.get('question_user_country_code')
-            month = row.get('question_month')
-            
-            if pd.isna(country) or pd.isna(month):
-                return None
-            
-            if country not in self.FARMING_SEASONS:
-                return None
+        for col, target in self.OUTPUT_DTYPES.items():
+            if col not in df.columns or str(df[col].dtype) == target:
+                continue
             
-            seasons = self.FARMING_SEASONS[country]
-            active_seasons = []
+            series = df[col]
+            if target.startswith('int'):
+                info = np.iinfo(target)
+                if series.notna().any() and (series.min() < info.min or series.max() > info.max):
+                    self._log(f"  Keeping {col} as {series.dtype}: values exceed {target}")
+                    continue
+                if series.isna().any():
+                    target = target.capitalize()  # e.g. int8 -> Int8
+            elif target == 'bool' and series.isna().any():
+                target = 'boolean'
             
-            for season_name, (start_month, end_month) in seasons.items():
-                # Handle seasons that span year boundary
-                if start_month <= end_month:
-                    if start_month <= month <= end_month:
-                        active_seasons.append(season_name)
-                else:  # Wraps around year (e.g., Dec-Feb)
-                    if month >= start_month or month <= end_month:
-                        active_seasons.append(season_name)
-            
-            return ','.join(active_seasons) if active_seasons else 'off_season'
+            df[col] = series.astype(target)
         
-        df['farming_season'] = df.apply(get_season, axis=1)
+        after = df.memory_usage(deep=True, index=False)
+        report = pd.DataFrame({
+            'dtype_before': before_dtypes,
+            'dtype_after': df.dtypes.astype(str),
+            'bytes_before': before,
+            'bytes_after': after,
+        })
+        report['saved_pct'] = (1 - report['bytes_after'] / report['bytes_before'].where(
+            report['bytes_before'] > 0)).fillna(0) * 100
+        report.index.name = 'column'
+        self.memory_report = report
         
         if self.verbose:
-            season_counts = df['farming_season'].value_counts()
-            print(f"  Farming season distribution:")
-            for season, count in season_counts.head(5).items():
-                print(f"    {season}: {count:,}")
+            total_before, total_after = before.sum(), after.sum()
+            print(f"  Memory: {total_before / 1e6:,.1f} MB -> {total_after / 1e6:,.1f} MB "
+                  f"({(1 - total_after / max(total_before, 1)) * 100:.0f}% saved)")
+            changed = report[report['dtype_before'] != report['dtype_after']]
+            for col, row in changed.sort_values('bytes_before', ascending=False).head(5).iterrows():
+                print(f"    {col}: {row['dtype_before']} -> {row['dtype_after']} "
+                      f"({row['bytes_before'] / 1e6:,.1f} -> {row['bytes_after'] / 1e6:,.1f} MB)")
         
         return df
     
-    def _add_standardized_season(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _iter_chunks(self, path: Union[str, Path], chunksize: int,
+                     columns: Optional[List[str]] = None):
         """
-        Add standardized season labels (rainy/harvest) across countries
+        Yield raw dataframe chunks from a CSV file or Parquet dataset
+        
+        Args:
+            path: Raw CSV file, or Parquet file/directory written by `csv_to_parquet`
+            chunksize: Maximum rows per chunk
+            columns: Columns to read (default: all)
+            
+        Yields:
+            Raw dataframe chunks with the columnar (Parquet) dtypes
         """
-        if 'question_month' not in df.columns or 'question_user_country_code' not in df.columns:
-            return df
-
-        def get_standardized_season(row):
-            """Map to standardized rainy/harvest seasons"""
-            country = row.get('question_user_country_code')
-            month = row.get('question_month')
-
-            if pd.isna(country) or pd.isna(month):
-                return None
-
-            # Standardized season mapping
-            # Rainy = planting seasons
-            # Harvest = harvest seasons
-
-            if country == 'KEN':
-                if 3 <= month <= 5:  # Long rains
-                    return 'rainy_main'
-                elif 10 <= month <= 12:  # Short rains
-                    return 'rainy_secondary'
-                elif 6 <= month <= 8:  # Harvest 1
-                    return 'harvest_main'
-                elif month in [1, 2]:  # Harvest 2
-                    return 'harvest_secondary'
-
-            elif country == 'UGA':
-                if 3 <= month <= 5:  # Season A plant
-                    return 'rainy_main'
-                elif 9 <= month <= 11:  # Season B plant
-                    return 'rainy_secondary'
-                elif 6 <= month <= 8:  # Season A harvest
-                    return 'harvest_main'
-                elif month in [12, 1, 2]:  # Season B harvest
-                    return 'harvest_secondary'
-
-            elif country == 'TZA':
-                if 3 <= month <= 5:  # Masika rains
-                    return 'rainy_main'
-                elif 10 <= month <= 12:  # Vuli rains
-                    return 'rainy_secondary'
-                elif 6 <= month <= 8:  # Harvest
-                    return 'harvest_main'
-
-            return 'off_season'
-
-        df['season_standardized'] = df.apply(get_standardized_season, axis=1)
-
-        if self.verbose:
-            season_counts = df['season_standardized'].value_counts()
-            print(f"  Standardized seasons:")
-            for season, count in season_counts.items():
-                print(f"    {season}: {count:,}")
-
-        return df
+        path = Path(path)
+        
+        if path.suffix.lower() == '.csv':
+            read_dtypes = {col: 'string' for col in 
+                           self.RAW_CATEGORICAL_COLUMNS + self.RAW_TEXT_COLUMNS}
+            usecols = (lambda col: col in columns) if columns is not None else None
+            for chunk in pd.read_csv(path, chunksize=chunksize, dtype=read_dtypes,
+                                     usecols=usecols):
+                yield self._coerce_raw_dtypes(chunk)
+            return
+        
+        import pyarrow as pa
+        
+        dataset = self._parquet_dataset(path)
+        if columns is not None:
+            columns = [col for col in dict.fromkeys(columns) if col in dataset.schema.names]
+        
+        for batch in dataset.to_batches(columns=columns, batch_size=chunksize):
+            if batch.num_rows:
+                yield self._restore_categoricals(pa.Table.from_batches([batch]).to_pandas())
     
-    def _compute_data_completeness(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _output_arrow_types(self) -> Dict:
         """
-        Add data completeness metrics per row
+        Arrow type of each enriched column, from the dtype plan
+        
+        Covers renamed IDs, text and timestamps, plus OUTPUT_DTYPES when
+        `compact_dtypes` is on (categoricals become int32-indexed string
+        dictionaries). Types never depend on a chunk's values, so a chunk
+        with no rows or an all-null column cannot narrow them to `null`.
+        
+        Returns:
+            Dict of enriched column name -> pyarrow DataType
+        """
+        import pyarrow as pa
+        
+        rename = lambda cols: [self.RENAME_MAP.get(col, col) for col in cols]
+        types = {col: pa.int64() for col in rename(self.RAW_ID_COLUMNS)}
+        types.update({col: pa.large_string() for col in rename(self.RAW_TEXT_COLUMNS)})
+        types.update({col: pa.timestamp('us', tz='UTC')
+                      for col in rename(self.STEP_INPUT_COLUMNS['_parse_datetime_columns'])})
+        if self.compact_dtypes:
+            for col, target in self.OUTPUT_DTYPES.items():
+                types[col] = (pa.dictionary(pa.int32(), pa.string()) if target == 'category'
+                              else pa.from_numpy_dtype(np.dtype(target)))
+        return types
+    
+    def _stream_schema(self, enriched: pd.DataFrame, planned: Dict) -> 'pa.Schema':
+        """
+        Arrow schema pinned for every part written by `process_stream`
         
         Args:
-            df: Input dataframe
+            enriched: An enriched chunk (only its columns and dtypes are used)
+            planned: Column -> type from `_output_arrow_types`
             
         Returns:
-            DataFrame with completeness metrics
+            Schema with the planned types; other columns take the type Arrow
+            infers from their dtype, with `null` widened to string
         """
-        self._log("Computing data completeness metrics...")
+        import pyarrow as pa
         
-        # Core fields completeness
-        core_fields = [
-            'question_content', 'question_language', 'question_user_country_code',
-            'response_content', 'response_language'
-        ]
+        inferred = pa.Schema.from_pandas(enriched.iloc[:0], preserve_index=False)
+        fields = []
+        for field in inferred:
+            dtype = planned.get(field.name, field.type)
+            if pa.types.is_null(dtype):
+                dtype = pa.large_string()
+            elif pa.types.is_dictionary(dtype) and pa.types.is_null(dtype.value_type):
+                dtype = pa.dictionary(pa.int32(), pa.string())
+            fields.append(pa.field(field.name, dtype))
+        return pa.schema(fields)
+    
+    def process_stream(self, path: Union[str, Path], chunksize: int = 1_000_000,
+                       out_dir: Optional[Union[str, Path]] = None,
+                       columns: Optional[List[str]] = None) -> Path:
+        """
+        Out-of-core processing pipeline
         
-        available_core = [f for f in core_fields if f in df.columns]
-        df['core_fields_complete_pct'] = (
-            df[available_core].notna().sum(axis=1) / len(available_core) * 100
-        )
+        Runs the same enrichment as `process` over chunks of a CSV file or
+        Parquet dataset and writes each enriched chunk to disk, so peak memory
+        is bounded by the chunk size. Dataset-wide summaries are accumulated
+        across chunks and stored in `self.stream_stats`.
         
-        # User metadata completeness
-        user_metadata_fields = [
-            'question_user_gender', 'question_user_dob',
-            'response_user_gender', 'response_user_dob'
-        ]
+        Args:
+            path: Raw CSV file, or Parquet dataset written by `csv_to_parquet`
+            chunksize: Rows per chunk
+            out_dir: Output directory for enriched Parquet parts
+                (default: '<input name>_enriched' next to the input)
+            columns: Raw columns to keep besides those the enrichment steps read
+                (default: all columns)
+            
+        Returns:
+            Path to the directory of enriched Parquet parts
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
         
-        available_metadata = [f for f in user_metadata_fields if f in df.columns]
-        if available_metadata:
-            df['user_metadata_complete_pct'] = (
-                df[available_metadata].notna().sum(axis=1) / len(available_metadata) * 100
-            )
+        path = Path(path)
+        out_dir = Path(out_dir) if out_dir is not None else path.with_name(f"{path.stem}_enriched")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        read_columns = self.pipeline_columns(columns) if columns is not None else None
         
-        # Has topic labels
-        if 'question_topic' in df.columns:
-            df['has_question_topic'] = df['question_topic'].notna()
+        self._log(f"Starting streaming pipeline on {path} ({chunksize:,} rows per chunk)...")
+        self._log("="*80)
         
-        if 'response_topic' in df.columns:
-            df['has_response_topic'] = df['response_topic'].notna()
+        self._reset_profile()
+        stats = self._new_stream_stats()
+        planned = self._output_arrow_types()
+        schema = None
+        verbose = self.verbose
+        self.verbose = False  # Per-chunk summaries are replaced by the totals below
+        try:
+            for i, chunk in enumerate(self._iter_chunks(path, chunksize, read_columns)):
+                stats['rows_in'] += len(chunk)
+                chunk = chunk.drop(columns=['Unnamed: 0'], errors='ignore')
+                enriched = self._enrich(chunk)
+                if enriched.empty:  # e.g. a chunk holding only 'gb' rows
+                    continue
+                self._update_stream_stats(stats, enriched)
+                
+                # One schema from the dtype plan for all parts, so they stay compatible
+                if schema is None:
+                    schema = self._stream_schema(enriched, planned)
+                table = pa.Table.from_pandas(enriched, schema=schema, preserve_index=False)
+                pq.write_table(table, out_dir / f"part-{stats['chunks']:05d}.parquet")
+                stats['chunks'] += 1
+                
+                if verbose:
+                    print(f"  Chunk {i + 1}: {stats['rows_in']:,} rows read, "
+                          f"{stats['rows_out']:,} written")
+        finally:
+            self.verbose = verbose
         
-        if self.verbose:
-            print(f"  Core fields completeness: {df['core_fields_complete_pct'].mean():.1f}% avg")
-            if 'user_metadata_complete_pct' in df.columns:
-                print(f"  User metadata completeness: {df['user_metadata_complete_pct'].mean():.1f}% avg")
+        self.stream_stats = stats
+        self._log_stream_stats(stats)
+        self._finish_profile()
+        self._log("="*80)
+        self._log(f"Streaming complete! Output: {stats['rows_out']:,} rows in "
+                  f"{stats['chunks']} parts at {out_dir}")
         
-        return df
+        return out_dir
     
-    def _add_text_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _new_stream_stats() -> Dict:
+        """Empty accumulator for dataset-wide streaming statistics"""
+        return {
+            'chunks': 0,
+            'rows_in': 0,
+            'rows_out': 0,
+            'datetime': {},     # column -> {'valid', 'null', 'min', 'max'}
+            'sums': {},         # column -> [sum, count] for running means
+            'seasons': {},      # column -> {label: count}
+        }
+    
+    @staticmethod
+    def _update_stream_stats(stats: Dict, df: pd.DataFrame):
         """
-        Extract text-based features (length, word count, etc.)
+        Fold one enriched chunk into the running statistics
         
         Args:
-            df: Input dataframe
+            stats: Accumulator from `_new_stream_stats`
+            df: Enriched chunk (renamed columns)
+        """
+        stats['rows_out'] += len(df)
+        
+        for col in df.columns:
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                continue
+            col_stats = stats['datetime'].setdefault(
+                col, {'valid': 0, 'null': 0, 'min': None, 'max': None})
+            valid = int(df[col].notna().sum())
+            col_stats['valid'] += valid
+            col_stats['null'] += len(df) - valid
+            if valid:
+                lo, hi = df[col].min(), df[col].max()
+                col_stats['min'] = lo if col_stats['min'] is None else min(col_stats['min'], lo)
+                col_stats['max'] = hi if col_stats['max'] is None else max(col_stats['max'], hi)
+        
+        for col in ['completeness_pct', 'metadata_pct', 'response_time_hrs',
+                    'q_chars', 'r_chars']:
+            if col in df.columns:
+                acc = stats['sums'].setdefault(col, [0.0, 0])
+                acc[0] += float(df[col].sum())
+                acc[1] += int(df[col].notna().sum())
+        
+        for col in ['season', 'season_std']:
+            if col in df.columns:
+                counts = stats['seasons'].setdefault(col, {})
+                for label, count in df[col].value_counts().items():
+                    counts[label] = counts.get(label, 0) + int(count)
+    
+    def _log_stream_stats(self, stats: Dict):
+        """Log the dataset-wide statistics accumulated by `process_stream`"""
+        self._log(f"Dataset totals: {stats['rows_in']:,} rows read, "
+                  f"{stats['rows_out']:,} rows written")
+        
+        for col, col_stats in stats['datetime'].items():
+            date_range = (f"{col_stats['min']} to {col_stats['max']}" 
+                          if col_stats['valid'] else "No valid dates")
+            self._log(f"  {col}: Valid: {col_stats['valid']:,} | Null: {col_stats['null']:,} "
+                      f"| Range: {date_range}")
+        
+        labels = {
+            'completeness_pct': 'Core fields completeness',
+            'metadata_pct': 'User metadata completeness',
+        }
+        for col, (total, count) in stats['sums'].items():
+            if count and col in labels:
+                self._log(f"  {labels[col]}: {total / count:.1f}% avg")
+        
+        for col, counts in stats['seasons'].items():
+            top = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:5]
+            self._log(f"  {col}: " + ", ".join(f"{label}={count:,}" for label, count in top))
+    
+    
+class CorrelationAccumulator:
+    """
+    Streaming Pearson correlation and least-squares line of (x, y) pairs
+    
+    Each chunk is reduced to its count, means, sums of squared deviations
+    and co-deviation, and merged into the running totals with the pairwise
+    update of Chan et al., so any number of rows is summarised in constant
+    memory and partial accumulators (per chunk, file or worker) combine
+    into the same result.
+    """
+    
+    def __init__(self):
+        self.n = 0.0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+        self.min_x, self.max_x = np.inf, -np.inf
+    
+    def update(self, x, y, weights=None) -> 'CorrelationAccumulator':
+        """
+        Add a chunk of pairs (pairs with a missing value are skipped)
+        
+        Args:
+            x: x values
+            y: y values
+            weights: Optional repeat count of each pair
             
         Returns:
-            DataFrame with text features
+            self
         """
-        self._log("Extracting text features...")
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        w = np.ones_like(x) if weights is None else np.asarray(weights, dtype=float)
+        keep = ~(np.isnan(x) | np.isnan(y))
+        if not keep.all():
+            x, y, w = x[keep], y[keep], w[keep]
         
-        if 'question_content' in df.columns:
-            df['question_length_chars'] = df['question_content'].fillna('').str.len()
-            df['question_word_count'] = df['question_content'].fillna('').str.split().str.len()
-            
-            if self.verbose:
-                print(f"  Question length: median={df['question_length_chars'].median():.0f} chars, "
-                      f"mean={df['question_length_chars'].mean():.0f} chars")
+        chunk = CorrelationAccumulator()
+        chunk.n = w.sum()
+        if chunk.n == 0:
+            return self
+        chunk.mean_x = (w * x).sum() / chunk.n
+        chunk.mean_y = (w * y).sum() / chunk.n
+        dx = x - chunk.mean_x
+        dy = y - chunk.mean_y
+        chunk.m2_x = (w * dx * dx).sum()
+        chunk.m2_y = (w * dy * dy).sum()
+        chunk.c_xy = (w * dx * dy).sum()
+        chunk.min_x, chunk.max_x = x.min(), x.max()
+        return self.merge(chunk)
+    
+    def merge(self, other: 'CorrelationAccumulator') -> 'CorrelationAccumulator':
+        """
+        Fold another accumulator into this one
         
-        if 'response_content' in df.columns:
-            df['response_length_chars'] = df['response_content'].fillna('').str.len()
-            df['response_word_count'] = df['response_content'].fillna('').str.split().str.len()
+        Args:
+            other: Accumulator over a disjoint set of pairs
             
-            if self.verbose:
-                print(f"  Response length: median={df['response_length_chars'].median():.0f} chars, "
-                      f"mean={df['response_length_chars'].mean():.0f} chars")
+        Returns:
+            self
+        """
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        scale = self.n * other.n / n
+        self.m2_x += other.m2_x + dx * dx * scale
+        self.m2_y += other.m2_y + dy * dy * scale
+        self.c_xy += other.c_xy + dx * dy * scale
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.n = n
+        self.min_x = min(self.min_x, other.min_x)
+        self.max_x = max(self.max_x, other.max_x)
+        return self
+    
+    @property
+    def r(self) -> float:
+        """Pearson correlation coefficient"""
+        if self.m2_x == 0 or self.m2_y == 0:
+            return np.nan
+        if self.n == 2:
+            return float(np.sign(self.c_xy))
+        return float(np.clip(self.c_xy / np.sqrt(self.m2_x * self.m2_y), -1, 1))
+    
+    @property
+    def p_value(self) -> float:
+        """Two-sided p-value of r (t-test with n - 2 degrees of freedom, as scipy's pearsonr)"""
+        from scipy.stats import t as t_dist
         
-        return df
+        r = self.r
+        if self.n < 2 or np.isnan(r):
+            return np.nan
+        if self.n == 2:
+            # Two points always lie on a line; pearsonr returns 1.0
+            return 1.0
+        if abs(r) == 1:
+            return 0.0
+        t_stat = r * np.sqrt((self.n - 2) / (1 - r**2))
+        return float(2 * t_dist.sf(abs(t_stat), self.n - 2))
     
-    def _standardize_language_codes(self, df: pd.DataFrame) -> pd.DataFrame:
+    @property
+    def slope(self) -> float:
+        """Least-squares slope of y on x"""
+        return self.c_xy / self.m2_x if self.m2_x else np.nan
+    
+    @property
+    def intercept(self) -> float:
+        """Least-squares intercept of y on x"""
+        return self.mean_y - self.slope * self.mean_x
+    
+    
+class AggregateCube:
+    """
+    Compact aggregates of an enriched frame, shared by the EDA plots
+    
+    The core is a table of row counts per observed combination of the
+    CUBE_DIMS columns (`counts`); 1-D distributions and crosstabs of those
+    dimensions are marginals of it. The plots also need a few aggregates
+    the cube cannot express (distributions of numeric columns, questions
+    per user, the question/response lengths), kept as weighted value
+    counts so histograms and statistics come out as on the raw rows, or as
+    a fixed-size 2-D histogram and streaming moments for the length pairs.
+    
+    Aggregates are computed on first use from the source frame;
+    `materialize()` computes all of them and drops the frame, leaving an
+    object whose size does not depend on the number of rows. Build one
+    with `EDA.build_cube(df)` and pass it to any `EDA.plot_*` method
+    in place of the frame.
+    """
+    
+    # Dimensions of the count cube
+    CUBE_DIMS = [
+        'q_country', 'q_language', 'q_month', 'q_weekday', 'season_std',
+        'q_topic', 'q_gender', 'q_user_status',
+    ]
+    
+    # Columns whose value counts are kept separately (too fine-grained for the cube)
+    VALUE_COUNT_COLUMNS = ['q_year_month', 'q_year', 'q_hour_local', 'r_country',
+                           'q_chars', 'completeness_pct']
+    
+    # Bins per axis of the question/response length grid, and rows per accumulator update
+    LENGTH_GRID_BINS = 200
+    CHUNK_ROWS = 1_000_000
+    
+    def __init__(self, df: pd.DataFrame):
         """
-        Add human-readable language names
+        Args:
+            df: Enriched dataframe (output of DataCleaning.process)
+        """
+        self._df = df
+        self.n_rows = len(df)
+        self.columns = pd.Index(df.columns)
+        self._cache = {}
+    
+    def _cached(self, key: str, compute):
+        """Return a cached aggregate, computing it from the source frame on first use"""
+        if key not in self._cache:
+            if self._df is None:
+                raise KeyError(f"{key} was not materialized for this cube")
+            self._cache[key] = compute(self._df)
+        return self._cache[key]
+    
+    def has(self, key: str) -> bool:
+        """Whether aggregate `key` is cached or can still be computed from the source frame"""
+        return key in self._cache or self._df is not None
+    
+    def materialize(self) -> 'AggregateCube':
+        """
+        Compute every aggregate the plots use and release the source frame
+        
+        Returns:
+            self
+        """
+        if self._df is None:
+            return self
+        
+        self.counts
+        self.missing
+        for col in self.VALUE_COUNT_COLUMNS:
+            if col in self.columns:
+                self.value_counts(col)
+        if 'response_time_hrs' in self.columns:
+            self.response_time_hist
+        if 'q_language' in self.columns and 'r_language' in self.columns:
+            self.lang_match_counts
+        if 'q_user_dob' in self.columns:
+            self.age_counts
+        if 'q_user_id' in self.columns:
+            self.user_activity_counts
+        if 'q_chars' in self.columns and 'r_chars' in self.columns:
+            self.length_grid
+            self.length_moments
+        
+        self._df = None
+        return self
+    
+    @property
+    def counts(self) -> pd.DataFrame:
+        """Row count ('n') per observed combination of the CUBE_DIMS present (nulls kept)"""
+        def compute(df):
+            dims = [col for col in self.CUBE_DIMS if col in df.columns]
+            if not dims:
+                return pd.DataFrame({'n': [len(df)]})
+            return (df.groupby(dims, observed=True, dropna=False).size()
+                    .rename('n').reset_index())
+        return self._cached('counts', compute)
+    
+    @property
+    def missing(self) -> pd.Series:
+        """Null count per column"""
+        return self._cached('missing', lambda df: df.isnull().sum())
+    
+    def value_counts(self, col: str) -> pd.Series:
+        """
+        Non-null value counts of a column, most common first
         
         Args:
-            df: Input dataframe
+            col: A CUBE_DIMS or VALUE_COUNT_COLUMNS column
             
         Returns:
-            DataFrame with language name columns
+            Counts indexed by value
         """
-        self._log("Adding language names...")
+        if col in self.CUBE_DIMS:
+            counts = self.counts.groupby(col, observed=True)['n'].sum()
+            return counts[counts > 0].sort_values(ascending=False)
+        return self._cached(f'value_counts:{col}', lambda df: df[col].value_counts())
+    
+    def crosstab(self, index: str, columns: str) -> pd.DataFrame:
+        """
+        Counts of two CUBE_DIMS columns against each other (like pd.crosstab)
         
-        lang_cols = [col for col in df.columns if 'language' in col and col.endswith('language')]
+        Args:
+            index: Row dimension
+            columns: Column dimension
+            
+        Returns:
+            DataFrame of counts, zero-filled
+        """
+        return (self.counts.groupby([index, columns], observed=True)['n'].sum()
+                .unstack(fill_value=0))
+    
+    @property
+    def response_time_hist(self) -> Optional[Dict]:
+        """Log-spaced 30-bin histogram and median of response times in days (None if empty)"""
+        def compute(df):
+            days = df['response_time_hrs'].dropna() / 24
+            if len(days) == 0:
+                return None
+            bins = np.logspace(np.log10(days.min() + 0.01), np.log10(days.max()), 30)
+            counts, _ = np.histogram(days, bins=bins)
+            return {'bins': bins, 'counts': counts, 'median': days.median()}
+        return self._cached('response_time_hist', compute)
+    
+    @property
+    def lang_match_counts(self) -> pd.Series:
+        """Counts of question/response language matches (True) and mismatches (False)"""
+        def compute(df):
+            q, r = df['q_language'], df['r_language']
+            if isinstance(q.dtype, pd.CategoricalDtype) and isinstance(r.dtype, pd.CategoricalDtype):
+                # Compare codes over shared categories instead of the labels
+                categories = q.cat.categories.union(r.cat.categories)
+                q_codes = q.cat.set_categories(categories).cat.codes.to_numpy()
+                r_codes = r.cat.set_categories(categories).cat.codes.to_numpy()
+                match = pd.Series((q_codes == r_codes) & (q_codes >= 0))
+            else:
+                match = q == r
+            return match.value_counts()
+        return self._cached('lang_match_counts', compute)
+    
+    @property
+    def age_counts(self) -> pd.Series:
+        """Rows (question/response pairs) per asker age in years (15-90, from q_user_dob)"""
+        def compute(df):
+            age = datetime.now().year - pd.to_datetime(df['q_user_dob'], errors='coerce').dt.year
+            return age[(age >= 15) & (age <= 90)].value_counts().sort_index()
+        return self._cached('age_counts', compute)
+    
+    @property
+    def user_activity_counts(self) -> pd.Series:
+        """Number of users per questions-per-user value"""
+        return self._cached('user_activity_counts',
+                            lambda df: df.groupby('q_user_id').size().value_counts().sort_index())
+    
+    @property
+    def length_pairs(self) -> pd.DataFrame:
+        """Row count ('n') per observed (q_chars, r_chars) pair (not kept by `materialize`)"""
+        return self._cached('length_pairs',
+                            lambda df: df[['q_chars', 'r_chars']].dropna().value_counts()
+                                       .rename('n').reset_index())
+    
+    @property
+    def length_grid(self) -> Optional[Dict]:
+        """
+        LENGTH_GRID_BINS x LENGTH_GRID_BINS histogram of (q_chars, r_chars)
         
-        for col in lang_cols:
-            name_col = col.replace('language', 'language_name')
-            df[name_col] = df[col].map(self.LANGUAGE_CODE_MAP).fillna(df[col])
+        Dict of counts, xedges, yedges and extent (x/y min and max), or None
+        if no row has both lengths.
+        """
+        def compute(df):
+            pairs = df[['q_chars', 'r_chars']].dropna()
+            if len(pairs) == 0:
+                return None
+            x = pairs['q_chars'].to_numpy(dtype=float)
+            y = pairs['r_chars'].to_numpy(dtype=float)
+            extent = (x.min(), x.max(), y.min(), y.max())
+            # A constant column still needs a non-empty bin range
+            x_range = (extent[0], max(extent[1], extent[0] + 1))
+            y_range = (extent[2], max(extent[3], extent[2] + 1))
+            counts, xedges, yedges = np.histogram2d(x, y, bins=self.LENGTH_GRID_BINS,
+                                                    range=[x_range, y_range])
+            return {'counts': counts, 'xedges': xedges, 'yedges': yedges, 'extent': extent}
+        return self._cached('length_grid', compute)
+    
+    @property
+    def length_moments(self) -> CorrelationAccumulator:
+        """Correlation accumulator over (q_chars, r_chars), fed CHUNK_ROWS rows at a time"""
+        def compute(df):
+            accumulator = CorrelationAccumulator()
+            for lo in range(0, len(df), self.CHUNK_ROWS):
+                chunk = df[['q_chars', 'r_chars']].iloc[lo:lo + self.CHUNK_ROWS]
+                accumulator.update(chunk['q_chars'].to_numpy(dtype=float, na_value=np.nan),
+                                   chunk['r_chars'].to_numpy(dtype=float, na_value=np.nan))
+            return accumulator
+        return self._cached('length_moments', compute)
+    
+    @staticmethod
+    def weighted_stats(counts: pd.Series) -> Dict[str, float]:
+        """
+        Statistics of the values a value-counts series describes
+        
+        Args:
+            counts: Counts indexed by numeric value
             
-            if self.verbose:
-                print(f"  {col} -> {name_col}")
+        Returns:
+            Dict of n, mean, median, min and max (as over the repeated values)
+        """
+        counts = counts[counts > 0].sort_index()
+        values = counts.index.to_numpy(dtype=float)
+        weights = counts.to_numpy()
+        n = int(weights.sum())
+        if n == 0:
+            return {'n': 0, 'mean': np.nan, 'median': np.nan, 'min': np.nan, 'max': np.nan}
         
-        return df
+        # Median of the repeated values: mean of the two middle order statistics
+        cumulative = np.cumsum(weights)
+        lower = values[np.searchsorted(cumulative, (n - 1) // 2, side='right')]
+        upper = values[np.searchsorted(cumulative, n // 2, side='right')]
+        return {
+            'n': n,
+            'mean': float((values * weights).sum() / n),
+            'median': float((lower + upper) / 2),
+            'min': float(values[0]),
+            'max': float(values[-1]),
+        }
+    
+    
+class EDA:
+    ''' Exploratory visualisation of cleaned dataset '''
+    
+    # Question/response length panel: pre-binned grid (bounded cost) or distinct pairs
+    LENGTH_MODES = ('binned', 'exact')
+    
+    # Topic flow labels: 1-D slot assignment (bounded time) or adjustText's repulsion solver
+    LABEL_LAYOUTS = ('slots', 'adjusttext')
+    
+    # Figures written by render_report, in report order
+    REPORT_FIGURES = [
+        'plot_temporal_overview',
+        'plot_geographic_overview',
+        'plot_linguistic_overview',
+        'plot_user_overview',
+        'plot_data_quality',
+    ]
     
-    def process(self, df: pd.DataFrame) -> pd.DataFrame:
+    def build_cube(df: pd.DataFrame) -> AggregateCube:
         """
-        Main processing pipeline
+        Aggregate a processed dataframe once for all the overview plots
         
         Args:
-            df: Raw input dataframe
+            df: Processed dataframe
             
         Returns:
-            Cleaned and enriched dataframe
+            Materialized AggregateCube, accepted by every plot_* method
         """
-        self._log(f"Starting data processing pipeline on {len(df):,} rows...")
-        self._log("="*80)
+        return AggregateCube(df).materialize()
+    
+    def _as_cube(df: Union[pd.DataFrame, AggregateCube]) -> AggregateCube:
+        """Wrap a raw frame in a lazy cube (aggregates computed as the plot asks for them)"""
+        return df if isinstance(df, AggregateCube) else AggregateCube(df)
+    
+    def _label_slots(targets: np.ndarray, height: float,
+                     lower: float, upper: float) -> np.ndarray:
+        """
+        Place labels of equal height along one axis without overlap
         
-        # Create copy to avoid modifying original
-        df_clean = df.copy()
+        Labels keep their target order and sit at least `height` apart,
+        as close to their targets as possible (least squares, via pool
+        adjacent violators), then are pushed inside [lower, upper]. If
+        they cannot all fit, the spacing shrinks to share the span evenly.
+        O(n log n) and deterministic.
         
-        # Remove unnamed index column if present
-        if 'Unnamed: 0' in df_clean.columns:
-            df_clean = df_clean.drop(columns=['Unnamed: 0'])
+        Args:
+            targets: Label anchor positions
+            height: Minimum distance between label centres
+            lower: Lowest allowed label edge
+            upper: Highest allowed label edge
+            
+        Returns:
+            Label centre positions, in the order of `targets`
+        """
+        targets = np.asarray(targets, dtype=float)
+        n = len(targets)
+        if n == 0:
+            return targets.copy()
         
-        # Execute pipeline
-        df_clean = self._parse_datetime_columns(df_clean)
-        df_clean = self._standardize_country_codes(df_clean)
-        df_clean = self._standardize_language_codes(df_clean)
-        df_clean = self._add_temporal_features(df_clean)
-        df_clean = self._add_farming_season_context(df_clean)
-        df_clean = self._add_standardized_season(df_clean)
-        df_clean = self._add_text_features(df_clean)
-        df_clean = self._compute_data_completeness(df_clean)
+        height = min(height, (upper - lower) / n)
+        order = np.argsort(targets, kind='stable')
+        steps = height * np.arange(n)
         
-        # Rename columns to more readable format
-        rename_map = {
-            # Core IDs - keep as is, they're fine
-            'question_id': 'q_id',
-            'response_id': 'r_id',
-            'question_user_id': 'q_user_id',
-            'response_user_id': 'r_user_id',
-
-            # Content
-            'question_content': 'q_text',
-            'response_content': 'r_text',
-            'question_topic': 'q_topic',
-            'response_topic': 'r_topic',
-
-            # Languages
-            'question_language': 'q_lang_code',
-            'response_language': 'r_lang_code',
-            'question_language_name': 'q_language',
-            'response_language_name': 'r_language',
-
-            # Timestamps
-            'question_sent': 'q_datetime',
-            'response_sent': 'r_datetime',
-            'question_user_created_at': 'q_user_joined',
-            'response_user_created_at': 'r_user_joined',
-            'question_user_dob': 'q_user_dob',
-            'response_user_dob': 'r_user_dob',
-
-            # User attributes
-            'question_user_type': 'q_user_type',
-            'question_user_status': 'q_user_status',
-            'question_user_country_code': 'q_country',
-            'question_user_gender': 'q_gender',
-            'response_user_type': 'r_user_type',
-            'response_user_status': 'r_user_status',
-            'response_user_country_code': 'r_country',
-            'response_user_gender': 'r_gender',
-
-            # Temporal features
-            'question_year': 'q_year',
-            'question_month': 'q_month',
-            'question_day': 'q_day',
-            'question_hour': 'q_hour',
-            'question_dayofweek': 'q_weekday',
-            'question_quarter': 'q_quarter',
-            'question_year_month': 'q_year_month',
-            'response_year': 'r_year',
-            'response_month': 'r_month',
-            'response_day': 'r_day',
-            'response_hour': 'r_hour',
-            'response_dayofweek': 'r_weekday',
-            'response_time_hours': 'response_time_hrs',
-
-            # Context
-            'farming_season': 'season',
-            'season_standardized':'season_std',
-
-            # Text features
-            'question_length_chars': 'q_chars',
-            'question_word_count': 'q_words',
-            'response_length_chars': 'r_chars',
-            'response_word_count': 'r_words',
-
-            # Quality metrics
-            'core_fields_complete_pct': 'completeness_pct',
-            'user_metadata_complete_pct': 'metadata_pct',
-            'has_question_topic': 'has_q_topic',
-            'has_response_topic': 'has_r_topic',
-        }
-
-        df_clean = df_clean.rename(columns=rename_map)
+        # Non-overlap is p[i+1] - p[i] >= height, i.e. p - steps non-decreasing
+        blocks = []  # [sum, count] of pooled runs
+        for value in targets[order] - steps:
+            blocks.append([value, 1])
+            while len(blocks) > 1 and blocks[-2][0] * blocks[-1][1] > blocks[-1][0] * blocks[-2][1]:
+                total, count = blocks.pop()
+                blocks[-1][0] += total
+                blocks[-1][1] += count
+        placed = np.concatenate([np.full(count, total / count) for total, count in blocks]) + steps
         
-        # filter out gb country
-        df_clean = df_clean[df_clean['q_country']!='gb'][df_clean['r_country']!='gb']
-
-        self._log("="*80)
-        self._log(f"Processing complete! Output: {len(df_clean):,} rows, "
-                 f"{len(df_clean.columns)} columns (+{len(df_clean.columns) - len(df.columns)} added)")
+        # Push up from the bottom edge, then down from the top edge
+        placed = np.maximum(placed, lower + height / 2 + steps)
+        placed = np.minimum(placed, upper - height / 2 - steps[::-1])
         
-        return df_clean
-    
+        positions = np.empty(n)
+        positions[order] = placed
+        return positions
     
-class EDA:
-    ''' Exploratory visualisation of cleaned dataset '''
-    def plot_temporal_overview(df: pd.DataFrame, 
+    def plot_temporal_overview(df: Union[pd.DataFrame, AggregateCube], 
                                figsize: tuple = (15, 10)) -> plt.Figure:
         """
         Create comprehensive temporal analysis visualization
         
         Args:
-            df: Processed dataframe
+            df: Processed dataframe, or its AggregateCube
             figsize: Figure size
             
         Returns:
             Matplotlib figure
         """
+        cube = EDA._as_cube(df)
+        
         fig, axes = plt.subplots(3, 2, figsize=figsize)
         fig.suptitle('Temporal Analysis Overview', fontsize=16, fontweight='bold')
         
         # 1. Questions over time (time series)
-        if 'q_year_month' in df.columns:
+        if 'q_year_month' in cube.columns:
             ax = axes[0, 0]
-            questions_by_month = df.groupby('q_year_month').size()
+            questions_by_month = cube.value_counts('q_year_month').sort_index()
             questions_by_month.plot(ax=ax, color='#2ecc71', linewidth=2)
             ax.set_title('Questions Over Time', fontweight='bold')
             ax.set_xlabel('Date')
@@ -543,9 +2465,9 @@ class EDA:
             ax.set_xlim(dates.min() - padding, dates.max() + padding)
         
         # 2. Questions by year
-        if 'q_year' in df.columns:
+        if 'q_year' in cube.columns:
             ax = axes[0, 1]
-            year_counts = df['q_year'].value_counts().sort_index()
+            year_counts = cube.value_counts('q_year').sort_index()
             ax.bar(year_counts.index, year_counts.values, color='#3498db', alpha=0.7)
             ax.set_title('Questions by Year', fontweight='bold')
             ax.set_xlabel('Year')
@@ -556,9 +2478,9 @@ class EDA:
             ax.set_xlim(year_counts.index.min() - 1, year_counts.index.max() + 1)
         
         # 3. Seasonality (by month)
-        if 'q_month' in df.columns:
+        if 'q_month' in cube.columns:
             ax = axes[1, 0]
-            month_counts = df['q_month'].value_counts().sort_index()
+            month_counts = cube.value_counts('q_month').sort_index()
             month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
             ax.bar(range(1, 13), [month_counts.get(i, 0) for i in range(1, 13)],
@@ -571,9 +2493,9 @@ class EDA:
             ax.grid(True, alpha=0.3, axis='y')
         
         # 4. Hour of day distribution
-        if 'q_hour' in df.columns:
+        if 'q_hour' in cube.columns:
             ax = axes[1, 1]
-            hour_counts = df['q_hour_local'].value_counts().sort_index()
+            hour_counts = cube.value_counts('q_hour_local').sort_index()
             ax.plot(hour_counts.index, hour_counts.values, marker='o', 
                    color='#9b59b6', linewidth=2, markersize=6)
             ax.set_title('Activity by Hour of Day', fontweight='bold')
@@ -583,9 +2505,9 @@ class EDA:
             ax.grid(True, alpha=0.3)
         
         # 5. Day of week distribution
-        if 'q_weekday' in df.columns:
+        if 'q_weekday' in cube.columns:
             ax = axes[2, 0]
-            dow_counts = df['q_weekday'].value_counts().sort_index()
+            dow_counts = cube.value_counts('q_weekday').sort_index()
             dow_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
             ax.bar(range(7), [dow_counts.get(i, 0) for i in range(7)],
                   color='#1abc9c', alpha=0.7)
@@ -597,20 +2519,15 @@ class EDA:
             ax.grid(True, alpha=0.3, axis='y')
         
         # 6. Response time distribution
-        if 'response_time_hrs' in df.columns:
+        if 'response_time_hrs' in cube.columns:
             ax = axes[2, 1]
-            response_times = df['response_time_hrs'].dropna()
-            if len(response_times) > 0:
-                # Convert hours to days
-                response_times_days = response_times / 24
-
-                # Create log-spaced bins for better distribution
-                bins = np.logspace(np.log10(response_times_days.min() + 0.01), 
-                                  np.log10(response_times_days.max()), 
-                                  30)
+            # Log-spaced bins of response times in days (precomputed by the cube)
+            response_hist = cube.response_time_hist
+            if response_hist is not None:
+                bins = response_hist['bins']
 
                 # Plot histogram
-                ax.hist(response_times_days, bins=bins,
+                ax.hist(bins[:-1], bins=bins, weights=response_hist['counts'],
                        color='#f39c12', alpha=0.7, edgecolor='black')
                 ax.set_title('Response Time Distribution', fontweight='bold')
                 ax.set_xlabel('Number of days for response')
@@ -619,7 +2536,7 @@ class EDA:
                 ax.grid(True, alpha=0.3, axis='y')
 
                 # Add median line
-                median_days = response_times_days.median()
+                median_days = response_hist['median']
                 ax.axvline(median_days, color='red', linestyle='--', 
                           linewidth=2, label=f'Median: {median_days:.1f} days')
                 ax.legend()
@@ -627,19 +2544,28 @@ class EDA:
         plt.tight_layout()
         return fig
     
-    def plot_geographic_overview(df: pd.DataFrame,
-                             figsize: tuple = (18, 12)) -> plt.Figure:
+    def plot_geographic_overview(df: Union[pd.DataFrame, AggregateCube],
+                             figsize: tuple = (18, 12),
+                             label_layout: str = 'slots',
+                             top_topics: int = 10) -> plt.Figure:
         """
         Create geographic distribution visualization
 
         Args:
-            df: Processed dataframe
+            df: Processed dataframe, or its AggregateCube
             figsize: Figure size
+            label_layout: 'slots' stacks each country's topic labels beside
+                its column without overlap (bounded time); 'adjusttext'
+                uses the adjustText package (iterative, slow with many labels)
+            top_topics: Topics labelled per country in the topic flow panel
 
         Returns:
             Matplotlib figure
         """
-        from adjustText import adjust_text
+        if label_layout not in EDA.LABEL_LAYOUTS:
+            raise ValueError(f"label_layout must be one of {EDA.LABEL_LAYOUTS}, got {label_layout!r}")
+
+        cube = EDA._as_cube(df)
 
         fig = plt.figure(figsize=figsize)
         gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
@@ -647,9 +2573,9 @@ class EDA:
         fig.suptitle('Geographic Analysis Overview', fontsize=16, fontweight='bold')
 
         # 1. Questions by country
-        if 'q_country' in df.columns:
+        if 'q_country' in cube.columns:
             ax = fig.add_subplot(gs[0, 0])
-            country_counts = df['q_country'].value_counts()
+            country_counts = cube.value_counts('q_country')
             colors = plt.cm.Set3(range(len(country_counts)))
             ax.bar(country_counts.index, country_counts.values, color=colors, alpha=0.8)
             ax.set_title('Questions by Country', fontweight='bold')
@@ -658,13 +2584,13 @@ class EDA:
 
             # Add percentage labels
             for i, (country, count) in enumerate(country_counts.items()):
-                pct = count / len(df) * 100
+                pct = count / cube.n_rows * 100
                 ax.text(i, count, f'{pct:.1f}%', ha='center', va='bottom')
 
         # 2. Responses by country
-        if 'r_country' in df.columns:
+        if 'r_country' in cube.columns:
             ax = fig.add_subplot(gs[0, 1])
-            country_counts = df['r_country'].value_counts()
+            country_counts = cube.value_counts('r_country')
             colors = plt.cm.Set3(range(len(country_counts)))
             ax.bar(country_counts.index, country_counts.values, color=colors, alpha=0.8)
             ax.set_title('Responses by Country', fontweight='bold')
@@ -672,10 +2598,10 @@ class EDA:
             ax.grid(True, alpha=0.3, axis='y')
 
         # 3. Standardized seasonal distribution
-        if 'season_std' in df.columns and 'q_country' in df.columns:
+        if 'season_std' in cube.columns and 'q_country' in cube.columns:
             ax = fig.add_subplot(gs[1, :])  # Full width
 
-            season_country = pd.crosstab(df['season_std'], df['q_country'])
+            season_country = cube.crosstab('season_std', 'q_country')
             season_country_pct = season_country.div(season_country.sum(axis=0), axis=1) * 100
 
             season_order = ['rainy_main', 'rainy_secondary', 'harvest_main', 'harvest_secondary', 'off_season']
@@ -715,19 +2641,19 @@ class EDA:
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
 
-        # 4. Topic flow across countries (Sankey-style with adjustText)
-        if 'q_topic' in df.columns and 'q_country' in df.columns:
+        # 4. Topic flow across countries (Sankey-style)
+        if 'q_topic' in cube.columns and 'q_country' in cube.columns:
             ax = fig.add_subplot(gs[2, :])  # Full width
 
             # Get topic percentages by country
-            topic_country = pd.crosstab(df['q_topic'], df['q_country'])
+            topic_country = cube.crosstab('q_topic', 'q_country')
             topic_country_pct = topic_country.div(topic_country.sum(axis=0), axis=1) * 100
 
-            # Get top 10 per country
+            # Get top N per country
             top_per_country = {}
             countries = topic_country_pct.columns
             for country in countries:
-                top_per_country[country] = topic_country_pct[country].nlargest(10)
+                top_per_country[country] = topic_country_pct[country].nlargest(top_topics)
 
             # Union of all top topics
             all_top_topics = set()
@@ -746,8 +2672,8 @@ class EDA:
             countries_list = list(countries)
             x_positions = range(len(countries_list))
 
-            # Plot lines and collect text objects for adjustment
-            texts = []
+            # Plot lines and collect label anchors: (column, y, text)
+            labels = []
 
             for topic, y_values in topic_data.items():
                 in_top_10 = [topic in top_per_country[c].index for c in countries_list]
@@ -766,39 +2692,58 @@ class EDA:
                        alpha=alpha, linewidth=linewidth, color=color, 
                        markersize=6, markeredgecolor='white', markeredgewidth=1)
 
-                # Create text labels (will be adjusted later)
-                for i, (country, y_val, is_top) in enumerate(zip(countries_list, y_values, in_top_10)):
+                for i, (y_val, is_top) in enumerate(zip(y_values, in_top_10)):
                     if is_top:
-                        bbox_props = dict(boxstyle='round,pad=0.3', facecolor='white', 
-                                        edgecolor='black', linewidth=1, alpha=0.95)
-
-                        text = ax.text(i, y_val, f'{topic}\n{y_val:.1f}%', 
-                                      fontsize=7, fontweight='bold', ha='center', va='center',
-                                      bbox=bbox_props, zorder=10)
-                        texts.append(text)
-
-            # Adjust text positions to avoid overlap
-            adjust_text(texts, ax=ax,
-                       arrowprops=dict(arrowstyle='->', color='gray', lw=0.5, alpha=0.5),
-                       expand_points=(5, 1),
-                       expand_text=(1.2, 1.2),
-                       force_points=(0.5, 0.5),
-                       force_text=(0.5, 0.5))
+                        labels.append((i, y_val, f'{topic}\n{y_val:.1f}%'))
+
+            bbox_props = dict(boxstyle='round,pad=0.3', facecolor='white', 
+                            edgecolor='black', linewidth=1, alpha=0.95)
+            arrow_props = dict(arrowstyle='->', color='gray', lw=0.5, alpha=0.5)
+            fontsize = 7
+
+            if label_layout == 'adjusttext':
+                from adjustText import adjust_text
+
+                texts = [ax.text(i, y_val, text, fontsize=fontsize, fontweight='bold',
+                                 ha='center', va='center', bbox=bbox_props, zorder=10)
+                         for i, y_val, text in labels]
+                adjust_text(texts, ax=ax,
+                           arrowprops=arrow_props,
+                           expand_points=(5, 1),
+                           expand_text=(1.2, 1.2),
+                           force_points=(0.5, 0.5),
+                           force_text=(0.5, 0.5))
+            else:
+                # Stack each column's labels beside it (left of the last column),
+                # with two-line boxes converted from points to data units
+                y_low, y_high = ax.get_ylim()
+                axes_height_pt = ax.get_window_extent().height * 72 / fig.dpi
+                label_height = (fontsize * (2 * 1.2 + 2 * 0.3) + 2) / axes_height_pt * (y_high - y_low)
+                for i in range(len(countries_list)):
+                    column = [label for label in labels if label[0] == i]
+                    slots = EDA._label_slots([y_val for _, y_val, _ in column],
+                                             label_height, y_low, y_high)
+                    side = -1 if i == len(countries_list) - 1 and i > 0 else 1
+                    for (_, y_val, text), y_text in zip(column, slots):
+                        ax.annotate(text, xy=(i, y_val), xytext=(i + 0.08 * side, y_text),
+                                    fontsize=fontsize, fontweight='bold',
+                                    ha='left' if side > 0 else 'right', va='center',
+                                    bbox=bbox_props, arrowprops=arrow_props, zorder=10)
 
             ax.set_xticks(x_positions)
             ax.set_xticklabels([f'{c}\n(n={topic_country[c].sum():.0f})' 
                                 for c in countries_list], fontsize=11, fontweight='bold')
             ax.set_ylabel('% of Questions', fontsize=11, fontweight='bold')
-            ax.set_title('Topic Flow Across Countries (Top 10 per country)', fontweight='bold', fontsize=12)
+            ax.set_title(f'Topic Flow Across Countries (Top {top_topics} per country)', fontweight='bold', fontsize=12)
             ax.set_xlim(-0.5, len(countries_list) - 0.5)
             ax.grid(True, alpha=0.3, axis='y', linestyle='--', linewidth=0.5)
 
             # Legend
             from matplotlib.lines import Line2D
             legend_elements = [
-                Line2D([0], [0], color='C0', linewidth=2.5, label='Top 10 in 3+ countries'),
-                Line2D([0], [0], color='C1', linewidth=2, label='Top 10 in 2 countries'),
-                Line2D([0], [0], color='C2', linewidth=1.5, label='Top 10 in 1 country'),
+                Line2D([0], [0], color='C0', linewidth=2.5, label=f'Top {top_topics} in 3+ countries'),
+                Line2D([0], [0], color='C1', linewidth=2, label=f'Top {top_topics} in 2 countries'),
+                Line2D([0], [0], color='C2', linewidth=1.5, label=f'Top {top_topics} in 1 country'),
             ]
             ax.legend(handles=legend_elements, loc='upper left', fontsize=9, framealpha=0.95)
             ax.spines['top'].set_visible(False)
@@ -807,25 +2752,27 @@ class EDA:
         plt.tight_layout()
         return fig
     
-    def plot_linguistic_overview(df: pd.DataFrame,
+    def plot_linguistic_overview(df: Union[pd.DataFrame, AggregateCube],
                              figsize: tuple = (16, 10)) -> plt.Figure:
         """
         Create linguistic distribution visualization
         Args:
-            df: Processed dataframe
+            df: Processed dataframe, or its AggregateCube
             figsize: Figure size
         Returns:
             Matplotlib figure
         """
+        cube = EDA._as_cube(df)
+
         fig = plt.figure(figsize=figsize)
         gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
 
         fig.suptitle('Linguistic Analysis Overview', fontsize=16, fontweight='bold')
 
         # 1. Questions by language (pie chart)
-        if 'q_language' in df.columns:
+        if 'q_language' in cube.columns:
             ax = fig.add_subplot(gs[0, 0])
-            lang_counts = df['q_language'].value_counts()
+            lang_counts = cube.value_counts('q_language')
 
             # Create pie chart
             colors = plt.cm.Set2(range(len(lang_counts)))
@@ -842,14 +2789,11 @@ class EDA:
                 autotext.set_fontweight('bold')
 
         # 2. Language match between questions and responses
-        if 'q_language' in df.columns and 'r_language' in df.columns:
+        if 'q_language' in cube.columns and 'r_language' in cube.columns:
             ax = fig.add_subplot(gs[0, 1])
 
             # Check if languages match
-            df_temp = df.copy()
-            df_temp['lang_match'] = (df_temp['q_language'] == 
-                                     df_temp['r_language'])
-            match_counts = df_temp['lang_match'].value_counts()
+            match_counts = cube.lang_match_counts
 
             colors = ['#2ecc71', '#e74c3c']
             ax.bar(range(len(match_counts)), match_counts.values, 
@@ -867,11 +2811,11 @@ class EDA:
                 ax.text(i, count, f'{pct:.1f}%', ha='center', va='bottom')
 
         # 3. Language distribution by country (stacked bar chart)
-        if 'q_language' in df.columns and 'q_country' in df.columns:
+        if 'q_language' in cube.columns and 'q_country' in cube.columns:
             ax = fig.add_subplot(gs[1, :])  # Full width bottom row
 
             # Create crosstab of language by country
-            lang_country = pd.crosstab(df['q_language'], df['q_country'])
+            lang_country = cube.crosstab('q_language', 'q_country')
 
             # Convert to percentages (% within each country)
             lang_country_pct = lang_country.div(lang_country.sum(axis=0), axis=1) * 100
@@ -921,20 +2865,30 @@ class EDA:
         plt.tight_layout()
         return fig
     
-    def plot_user_overview(df: pd.DataFrame,
-                      figsize: tuple = (18, 10)) -> plt.Figure:
+    def plot_user_overview(df: Union[pd.DataFrame, AggregateCube],
+                      figsize: tuple = (18, 10),
+                      length_mode: str = 'binned') -> plt.Figure:
         """
         Create user behavior visualization
 
         Args:
-            df: Processed dataframe
+            df: Processed dataframe, or its AggregateCube
             figsize: Figure size
+            length_mode: 'binned' draws the length hexbin from a fixed
+                LENGTH_GRID_BINS^2 grid (render time independent of rows);
+                'exact' from every distinct length pair (raw frame only)
 
         Returns:
             Matplotlib figure
         """
-        from scipy.stats import pearsonr
-        from datetime import datetime
+        if length_mode not in EDA.LENGTH_MODES:
+            raise ValueError(f"length_mode must be one of {EDA.LENGTH_MODES}, got {length_mode!r}")
+        
+        cube = EDA._as_cube(df)
+        if length_mode == 'exact' and not cube.has('length_pairs'):
+            raise ValueError("length_mode='exact' needs the distinct length pairs, which a "
+                             "materialized cube does not keep; use length_mode='binned' or "
+                             "pass the frame (or a cube that has not been materialized)")
 
         fig = plt.figure(figsize=figsize)
         gs = fig.add_gridspec(2, 4, hspace=0.3, wspace=0.3)
@@ -942,9 +2896,9 @@ class EDA:
         fig.suptitle('User Behavior Overview', fontsize=16, fontweight='bold')
 
         # 1. User status distribution (questions)
-        if 'q_user_status' in df.columns:
+        if 'q_user_status' in cube.columns:
             ax = fig.add_subplot(gs[0, 0])
-            status_counts = df['q_user_status'].value_counts()
+            status_counts = cube.value_counts('q_user_status')
             colors = plt.cm.Set1(range(len(status_counts)))
             ax.bar(status_counts.index, status_counts.values, 
                   color=colors, alpha=0.7)
@@ -954,13 +2908,13 @@ class EDA:
 
             # Add percentage labels
             for i, (status, count) in enumerate(status_counts.items()):
-                pct = count / len(df) * 100
+                pct = count / cube.n_rows * 100
                 ax.text(i, count, f'{pct:.1f}%', ha='center', va='bottom')
 
         # 2. Gender distribution (if available)
-        if 'q_gender' in df.columns:
+        if 'q_gender' in cube.columns:
             ax = fig.add_subplot(gs[0, 1])
-            gender_counts = df['q_gender'].value_counts()
+            gender_counts = cube.value_counts('q_gender')
 
             if len(gender_counts) > 0:
                 colors = plt.cm.Pastel1(range(len(gender_counts)))
@@ -979,34 +2933,31 @@ class EDA:
                        ha='center', va='center', transform=ax.transAxes)
 
         # 3. User age distribution (from DOB)
-        if 'q_user_dob' in df.columns:
+        if 'q_user_dob' in cube.columns:
             ax = fig.add_subplot(gs[0, 2])
 
-            # Calculate age from DOB
-            df_temp = df.copy()
-            current_year = datetime.now().year
-            df_temp['age'] = current_year - pd.to_datetime(df_temp['q_user_dob'], errors='coerce').dt.year
+            # Rows per asker age from DOB, filtered to reasonable ages (15-90)
+            age_counts = cube.age_counts
+            ages = AggregateCube.weighted_stats(age_counts)
 
-            # Filter reasonable ages (15-90)
-            ages = df_temp['age'][(df_temp['age'] >= 15) & (df_temp['age'] <= 90)].dropna()
-
-            if len(ages) > 0:
+            if ages['n'] > 0:
                 # Histogram
-                ax.hist(ages, bins=20, color='#3498db', alpha=0.7, edgecolor='black')
-                ax.set_title(f'Age Distribution (n={len(ages):,})', fontweight='bold')
+                ax.hist(age_counts.index, bins=20, weights=age_counts.values,
+                        color='#3498db', alpha=0.7, edgecolor='black')
+                ax.set_title(f"Age Distribution (n={ages['n']:,})", fontweight='bold')
                 ax.set_xlabel('Age (years)')
                 ax.set_ylabel('Count')
                 ax.grid(True, alpha=0.3, axis='y')
 
                 # Add median line and stats
-                median_age = ages.median()
+                median_age = ages['median']
                 ax.axvline(median_age, color='red', linestyle='--', 
                           linewidth=2, label=f'Median: {median_age:.0f}')
 
                 # Add stats text
-                stats_text = (f"Mean: {ages.mean():.1f}\n"
+                stats_text = (f"Mean: {ages['mean']:.1f}\n"
                              f"Median: {median_age:.0f}\n"
-                             f"Range: {ages.min():.0f}-{ages.max():.0f}")
+                             f"Range: {ages['min']:.0f}-{ages['max']:.0f}")
                 ax.text(0.95, 0.95, stats_text, transform=ax.transAxes,
                        verticalalignment='top', horizontalalignment='right',
                        bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.7))
@@ -1016,14 +2967,16 @@ class EDA:
                        ha='center', va='center', transform=ax.transAxes)
 
         # 4. User activity distribution
-        if 'q_user_id' in df.columns:
+        if 'q_user_id' in cube.columns:
             ax = fig.add_subplot(gs[0, 3])
 
-            # Questions per user
-            user_activity = df.groupby('q_user_id').size()
+            # Number of users per questions-per-user value
+            activity_counts = cube.user_activity_counts
+            user_activity = AggregateCube.weighted_stats(activity_counts)
 
             # Histogram of activity
-            ax.hist(user_activity.values, bins=min(30, len(user_activity)), 
+            ax.hist(activity_counts.index, bins=min(30, user_activity['n']),
+                   weights=activity_counts.values,
                    color='#9b59b6', alpha=0.7, edgecolor='black')
             ax.set_title('Questions per User Distribution', fontweight='bold')
             ax.set_xlabel('Number of Questions')
@@ -1032,41 +2985,57 @@ class EDA:
             ax.set_yscale('log')
 
             # Add stats text
-            stats_text = (f"Mean: {user_activity.mean():.1f}\n"
-                         f"Median: {user_activity.median():.1f}\n"
-                         f"Max: {user_activity.max()}")
+            stats_text = (f"Mean: {user_activity['mean']:.1f}\n"
+                         f"Median: {user_activity['median']:.1f}\n"
+                         f"Max: {user_activity['max']:.0f}")
             ax.text(0.95, 0.95, stats_text, transform=ax.transAxes,
                    verticalalignment='top', horizontalalignment='right',
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
         # 5. Text length distribution
-        if 'q_chars' in df.columns:
+        if 'q_chars' in cube.columns:
             ax = fig.add_subplot(gs[1, 0])
 
-            lengths = df['q_chars'].dropna()
+            length_counts = cube.value_counts('q_chars')
 
             # Histogram
-            ax.hist(lengths, bins=30, color='#e67e22', alpha=0.7, edgecolor='black')
+            ax.hist(length_counts.index, bins=30, weights=length_counts.values,
+                    color='#e67e22', alpha=0.7, edgecolor='black')
             ax.set_title('Question Length Distribution', fontweight='bold')
             ax.set_xlabel('Characters')
             ax.set_ylabel('Count')
             ax.grid(True, alpha=0.3, axis='y')
 
             # Add median line
-            median_val = lengths.median()
+            median_val = AggregateCube.weighted_stats(length_counts)['median']
             ax.axvline(median_val, color='red', linestyle='--', 
                       linewidth=2, label=f'Median: {median_val:.0f}')
             ax.legend()
 
         # 6. Question vs Response Length Correlation (hexbin)
-        if 'q_chars' in df.columns and 'r_chars' in df.columns:
+        if 'q_chars' in cube.columns and 'r_chars' in cube.columns:
             ax = fig.add_subplot(gs[1, 1:])  # Span 3 columns
 
-            data = df[['q_chars', 'r_chars']].dropna()
-
-            if len(data) > 0:
-                # Hexbin plot (shows density)
-                hexbin = ax.hexbin(data['q_chars'], data['r_chars'], 
+            # Correlation, fit line and n from streaming moments, never the raw points
+            moments = cube.length_moments
+            n_pairs = int(moments.n)
+
+            if n_pairs > 0:
+                # Hexbin plot (shows density) of weighted points: grid cell centres or distinct pairs
+                if length_mode == 'binned':
+                    grid = cube.length_grid
+                    x_centres = (grid['xedges'][:-1] + grid['xedges'][1:]) / 2
+                    y_centres = (grid['yedges'][:-1] + grid['yedges'][1:]) / 2
+                    x_points, y_points = np.meshgrid(x_centres, y_centres, indexing='ij')
+                    occupied = grid['counts'] > 0
+                    x_points, y_points = x_points[occupied], y_points[occupied]
+                    weights, extent = grid['counts'][occupied], grid['extent']
+                else:
+                    pairs = cube.length_pairs
+                    x_points, y_points, weights = pairs['q_chars'], pairs['r_chars'], pairs['n']
+                    extent = None
+                hexbin = ax.hexbin(x_points, y_points, C=weights,
+                                  reduce_C_function=np.sum, extent=extent,
                                   gridsize=50, cmap='YlOrRd', mincnt=1,
                                   edgecolors='black', linewidths=0.2)
 
@@ -1074,14 +3043,12 @@ class EDA:
                 cb = plt.colorbar(hexbin, ax=ax, label='Count')
 
                 # Add regression line
-                z = np.polyfit(data['q_chars'], data['r_chars'], 1)
-                p = np.poly1d(z)
-                x_line = np.linspace(data['q_chars'].min(), data['q_chars'].max(), 100)
-                ax.plot(x_line, p(x_line), "blue", linewidth=3, 
+                x_line = np.linspace(moments.min_x, moments.max_x, 100)
+                ax.plot(x_line, moments.intercept + moments.slope * x_line, "blue", linewidth=3, 
                        label='Linear fit', linestyle='--')
 
                 # Calculate correlation
-                corr, pval = pearsonr(data['q_chars'], data['r_chars'])
+                corr, pval = moments.r, moments.p_value
 
                 # Add correlation text
                 textstr = f'Pearson r = {corr:.3f}\np < 0.001' if pval < 0.001 else f'Pearson r = {corr:.3f}\np = {pval:.3f}'
@@ -1091,7 +3058,7 @@ class EDA:
                        verticalalignment='top', bbox=props, fontweight='bold')
 
                 # Add sample size
-                ax.text(0.95, 0.05, f'n = {len(data):,}', transform=ax.transAxes,
+                ax.text(0.95, 0.05, f'n = {n_pairs:,}', transform=ax.transAxes,
                        fontsize=10, ha='right', va='bottom',
                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.95, 
                                edgecolor='black'))
@@ -1107,18 +3074,20 @@ class EDA:
         plt.tight_layout()
         return fig
     
-    def plot_data_quality(df: pd.DataFrame,
+    def plot_data_quality(df: Union[pd.DataFrame, AggregateCube],
                          figsize: tuple = (14, 6)) -> plt.Figure:
         """
         Create data quality visualization
         
         Args:
-            df: Processed dataframe
+            df: Processed dataframe, or its AggregateCube
             figsize: Figure size
             
         Returns:
             Matplotlib figure
         """
+        cube = EDA._as_cube(df)
+        
         fig, axes = plt.subplots(1, 2, figsize=figsize)
         fig.suptitle('Data Quality Overview', fontsize=16, fontweight='bold')
         
@@ -1126,7 +3095,7 @@ class EDA:
         ax = axes[0]
         
         # Calculate missing percentages
-        missing_pct = (df.isnull().sum() / len(df) * 100).sort_values(ascending=False)
+        missing_pct = (cube.missing / cube.n_rows * 100).sort_values(ascending=False)
         missing_pct = missing_pct[missing_pct > 0].head(15)
         
         if len(missing_pct) > 0:
@@ -1148,23 +3117,118 @@ class EDA:
         # 2. Completeness score distribution
         ax = axes[1]
         
-        if 'completeness_pct' in df.columns:
-            completeness = df['completeness_pct']
+        if 'completeness_pct' in cube.columns:
+            completeness_counts = cube.value_counts('completeness_pct')
+            completeness = AggregateCube.weighted_stats(completeness_counts)
             
             # Histogram
-            ax.hist(completeness, bins=20, color='#16a085', alpha=0.7, edgecolor='black')
+            ax.hist(completeness_counts.index, bins=20, weights=completeness_counts.values,
+                    color='#16a085', alpha=0.7, edgecolor='black')
             ax.set_title('Core Fields Completeness Distribution', fontweight='bold')
             ax.set_xlabel('Completeness (%)')
             ax.set_ylabel('Count')
             ax.grid(True, alpha=0.3, axis='y')
             
             # Add stats
-            stats_text = (f"Mean: {completeness.mean():.1f}%\n"
-                         f"Median: {completeness.median():.1f}%")
+            stats_text = (f"Mean: {completeness['mean']:.1f}%\n"
+                         f"Median: {completeness['median']:.1f}%")
             ax.text(0.05, 0.95, stats_text, transform=ax.transAxes,
                    verticalalignment='top',
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         plt.tight_layout()
 
-        return fig
\ No newline at end of file
+        return fig
+    
+    def render_report(df: Union[pd.DataFrame, AggregateCube],
+                      out_dir: Union[str, Path],
+                      n_jobs: int = -1,
+                      formats: Tuple[str, ...] = ('png',),
+                      dpi: int = 100) -> pd.DataFrame:
+        """
+        Render every overview figure to files, plus an index.html linking them
+        
+        The data is aggregated once into an AggregateCube, which (unlike the
+        frame) is cheap to send to worker processes; each worker renders
+        one figure with the headless Agg backend. A figure that fails (e.g.
+        a missing column) is reported in the index instead of aborting
+        the report.
+        
+        Args:
+            df: Processed dataframe, or its AggregateCube
+            out_dir: Output directory (created if needed)
+            n_jobs: Worker processes (-1 = all cores, 1 = render in this process)
+            formats: File formats to write, e.g. ('png', 'svg')
+            dpi: Raster resolution
+            
+        Returns:
+            DataFrame indexed by figure with seconds, files and error columns
+            (the 'build_cube' row times the aggregation)
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        n_jobs = os.cpu_count() if n_jobs == -1 else max(1, n_jobs)
+        
+        start = time.perf_counter()
+        cube = df.materialize() if isinstance(df, AggregateCube) else EDA.build_cube(df)
+        rows = [('build_cube', time.perf_counter() - start, [], None)]
+        
+        if n_jobs == 1:
+            rows += [_render_figure(name, cube, str(out_dir), tuple(formats), dpi, headless=False)
+                     for name in EDA.REPORT_FIGURES]
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(EDA.REPORT_FIGURES))) as pool:
+                futures = [pool.submit(_render_figure, name, cube, str(out_dir), tuple(formats), dpi)
+                           for name in EDA.REPORT_FIGURES]
+                rows += [future.result() for future in futures]
+        total = time.perf_counter() - start
+        
+        timings = pd.DataFrame(rows, columns=['figure', 'seconds', 'files', 'error']).set_index('figure')
+        EDA._write_report_index(out_dir, timings, total, cube.n_rows)
+        return timings
+    
+    def _write_report_index(out_dir: Path, timings: pd.DataFrame, total: float, n_rows: int):
+        """Write index.html showing the rendered figures and their render times"""
+        import html
+        
+        sections = []
+        for name, row in timings.drop(index='build_cube').iterrows():
+            title = name.replace('plot_', '').replace('_', ' ').title()
+            if isinstance(row['error'], str):
+                body = f'<p class="error">Not rendered: {html.escape(row["error"])}</p>'
+            else:
+                image = next((f for f in row['files'] if f.endswith('.png')), row['files'][0])
+                links = ' | '.join(f'<a href="{f}">{f.rsplit(".", 1)[-1].upper()}</a>' for f in row['files'])
+                body = f'<img src="{image}" alt="{title}">\n<p>{links}</p>'
+            sections.append(f'<h2>{title}</h2>\n<p class="time">Rendered in {row["seconds"]:.2f}s</p>\n{body}')
+        
+        sections = '\n'.join(sections)
+        table = '\n'.join(f'<tr><td>{name}</td><td>{row["seconds"]:.2f}</td></tr>'
+                          for name, row in timings.iterrows())
+        page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>WeFarm EDA report</title>
+<style>
+body {{ font-family: sans-serif; max-width: 1400px; margin: auto; }}
+img {{ max-width: 100%; border: 1px solid #ccc; }}
+.time {{ color: #666; }}
+.error {{ color: #c0392b; }}
+td {{ padding: 2px 12px; }}
+</style>
+</head>
+<body>
+<h1>WeFarm EDA report</h1>
+<p>{n_rows:,} rows, generated {datetime.now().strftime('%Y-%m-%d %H:%M')} in {total:.2f}s</p>
+<table>
+<tr><th>Step</th><th>Seconds</th></tr>
+{table}
+</table>
+{sections}
+</body>
+</html>
+"""
+        (out_dir / 'index.html').write_text(page, encoding='utf-8')
@@ -0,0 +1,331 @@
+"""
+Benchmarks for WeFarmPy
+
+Times the performance-sensitive parts of the DataCleaning pipeline on
+synthetic data shaped like the WeFarm export, and checks the fast paths
+against the reference implementations they replace.
+
+Usage (from this folder):
+    python benchmark_WeFarmPy.py season --rows 10000000
+    python benchmark_WeFarmPy.py text --rows 2000000
+    python benchmark_WeFarmPy.py labels --rows 1000000
+    python benchmark_WeFarmPy.py parquet --rows 1000000
+"""
+
+import argparse
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import WeFarmPy
+
+
+def make_enriched_frame(n_rows: int, seed: int = 1) -> pd.DataFrame:
+    """
+    Synthetic frame with the columns the season steps read
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+
+    Returns:
+        DataFrame with categorical question_user_country_code (ISO alpha-3,
+        plus a few 'gb' and missing values) and float question_month
+    """
+    rng = np.random.default_rng(seed)
+
+    countries = pd.Categorical.from_codes(
+        rng.choice([-1, 0, 1, 2, 3], size=n_rows, p=[0.001, 0.48, 0.31, 0.208, 0.001]),
+        categories=['KEN', 'UGA', 'TZA', 'gb'])
+    months = rng.integers(1, 13, size=n_rows).astype(float)
+    months[rng.random(n_rows) < 0.001] = np.nan
+
+    return pd.DataFrame({'question_user_country_code': countries,
+                         'question_month': months})
+
+
+def _time(func, *args):
+    """Run func(*args) once and return (result, seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_season_engines(n_rows: int = 10_000_000, reference_rows: int = 200_000):
+    """
+    Compare the lookup-table and row-wise season engines
+
+    The row-wise engine is timed on the first `reference_rows` rows and
+    extrapolated linearly, since it takes minutes on 10M rows.
+
+    Args:
+        n_rows: Rows in the synthetic frame
+        reference_rows: Rows used for the row-wise reference run
+    """
+    df = make_enriched_frame(n_rows)
+    reference_rows = min(reference_rows, n_rows)
+    print(f"Season assignment on {n_rows:,} rows "
+          f"(row-wise reference on {reference_rows:,})")
+
+    lookup = WeFarmPy.DataCleaning(verbose=False, season_engine='lookup')
+    apply = WeFarmPy.DataCleaning(verbose=False, season_engine='apply')
+
+    for label, step in [('farming_season', '_add_farming_season_context'),
+                        ('season_standardized', '_add_standardized_season')]:
+        fast, fast_secs = _time(getattr(lookup, step), df.copy())
+        sample = df.iloc[:reference_rows].copy()
+        slow, slow_secs = _time(getattr(apply, step), sample)
+
+        fast_labels = fast[label].iloc[:reference_rows].astype(object)
+        fast_labels = fast_labels.where(fast_labels.notna(), None)
+        if not fast_labels.equals(slow[label].astype(object)):
+            raise AssertionError(f"{label}: lookup labels differ from row-wise labels")
+
+        slow_secs_full = slow_secs * n_rows / reference_rows
+        print(f"  {label}:")
+        print(f"    lookup: {fast_secs:8.2f}s  ({n_rows / fast_secs:,.0f} rows/s)")
+        print(f"    apply:  {slow_secs_full:8.2f}s  (extrapolated, "
+              f"{reference_rows / slow_secs:,.0f} rows/s)")
+        print(f"    speedup: {slow_secs_full / fast_secs:,.0f}x, labels identical")
+
+
+def make_text_column(n_rows: int, seed: int = 1) -> pd.Series:
+    """
+    Synthetic message column: English/Swahili words, numbers, some
+    punctuation, non-ASCII characters and missing values
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+
+    Returns:
+        Object-dtype Series of strings (about 1% missing)
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(['maize', 'mahindi', 'ng\u2019ombe', 'how', 'do', 'I', 'control',
+                      'wadudu', 'shamba', '2', 'acres', 'kg', '50', 'caf\u00e9', '?', 'na'])
+    lengths = rng.integers(1, 40, size=n_rows)
+    words = vocab[rng.integers(0, len(vocab), size=lengths.sum())]
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    texts = pd.Series([' '.join(words[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])],
+                      dtype=object)
+    texts[rng.random(n_rows) < 0.01] = None
+    return texts
+
+
+def benchmark_text_features(n_rows: int = 2_000_000):
+    """
+    Compare the byte-level text statistics with split-based counting
+
+    Args:
+        n_rows: Rows in the synthetic text column
+    """
+    texts = make_text_column(n_rows)
+    print(f"Text features on {n_rows:,} messages")
+
+    processor = WeFarmPy.DataCleaning(verbose=False)
+    stats, fast_secs = _time(processor._text_stats, texts)
+
+    def split_counts(series):
+        filled = series.fillna('')
+        return filled.str.len(), filled.str.split().str.len()
+
+    (chars, words), slow_secs = _time(split_counts, texts)
+    if not ((stats['length_chars'] == chars.to_numpy()).all()
+            and (stats['word_count'] == words.to_numpy()).all()):
+        raise AssertionError("byte-level counts differ from str.len / str.split counts")
+
+    print(f"  byte-level (5 stats): {fast_secs:8.2f}s  ({n_rows / fast_secs:,.0f} rows/s)")
+    print(f"  str.split (2 stats):  {slow_secs:8.2f}s  ({n_rows / slow_secs:,.0f} rows/s)")
+    print(f"  speedup: {slow_secs / fast_secs:,.1f}x, chars and words identical")
+
+
+def make_topic_frame(n_rows: int, n_topics: int = 60, seed: int = 1) -> pd.DataFrame:
+    """
+    Synthetic frame for the topic flow panel of plot_geographic_overview
+
+    Args:
+        n_rows: Number of rows
+        n_topics: Number of distinct topics (Zipf-like popularity)
+        seed: Random seed
+
+    Returns:
+        DataFrame with categorical q_country and q_topic
+    """
+    rng = np.random.default_rng(seed)
+    countries = pd.Categorical.from_codes(
+        rng.choice(3, size=n_rows, p=[0.5, 0.3, 0.2]), categories=['KEN', 'UGA', 'TZA'])
+    weights = 1 / np.arange(1, n_topics + 1)
+    topics = pd.Categorical.from_codes(
+        rng.choice(n_topics, size=n_rows, p=weights / weights.sum()),
+        categories=[f'topic_{i:03d}' for i in range(n_topics)])
+    return pd.DataFrame({'q_country': countries, 'q_topic': topics})
+
+
+def benchmark_label_layout(n_rows: int = 1_000_000, n_topics: int = 60):
+    """
+    Time the topic flow label layouts of plot_geographic_overview
+
+    Renders the figure with every topic labelled in every country, with
+    slot assignment and (if installed) adjustText, then times the slot
+    assignment alone on growing label counts.
+
+    Args:
+        n_rows: Rows in the synthetic frame
+        n_topics: Distinct topics, all labelled
+    """
+    cube = WeFarmPy.EDA.build_cube(make_topic_frame(n_rows, n_topics))
+    print(f"Topic flow labels: {n_topics} topics x 3 countries "
+          f"({n_topics * 3} labels, {n_rows:,} rows)")
+
+    def render(layout):
+        fig = WeFarmPy.EDA.plot_geographic_overview(cube, label_layout=layout,
+                                                    top_topics=n_topics)
+        fig.savefig(io.BytesIO(), format='png', dpi=72)
+        plt.close(fig)
+
+    for layout in WeFarmPy.EDA.LABEL_LAYOUTS:
+        try:
+            _, secs = _time(render, layout)
+        except ImportError as error:
+            print(f"  {layout:>10}: skipped ({error})")
+            continue
+        print(f"  {layout:>10}: {secs:8.2f}s  (figure incl. savefig)")
+
+    rng = np.random.default_rng(0)
+    for n_labels in [50, 500, 5000, 50000]:
+        targets = rng.random(n_labels) * 100
+        _, secs = _time(WeFarmPy.EDA._label_slots, targets, 100 / n_labels, 0, 100)
+        print(f"  slots only, {n_labels:>6,} labels: {secs * 1000:8.2f}ms")
+
+
+def make_raw_frame(n_rows: int, seed: int = 1) -> pd.DataFrame:
+    """
+    Synthetic raw export with the columns the enrichment steps read
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+
+    Returns:
+        DataFrame shaped like wefarm_dataset.csv, with missing country
+        codes, topics and timestamps
+    """
+    rng = np.random.default_rng(seed)
+    sent = pd.Timestamp('2017-01-01', tz='UTC') + pd.to_timedelta(
+        rng.integers(0, 3 * 365 * 86400, n_rows), unit='s')
+    texts = make_text_column(n_rows, seed)
+
+    def choice(values, p=None):
+        return pd.Series(rng.choice(np.array(values, dtype=object), size=n_rows, p=p))
+
+    return pd.DataFrame({
+        'question_id': np.arange(n_rows), 'response_id': np.arange(n_rows) + 10**7,
+        'question_user_id': rng.integers(0, n_rows // 5 + 1, n_rows),
+        'response_user_id': rng.integers(0, 1000, n_rows),
+        'question_language': choice(['eng', 'swa', 'lug', 'nyn']),
+        'response_language': choice(['eng', 'swa', 'lug']),
+        'question_content': texts, 'response_content': texts.sample(frac=1, random_state=seed).values,
+        'question_topic': choice(['maize', 'beans', 'cattle', None]),
+        'response_topic': choice(['maize', None]),
+        'question_sent': sent.strftime('%Y-%m-%d %H:%M:%S+00:00'),
+        'response_sent': (sent + pd.Timedelta(hours=5)).strftime('%Y-%m-%d %H:%M:%S+00:00'),
+        'question_user_type': 'farmer', 'response_user_type': 'farmer',
+        'question_user_status': choice(['live', 'zombie']), 'response_user_status': 'live',
+        'question_user_country_code': choice(['ke', 'ug', 'tz', 'gb', None],
+                                             p=[0.4, 0.3, 0.2, 0.05, 0.05]),
+        'response_user_country_code': choice(['ke', 'ug', 'tz']),
+        'question_user_gender': choice(['male', 'female', None]),
+        'response_user_gender': choice(['male', 'female', None]),
+        'question_user_dob': choice(['1980-01-01', '1990-05-05', None]),
+        'response_user_dob': None,
+        'question_user_created_at': sent.strftime('%Y-%m-%d %H:%M:%S+00:00'),
+        'response_user_created_at': sent.strftime('%Y-%m-%d %H:%M:%S+00:00'),
+    })
+
+
+def benchmark_parquet_roundtrip(n_rows: int = 1_000_000):
+    """
+    Round-trip a CSV with null country codes through csv_to_parquet
+
+    Checks that rows in the null (hive default) partition read back as
+    missing codes, that converting again replaces the dataset rather than
+    adding files, and that process() on the dataset matches process() on
+    the CSV. Times both inputs.
+
+    Args:
+        n_rows: Rows in the synthetic export
+    """
+    raw = make_raw_frame(n_rows)
+    n_null = int(raw['question_user_country_code'].isna().sum())
+    print(f"Parquet round trip on {n_rows:,} rows ({n_null:,} null country codes)")
+
+    processor = WeFarmPy.DataCleaning(verbose=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, parquet_dir = Path(tmp) / 'raw.csv', Path(tmp) / 'parquet'
+        raw.to_csv(csv_path, index=False)
+        chunksize = max(n_rows // 4, 1)
+
+        _, convert_secs = _time(processor.csv_to_parquet, csv_path, parquet_dir, chunksize)
+        n_files = len(list(parquet_dir.rglob('*.parquet')))
+        processor.csv_to_parquet(csv_path, parquet_dir, chunksize)
+        if len(list(parquet_dir.rglob('*.parquet'))) != n_files:
+            raise AssertionError("converting again added Parquet files instead of replacing them")
+
+        back = processor.read_parquet(parquet_dir).sort_values('question_id')
+        codes = back['question_user_country_code'].astype(object)
+        expected = raw['question_user_country_code'].to_numpy()
+        if not (len(back) == n_rows and codes.isna().sum() == n_null
+                and (codes.fillna('<NA>').to_numpy() == pd.Series(expected).fillna('<NA>')).all()):
+            raise AssertionError("country codes changed in the Parquet round trip")
+
+        from_csv, csv_secs = _time(processor.process, pd.read_csv(csv_path))
+        from_parquet, parquet_secs = _time(processor.process, parquet_dir)
+        from_csv = from_csv.sort_values('q_id').reset_index(drop=True)
+        from_parquet = from_parquet.sort_values('q_id').reset_index(drop=True)[from_csv.columns]
+        for col in from_csv.columns:
+            if not from_csv[col].astype(object).fillna('<NA>').equals(
+                    from_parquet[col].astype(object).fillna('<NA>')):
+                raise AssertionError(f"{col}: process() differs between CSV and Parquet input")
+
+    print(f"  csv_to_parquet:      {convert_secs:8.2f}s  ({n_files} files)")
+    print(f"  process (CSV):       {csv_secs:8.2f}s  (incl. read_csv)")
+    print(f"  process (Parquet):   {parquet_secs:8.2f}s")
+    print(f"  null country codes preserved, rerun replaces the dataset, outputs identical")
+
+
+BENCHMARKS = {
+    'season': benchmark_season_engines,
+    'text': benchmark_text_features,
+    'labels': benchmark_label_layout,
+    'parquet': benchmark_parquet_roundtrip,
+}
+
+
+def main():
+    """Run the selected benchmarks"""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('benchmarks', nargs='*',
+                        help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument('--rows', type=int, default=10_000_000,
+                        help='Rows in the synthetic frame')
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    for name in args.benchmarks or list(BENCHMARKS):
+        print("=" * 80)
+        BENCHMARKS[name](n_rows=args.rows)
+
+
+if __name__ == "__main__":
+    main()